@@ -13,7 +13,7 @@ from django.http import HttpResponseRedirect
 
 from tendenci.core.base.http import Http403
 from tendenci.core.perms.decorators import is_enabled
-from tendenci.core.perms.utils import update_perms_and_save, get_notice_recipients, has_perm, get_query_filters, has_view_perm
+from tendenci.core.perms.utils import update_perms_and_save, get_notice_recipients, has_perm, get_query_filters, distinct_if_needed, has_view_perm
 from tendenci.core.site_settings.utils import get_setting
 from tendenci.core.event_logs.models import EventLog
 from tendenci.core.versions.models import Version
@@ -67,7 +67,7 @@ def search(request, template_name="articles/search.html"):
         articles = Article.objects.search(query, user=request.user)
     else:
         filters = get_query_filters(request.user, 'articles.view_article')
-        articles = Article.objects.filter(filters).distinct()
+        articles = distinct_if_needed(Article.objects.filter(filters))
         if not request.user.is_anonymous():
             articles = articles.select_related()
 
@@ -5,7 +5,6 @@ import csv
 import operator
 from hashlib import md5
 from sets import Set
-import subprocess
 import mimetypes
 
 from django.contrib.admin.views.decorators import staff_member_required
@@ -36,6 +35,7 @@ from tendenci.core.base.http import Http403
 from tendenci.core.perms.utils import has_perm
 from tendenci.core.base.decorators import password_required
 from tendenci.core.event_logs.models import EventLog
+from tendenci.core.background_jobs.utils import enqueue
 
 from tendenci.addons.corporate_memberships.models import (
                                             CorpMembershipApp,
@@ -1220,9 +1220,7 @@ def import_preview(request, mimport_id,
 #                                 args=[mimport.id]))
         else:
             if mimport.status == 'not_started':
-                subprocess.Popen(["python", "manage.py",
-                              "corp_membership_import_preprocess",
-                              str(mimport.pk)])
+                enqueue('corp_membership_import_preprocess', [mimport.pk])
 
             return render_to_response(template, {
                 'mimport': mimport,
@@ -1258,10 +1256,7 @@ def import_process(request, mimport_id):
         mimport.num_processed = 0
         mimport.save()
         # start the process
-        subprocess.Popen(["python", "manage.py",
-                          "import_corp_memberships",
-                          str(mimport.pk),
-                          str(request.user.pk)])
+        enqueue('import_corp_memberships', [mimport.pk, request.user.pk])
 
         # log an event
         EventLog.objects.log()
@@ -18,7 +18,7 @@ from tendenci.core.base.views import file_display
 from tendenci.core.categories.models import Category
 from tendenci.core.perms.decorators import is_enabled
 from tendenci.core.perms.utils import (get_notice_recipients,
-    has_perm, has_view_perm, get_query_filters, update_perms_and_save)
+    has_perm, has_view_perm, get_query_filters, distinct_if_needed, update_perms_and_save)
 from tendenci.core.event_logs.models import EventLog
 from tendenci.core.meta.models import Meta as MetaTags
 from tendenci.core.meta.forms import MetaForm
@@ -69,7 +69,7 @@ def search(request, template_name="directories/search.html"):
         directories = Directory.objects.search(query, user=request.user).order_by('headline_exact')
     else:
         filters = get_query_filters(request.user, 'directories.view_directory')
-        directories = Directory.objects.filter(filters).distinct()
+        directories = distinct_if_needed(Directory.objects.filter(filters))
         if not request.user.is_anonymous():
             directories = directories.select_related()
 
@@ -0,0 +1,114 @@
+"""
+Events of a calendar page by day.
+
+The month view used to run a permission-filtered event query for every
+day cell. CalendarEvents fetches the events overlapping the whole
+visible range in one query and buckets them by day, and the event_list
+tag reads the buckets when the view puts a CalendarEvents in the
+context. The buckets are cached per range, type and visibility class,
+and every cached calendar is dropped when an event or type is saved.
+"""
+import time
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+
+from tendenci.core.perms.utils import get_query_filters
+from tendenci.core.perms.visibility import get_visibility_class
+from tendenci.addons.events.models import Event
+
+# an event is on a day if it starts by 23:59 and hasn't ended before it
+DAY_BOUND = timedelta(hours=23, minutes=59)
+
+ORDERINGS = {
+    'single_day': lambda e: (not e.priority, e.start_dt.hour, e.start_dt.minute, e.pk),
+    None: lambda e: (not e.priority, e.start_dt, e.pk),
+}
+
+
+def get_version_key():
+    return '.'.join([settings.CACHE_PRE_KEY, 'events', 'calendar', 'version'])
+
+
+def bump_calendar_version():
+    """
+    Drop every cached calendar.
+    """
+    cache.set(get_version_key(), time.time())
+
+
+def get_cache_key(first_day, last_day, type_slug, visibility):
+    version = cache.get(get_version_key())
+    if version is None:
+        version = time.time()
+        cache.set(get_version_key(), version)
+    return '.'.join([settings.CACHE_PRE_KEY, 'events', 'calendar', str(version),
+                     first_day.isoformat(), last_day.isoformat(),
+                     type_slug or 'all', visibility])
+
+
+def get_events_by_day(user, first_day, last_day, type_slug=None):
+    """
+    Returns {date: [event, ...]} for the days from first_day to
+    last_day that have events the user can view, in no order.
+    Events on several days are in the list of each of them, and
+    events that don't occur on weekends are left out of those.
+    """
+    start_dt = datetime(first_day.year, first_day.month, first_day.day)
+    end_dt = datetime(last_day.year, last_day.month, last_day.day) + DAY_BOUND
+
+    filters = get_query_filters(user, 'events.view_event')
+    events = Event.objects.filter(filters).filter(
+        start_dt__lte=end_dt, end_dt__gte=start_dt).select_related('type')
+    if type_slug:
+        events = events.filter(type__slug=type_slug)
+
+    days = {}
+    seen = set()
+    for event in events:
+        # the permission joins can repeat an event
+        if event.pk in seen:
+            continue
+        seen.add(event.pk)
+
+        day = max(first_day, event.start_dt.date())
+        last = min(last_day, event.end_dt.date())
+        while day <= last:
+            day_start = datetime(day.year, day.month, day.day)
+            if event.start_dt <= day_start + DAY_BOUND and \
+                    (event.on_weekend or day.weekday() < 5):
+                days.setdefault(day, []).append(event)
+            day += timedelta(days=1)
+    return days
+
+
+class CalendarEvents(object):
+    """
+    The events of the days first_day to last_day for the user:
+
+        calendar_events = CalendarEvents(request.user, first_day, last_day, type)
+        calendar_events.for_day(day)
+    """
+    def __init__(self, user, first_day, last_day, type_slug=None):
+        self.first_day = first_day
+        self.last_day = last_day
+        self.type_slug = type_slug or None
+
+        key = get_cache_key(first_day, last_day, self.type_slug,
+                            get_visibility_class(user))
+        self.days = cache.get(key)
+        if self.days is None:
+            self.days = get_events_by_day(user, first_day, last_day, self.type_slug)
+            cache.set(key, self.days, getattr(settings, 'EVENTS_CALENDAR_CACHE_TIMEOUT', 600))
+
+    def covers(self, day, type_slug=None, ordering=None):
+        """
+        Whether for_day() can answer an event_list tag for this day.
+        """
+        return (ordering in ORDERINGS and (type_slug or None) == self.type_slug
+                and self.first_day <= day <= self.last_day)
+
+    def for_day(self, day, ordering='single_day'):
+        events = self.days.get(day, [])
+        return sorted(events, key=ORDERINGS[ordering])
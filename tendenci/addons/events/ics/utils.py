@@ -1,8 +1,8 @@
 import re
-import subprocess
 import os
 from tendenci.settings import MEDIA_ROOT
 from tendenci.core.site_settings.utils import get_setting
+from tendenci.core.background_jobs.utils import enqueue
 from tendenci.addons.events.ics.models import ICS
 
 def create_ics(user):
@@ -50,5 +50,5 @@ def run_precreate_ics(app_label, model_name, user):
         model_name=model_name,
         user=user
     )
-    subprocess.Popen(['python', 'manage.py', 'run_precreate_ics', unicode(ics.pk)])
+    enqueue('run_precreate_ics', [ics.pk])
     return ics.pk
@@ -10,18 +10,21 @@ class Command(BaseCommand):
     Usage: ./manage.py send_event_reminders --verbosity=2
     """
     def send_reminders(self, event, registrants, verbosity=0):
+        from tendenci.core.emails.mailer import BatchMailer
+
         email = event.email
 
         count = 0
-        for registrant in registrants:
-            if registrant.email:
-                if verbosity == '2':
-                    print 'Sending reminder email to %s %s' % (
-                                registrant.first_name,
-                                registrant.last_name)
-                email.recipient = registrant.email
-                email.send()
-                count += 1
+        with BatchMailer() as mailer:
+            for registrant in registrants:
+                if registrant.email:
+                    if verbosity == '2':
+                        print 'Sending reminder email to %s %s' % (
+                                    registrant.first_name,
+                                    registrant.last_name)
+                    email.recipient = registrant.email
+                    mailer.add(email.message())
+                    count += 1
 
         if count > 0:
             # notify event organizer that reminders have been
@@ -13,6 +13,7 @@ from django.core.exceptions import ObjectDoesNotExist
 from django.db.models.fields import AutoField
 from django.contrib.contenttypes import generic
 from django.db.models import Q
+from django.db.models.signals import post_save, post_delete
 
 from tagging.fields import TagField
 from timezones.fields import TimeZoneField
@@ -1409,4 +1410,13 @@ class RegAddonOption(models.Model):
         
     def __unicode__(self):
         return "%s: %s - %s" % (self.regaddon.pk, self.option.title, self.selected_option)
-    
+
+
+def calendar_changed(sender, **kwargs):
+    from tendenci.addons.events.calendar_events import bump_calendar_version
+    bump_calendar_version()
+
+post_save.connect(calendar_changed, sender=Event, weak=False)
+post_delete.connect(calendar_changed, sender=Event, weak=False)
+post_save.connect(calendar_changed, sender=Type, weak=False)
+post_delete.connect(calendar_changed, sender=Type, weak=False)
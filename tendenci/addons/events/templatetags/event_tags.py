@@ -134,6 +134,15 @@ class EventListNode(Node):
         day = self.day.resolve(context)
         type_slug = self.type_slug.resolve(context)
 
+        # the month view fetches the events of all its days at once
+        calendar_events = context.get('calendar_events')
+        if calendar_events is not None:
+            if isinstance(day, datetime):
+                day = day.date()
+            if calendar_events.covers(day, type_slug, self.ordering):
+                context[self.context_var] = calendar_events.for_day(day, self.ordering)
+                return ''
+
         types = Type.objects.filter(slug=type_slug)
 
         type = None
@@ -21,3 +21,42 @@ Another way to test that 1 + 1 is equal to 2.
 True
 """}
 
+
+
+class ConditionalGetTest(TestCase):
+    """
+    The iCal feed's validators, through GZipMiddleware
+    as in MIDDLEWARE_CLASSES.
+    """
+    def get_response(self, request, versions):
+        from django.http import HttpResponse
+        from django.middleware.gzip import GZipMiddleware
+        from tendenci.core.base.http import get_validators, not_modified
+
+        validators = get_validators(versions)
+        response = not_modified(request, validators)
+        if response is None:
+            response = HttpResponse("BEGIN:VCALENDAR\n%sEND:VCALENDAR\n" % (
+                "BEGIN:VEVENT\nEND:VEVENT\n" * 20))
+            for header, value in validators.items():
+                response[header] = value
+        return GZipMiddleware().process_response(request, response)
+
+    def test_revalidate_gzipped(self):
+        from django.test.client import RequestFactory
+
+        factory = RequestFactory()
+        versions = ('http://example.com', [(1, '2013-01-01 10:00')])
+        response = self.get_response(factory.get('/events/ics/',
+            HTTP_ACCEPT_ENCODING='gzip'), versions)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertTrue(response['ETag'].endswith(';gzip"'))
+        self.assertTrue(response.content)
+
+        request = factory.get('/events/ics/', HTTP_ACCEPT_ENCODING='gzip',
+                              HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(self.get_response(request, versions).status_code, 304)
+
+        # an event leaving the feed changes it
+        self.assertEqual(self.get_response(request, (versions[0], [])).status_code, 200)
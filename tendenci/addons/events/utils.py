@@ -4,6 +4,7 @@
 import ast
 import re
 import os.path
+from hashlib import md5
 from datetime import datetime, timedelta
 from datetime import date
 from decimal import Decimal
@@ -204,124 +205,143 @@ def render_registrant_excel(sheet, rows_list, balance_index, styles, start=0):
             sheet.write(row+start, col, val, style=style)
 
 
-def get_ievent(request, d, event_id):
+def build_vevent(event, d, organizers=None):
+    """
+    Returns the VEVENT block of the event. organizers and the
+    event's speakers are looked up unless they've been prefetched.
+    """
     from django.conf import settings
     from timezones.utils import adjust_datetime_to_timezone
-    from tendenci.addons.events.models import Event
 
     site_url = get_setting('site', 'global', 'siteurl')
 
-    event = Event.objects.get(id=event_id)
-    e_str = "BEGIN:VEVENT\n"
+    lines = ["BEGIN:VEVENT\n"]
 
     # organizer
-    organizers = event.organizer_set.all()
+    if organizers is None:
+        organizers = event.organizer_set.all()
     if organizers:
         organizer_name_list = [organizer.name for organizer in organizers]
-        e_str += "ORGANIZER:%s\n" % (', '.join(organizer_name_list))
+        lines.append("ORGANIZER:%s\n" % (', '.join(organizer_name_list)))
 
     # date time
     if event.start_dt:
         start_dt = adjust_datetime_to_timezone(event.start_dt, settings.TIME_ZONE, 'GMT')
         start_dt = start_dt.strftime('%Y%m%dT%H%M%SZ')
-        e_str += "DTSTART:%s\n" % (start_dt)
+        lines.append("DTSTART:%s\n" % (start_dt))
     if event.end_dt:
         end_dt = adjust_datetime_to_timezone(event.end_dt, settings.TIME_ZONE, 'GMT')
         end_dt = end_dt.strftime('%Y%m%dT%H%M%SZ')
-        e_str += "DTEND:%s\n" % (end_dt)
+        lines.append("DTEND:%s\n" % (end_dt))
 
     # location
     if event.place:
-        e_str += "LOCATION:%s\n" % (event.place.name)
+        lines.append("LOCATION:%s\n" % (event.place.name))
 
-    e_str += "TRANSP:OPAQUE\n"
-    e_str += "SEQUENCE:0\n"
+    lines.append("TRANSP:OPAQUE\n")
+    lines.append("SEQUENCE:0\n")
 
     # uid
-    e_str += "UID:uid%d@%s\n" % (event.pk, d['domain_name'])
+    lines.append("UID:uid%d@%s\n" % (event.pk, d['domain_name']))
 
     event_url = "%s%s" % (site_url, reverse('event', args=[event.pk]))
     d['event_url'] = event_url
 
     # text description
-    e_str += "DESCRIPTION:%s\n" % (build_ical_text(event,d))
+    lines.append("DESCRIPTION:%s\n" % (build_ical_text(event,d)))
     #  html description
-    e_str += "X-ALT-DESC;FMTTYPE=text/html:%s\n" % (build_ical_html(event,d))
+    lines.append("X-ALT-DESC;FMTTYPE=text/html:%s\n" % (build_ical_html(event,d)))
 
-    e_str += "SUMMARY:%s\n" % strip_tags(event.title)
-    e_str += "PRIORITY:5\n"
-    e_str += "CLASS:PUBLIC\n"
-    e_str += "BEGIN:VALARM\n"
-    e_str += "TRIGGER:-PT30M\n"
-    e_str += "ACTION:DISPLAY\n"
-    e_str += "DESCRIPTION:Reminder\n"
-    e_str += "END:VALARM\n"
-    e_str += "END:VEVENT\n"
+    lines.append("SUMMARY:%s\n" % strip_tags(event.title))
+    lines.append("PRIORITY:5\n")
+    lines.append("CLASS:PUBLIC\n")
+    lines.append("BEGIN:VALARM\n")
+    lines.append("TRIGGER:-PT30M\n")
+    lines.append("ACTION:DISPLAY\n")
+    lines.append("DESCRIPTION:Reminder\n")
+    lines.append("END:VALARM\n")
+    lines.append("END:VEVENT\n")
 
-    return e_str
+    return u''.join(lines)
 
 
-def get_vevents(user, d):
-    from django.conf import settings
-    from timezones.utils import adjust_datetime_to_timezone
+def get_ievent(request, d, event_id):
     from tendenci.addons.events.models import Event
 
-    site_url = get_setting('site', 'global', 'siteurl')
+    event = Event.objects.get(id=event_id)
+    return build_vevent(event, d)
+
+
+def get_vevent_cache_key(event_id, update_dt, d):
+    """
+    A VEVENT changes with its event, so the
+    cached block is keyed by the event's update_dt.
+    """
+    from django.conf import settings
+    site = md5((d.get('site_url', '') + d['domain_name']).encode('utf-8')).hexdigest()[:8]
+    return '.'.join([settings.CACHE_PRE_KEY, 'events', 'vevent', str(event_id),
+                     update_dt.strftime('%Y%m%d%H%M%S%f'), site])
+
+
+def get_upcoming_vevent_versions(user):
+    """
+    Returns [(event id, update_dt), ...] of the upcoming events
+    the user can view, in the order of the feed.
+    """
+    from tendenci.addons.events.models import Event
 
-    e_str = ""
     # load only upcoming events by default
     filters = get_query_filters(user, 'events.view_event')
     events = Event.objects.filter(filters).filter(start_dt__gte=datetime.now())
-    events = events.order_by('start_dt')
+    events = events.order_by('start_dt', 'pk').values_list('pk', 'update_dt')
 
-    for event in events:
-        e_str += "BEGIN:VEVENT\n"
+    # the permission joins can repeat an event
+    versions, seen = [], set()
+    for event_id, update_dt in events:
+        if event_id not in seen:
+            seen.add(event_id)
+            versions.append((event_id, update_dt))
+    return versions
 
-        # organizer
-        organizers = event.organizer_set.all()
-        if organizers:
-            organizer_name_list = [organizer.name for organizer in organizers]
-            e_str += "ORGANIZER:%s\n" % (', '.join(organizer_name_list))
-
-        # date time
-        if event.start_dt:
-            start_dt = adjust_datetime_to_timezone(event.start_dt, settings.TIME_ZONE, 'GMT')
-            start_dt = start_dt.strftime('%Y%m%dT%H%M%SZ')
-            e_str += "DTSTART:%s\n" % (start_dt)
-        if event.end_dt:
-            end_dt = adjust_datetime_to_timezone(event.end_dt, settings.TIME_ZONE, 'GMT')
-            end_dt = end_dt.strftime('%Y%m%dT%H%M%SZ')
-            e_str += "DTEND:%s\n" % (end_dt)
 
-        # location
-        if event.place:
-            e_str += "LOCATION:%s\n" % (event.place.name)
-
-        e_str += "TRANSP:OPAQUE\n"
-        e_str += "SEQUENCE:0\n"
-
-        # uid
-        e_str += "UID:uid%d@%s\n" % (event.pk, d['domain_name'])
-
-        event_url = "%s%s" % (site_url, reverse('event', args=[event.pk]))
-        d['event_url'] = event_url
-
-        # text description
-        e_str += "DESCRIPTION:%s\n" % (build_ical_text(event,d))
-        #  html description
-        e_str += "X-ALT-DESC;FMTTYPE=text/html:%s\n" % (build_ical_html(event,d))
-
-        e_str += "SUMMARY:%s\n" % strip_tags(event.title)
-        e_str += "PRIORITY:5\n"
-        e_str += "CLASS:PUBLIC\n"
-        e_str += "BEGIN:VALARM\n"
-        e_str += "TRIGGER:-PT30M\n"
-        e_str += "ACTION:DISPLAY\n"
-        e_str += "DESCRIPTION:Reminder\n"
-        e_str += "END:VALARM\n"
-        e_str += "END:VEVENT\n"
-
-    return e_str
+def iter_vevents(versions, d, chunk_size=100):
+    """
+    Yields the VEVENT blocks of the events in versions, as returned by
+    get_upcoming_vevent_versions(). Cached blocks are reused and the
+    others are built from events fetched a chunk at a time with their
+    places, organizers and speakers.
+    """
+    from django.conf import settings
+    from django.core.cache import cache
+    from tendenci.addons.events.models import Event
+
+    timeout = getattr(settings, 'EVENTS_ICAL_CACHE_TIMEOUT', 60 * 60 * 24)
+    for i in range(0, len(versions), chunk_size):
+        chunk = versions[i:i + chunk_size]
+        keys = dict((event_id, get_vevent_cache_key(event_id, update_dt, d))
+                    for event_id, update_dt in chunk)
+        cached = cache.get_many(keys.values())
+
+        missing = [event_id for event_id, update_dt in chunk
+                   if keys[event_id] not in cached]
+        if missing:
+            events = Event.objects.filter(pk__in=missing).select_related(
+                'place').prefetch_related('organizer_set', 'speaker_set')
+            built = {}
+            for event in events:
+                built[keys[event.pk]] = build_vevent(event, d,
+                    organizers=event.organizer_set.all())
+            cache.set_many(built, timeout)
+            cached.update(built)
+
+        for event_id, update_dt in chunk:
+            # events deleted since the versions were read are skipped
+            if keys[event_id] in cached:
+                yield cached[keys[event_id]]
+
+
+def get_vevents(user, d):
+    return u''.join(iter_vevents(get_upcoming_vevent_versions(user), d))
 
 
 def build_ical_text(event, d):
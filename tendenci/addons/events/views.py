@@ -9,7 +9,6 @@ import calendar
 import itertools
 import cPickle
 import threading
-import subprocess
 
 from datetime import datetime
 from datetime import date, timedelta
@@ -37,12 +36,13 @@ from django.views.decorators.csrf import csrf_exempt
 from django.utils import simplejson as json
 from django.db import connection
 
-from tendenci.core.base.http import Http403
+from tendenci.core.base.http import Http403, get_validators, not_modified
 from tendenci.core.site_settings.utils import get_setting
 from tendenci.core.perms.decorators import is_enabled
 from tendenci.core.perms.utils import (has_perm, get_notice_recipients,
-    get_query_filters, update_perms_and_save, has_view_perm)
+    get_query_filters, distinct_if_needed, update_perms_and_save, has_view_perm)
 from tendenci.core.event_logs.models import EventLog
+from tendenci.core.background_jobs.utils import enqueue
 from tendenci.core.meta.models import Meta as MetaTags
 from tendenci.core.meta.forms import MetaForm
 from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
@@ -79,6 +79,7 @@ from tendenci.addons.events.utils import (email_registrants,
     copy_event, email_admins, get_active_days, get_ACRF_queryset,
     get_custom_registrants_initials, render_registrant_excel,
     event_import_process, check_month)
+from tendenci.addons.events.calendar_events import CalendarEvents
 from tendenci.addons.events.addons.forms import RegAddonForm
 from tendenci.addons.events.addons.formsets import RegAddonBaseFormSet
 from tendenci.addons.events.addons.utils import get_available_addons
@@ -252,7 +253,7 @@ def search(request, redirect=False, template_name="events/search.html"):
         events = events.filter(start_dt__gte=start_dt)
     else:
         filters = get_query_filters(request.user, 'events.view_event')
-        events = Event.objects.filter(filters).distinct()
+        events = distinct_if_needed(Event.objects.filter(filters))
         if event_type:
             events = events.filter(type__slug=event_type,
                 end_dt__gte=start_dt)
@@ -283,7 +284,8 @@ def search(request, redirect=False, template_name="events/search.html"):
 def icalendar(request):
     import os
     from tendenci.settings import MEDIA_ROOT
-    from tendenci.addons.events.utils import get_vevents
+    from tendenci.addons.events.utils import (get_upcoming_vevent_versions,
+        iter_vevents)
     p = re.compile(r'http(s)?://(www.)?([^/]+)')
     d = {}
     file_name = ''
@@ -310,17 +312,30 @@ def icalendar(request):
             ics = open(file_path, 'r+')
             ics_str = ics.read()
             ics.close()
-    if not ics_str:
+    if ics_str:
+        response = HttpResponse(ics_str)
+    else:
+        # calendar clients poll the feed, it only changes
+        # when the list of events or one of them does
+        versions = get_upcoming_vevent_versions(request.user)
+        validators = get_validators((d['site_url'], versions))
+        response = not_modified(request, validators)
+        if response is not None:
+            return response
+
         ics_str = "BEGIN:VCALENDAR\n"
         ics_str += "PRODID:-//Schipul Technologies//Schipul Codebase 5.0 MIMEDIR//EN\n"
         ics_str += "VERSION:2.0\n"
         ics_str += "METHOD:PUBLISH\n"
+        # function iter_vevents in events.utils
+        ics_str += u''.join(iter_vevents(versions, d)).encode('utf-8')
+        ics_str += "END:VCALENDAR\n"
 
-        # function get_vevents in events.utils
-        ics_str += get_vevents(request.user, d)
+        # not an iterator, GZipMiddleware would consume it
+        response = HttpResponse(ics_str)
+        for header, value in validators.items():
+            response[header] = value
 
-        ics_str += "END:VCALENDAR\n"
-    response = HttpResponse(ics_str)
     response['Content-Type'] = 'text/calendar'
     if d['domain_name']:
         file_name = '%s.ics' % (d['domain_name'])
@@ -946,7 +961,7 @@ def delete(request, id, template_name="events/delete.html"):
     if has_perm(request.user, 'events.delete_event'):
         if request.method == "POST":
 
-            eventlog = EventLog.objects.log(instance=event)
+            eventlog = EventLog.objects.log(instance=event, immediate=True)
             # send email to admins
             recipients = get_notice_recipients('site', 'global', 'allnoticerecipients')
             if recipients and notification:
@@ -2058,6 +2073,9 @@ def month_view(request, year=None, month=None, type=None, template_name='events/
     weekdays = calendar.weekheader(10).split()
     cal = Calendar(calendar.SUNDAY).monthdatescalendar(year, month)
 
+    # the events of every day on the page in one query
+    calendar_events = CalendarEvents(request.user, cal[0][0], cal[-1][-1], type)
+
     types = Type.objects.all().order_by('name')
 
     EventLog.objects.log()
@@ -2073,6 +2091,7 @@ def month_view(request, year=None, month=None, type=None, template_name='events/
         'types':types,
         'type':type,
         'date': date,
+        'calendar_events': calendar_events,
         },
         context_instance=RequestContext(request))
 
@@ -3473,7 +3492,7 @@ def import_process(request, import_id,
 
     import_i = get_object_or_404(Import, id=import_id)
 
-    subprocess.Popen(['python', 'manage.py', 'import_events', str(import_id)])
+    enqueue('import_events', [import_id])
 
     return render_to_response(template_name, {
         'total': import_i.total_created + import_i.total_invalid,
@@ -11,7 +11,7 @@ from tendenci.core.event_logs.models import EventLog
 from tendenci.core.site_settings.utils import get_setting
 from tendenci.core.exports.utils import run_export_task
 from tendenci.core.perms.decorators import is_enabled
-from tendenci.core.perms.utils import has_perm, update_perms_and_save, get_notice_recipients, has_view_perm, get_query_filters
+from tendenci.core.perms.utils import has_perm, update_perms_and_save, get_notice_recipients, has_view_perm, get_query_filters, distinct_if_needed
 from tendenci.addons.help_files.models import HelpFile_Topics, Topic, HelpFile, HelpFileMigration, Request
 from tendenci.addons.help_files.forms import RequestForm, HelpFileForm
 from tendenci.apps.notifications import models as notification
@@ -29,7 +29,7 @@ def index(request, template_name="help_files/index.html"):
     for tp in HelpFile_Topics.objects.select_related('helpfile', 'topic').all():
         byhelpfile.setdefault(tp.helpfile.id, []).append(tp.topic)
     # Use stored lists
-    for hf in HelpFile.objects.filter(filters).distinct():
+    for hf in distinct_if_needed(HelpFile.objects.filter(filters)):
         if byhelpfile.get(hf.id, ''):
             for topic in byhelpfile[hf.id]:
                 topic_pks.append(topic.pk)
@@ -39,9 +39,9 @@ def index(request, template_name="help_files/index.html"):
     topics = Topic.objects.filter(pk__in=topic_pks)
     m = len(topics) / 2
     topics = topics[:m], topics[m:] # two columns
-    most_viewed = HelpFile.objects.filter(filters).order_by('-view_totals').distinct()[:5]
-    featured = HelpFile.objects.filter(filters).filter(is_featured=True).distinct()[:5]
-    faq = HelpFile.objects.filter(filters).filter(is_faq=True).distinct()[:3]
+    most_viewed = distinct_if_needed(HelpFile.objects.filter(filters)).order_by('-view_totals')[:5]
+    featured = distinct_if_needed(HelpFile.objects.filter(filters)).filter(is_featured=True)[:5]
+    faq = distinct_if_needed(HelpFile.objects.filter(filters)).filter(is_faq=True)[:3]
 
     EventLog.objects.log()
 
@@ -58,7 +58,7 @@ def search(request, template_name="help_files/search.html"):
         help_files = HelpFile.objects.search(query, user=request.user)
     else:
         filters = get_query_filters(request.user, 'help_files.view_helpfile')
-        help_files = HelpFile.objects.filter(filters).distinct()
+        help_files = distinct_if_needed(HelpFile.objects.filter(filters))
         if not request.user.is_anonymous():
             help_files = help_files.select_related()
 
@@ -75,7 +75,7 @@ def topic(request, id, template_name="help_files/topic.html"):
     query = None
 
     filters = get_query_filters(request.user, 'help_files.view_helpfile')
-    help_files = HelpFile.objects.filter(filters).filter(topics__in=[topic.pk]).distinct()
+    help_files = distinct_if_needed(HelpFile.objects.filter(filters).filter(topics__in=[topic.pk]))
     if not request.user.is_anonymous():
         help_files = help_files.select_related()
 
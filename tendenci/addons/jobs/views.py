@@ -21,7 +21,7 @@ from tendenci.core.meta.forms import MetaForm
 from tendenci.core.site_settings.utils import get_setting
 from tendenci.core.perms.decorators import is_enabled
 from tendenci.core.perms.utils import (get_notice_recipients, update_perms_and_save,
-    has_perm, get_query_filters, has_view_perm)
+    has_perm, get_query_filters, distinct_if_needed, has_view_perm)
 from tendenci.core.categories.forms import CategoryForm, CategoryForm2
 from tendenci.core.categories.models import Category
 from tendenci.core.theme.shortcuts import themed_response as render_to_response
@@ -67,7 +67,7 @@ def search(request, template_name="jobs/search.html"):
         jobs = Job.objects.search(query, user=request.user)
     else:
         filters = get_query_filters(request.user, 'jobs.view_job')
-        jobs = Job.objects.filter(filters).distinct()
+        jobs = distinct_if_needed(Job.objects.filter(filters))
         if not request.user.is_anonymous():
             jobs = jobs.select_related()
 
@@ -113,7 +113,7 @@ def my_jobs(request, template_name = "jobs/my_jobs.html"):
             jobs = Job.objects.search(query, user=request.user)
         else:
             filters = get_query_filters(request.user, 'jobs.view_job')
-            jobs = Job.objects.filter(filters).distinct()
+            jobs = distinct_if_needed(Job.objects.filter(filters))
             jobs = jobs.select_related()
         jobs = jobs.order_by('status_detail', 'list_type', '-post_dt')
         jobs = jobs.filter(creator_username=request.user.username)
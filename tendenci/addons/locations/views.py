@@ -15,7 +15,7 @@ from tendenci.core.site_settings.utils import get_setting
 from tendenci.core.event_logs.models import EventLog
 from tendenci.core.perms.decorators import is_enabled
 from tendenci.core.perms.utils import (has_perm, has_view_perm,
-    update_perms_and_save, get_query_filters)
+    update_perms_and_save, get_query_filters, distinct_if_needed)
 from tendenci.core.perms.decorators import admin_required
 from tendenci.core.theme.shortcuts import themed_response as render_to_response
 from tendenci.core.exports.utils import run_export_task
@@ -55,7 +55,7 @@ def search(request, template_name="locations/search.html"):
         locations = Location.objects.search(query, user=request.user)
     else:
         filters = get_query_filters(request.user, 'locations.view_location')
-        locations = Location.objects.filter(filters).distinct()
+        locations = distinct_if_needed(Location.objects.filter(filters))
         if not request.user.is_anonymous():
             locations = locations.select_related()
 
@@ -81,7 +81,7 @@ def nearest(request, template_name="locations/nearest.html"):
     if query:
         lat, lng = get_coordinates(address=query)
 
-    all_locations = Location.objects.filter(filters).distinct()
+    all_locations = distinct_if_needed(Location.objects.filter(filters))
     if not request.user.is_anonymous():
         all_locations = all_locations.select_related()
 
@@ -0,0 +1,112 @@
+from optparse import make_option
+from timeit import default_timer
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    """
+    Export a synthetic set of memberships with process_export
+    and report the time and number of queries.
+
+    Users, profiles and memberships are created in bulk, and
+    everything written is rolled back and the files removed.
+
+    Usage: ./manage.py benchmark_membership_export --members 100000
+    """
+    help = 'Benchmark the membership csv export on a synthetic dataset'
+
+    option_list = BaseCommand.option_list + (
+        make_option('--members',
+            action='store',
+            dest='members',
+            type='int',
+            default=100000,
+            help='Number of memberships to create'),
+        make_option('--export_fields',
+            action='store',
+            dest='export_fields',
+            default='all_fields',
+            help='Either main_fields or all_fields to export'),
+        )
+
+    def handle(self, *args, **options):
+        from datetime import datetime, timedelta
+        from django.conf import settings
+        from django.contrib.auth.models import User
+        from django.core.files.storage import default_storage
+        from django.db import connection, transaction
+        from tendenci.addons.memberships.models import MembershipDefault, MembershipType
+        from tendenci.addons.memberships.utils import process_export
+        from tendenci.apps.profiles.models import Profile
+        from tendenci.apps.user_groups.models import Group
+
+        num_members = options['members']
+        export_fields = options['export_fields']
+        identifier = 'benchmark'
+        batch_size = 1000
+
+        original_debug = settings.DEBUG
+        transaction.enter_transaction_management()
+        transaction.managed(True)
+        try:
+            group = Group.objects.create(name='benchmark export group',
+                                         slug='benchmark-export-group',
+                                         label='benchmark export group')
+            membership_type = MembershipType.objects.create(
+                name='benchmark export type',
+                description='benchmark export type',
+                group=group)
+
+            now = datetime.now()
+            for offset in range(0, num_members, batch_size):
+                count = min(batch_size, num_members - offset)
+                User.objects.bulk_create([
+                    User(username='benchmark_export_%d' % (offset + i),
+                         first_name='First %d' % (offset + i),
+                         last_name='Last',
+                         email='benchmark_export_%d@example.com' % (offset + i))
+                    for i in range(count)])
+                users = User.objects.filter(
+                    username__startswith='benchmark_export_').order_by('-pk')[:count]
+                users = list(users)
+                Profile.objects.bulk_create([
+                    Profile(user=user,
+                            member_number=str(user.pk),
+                            creator_username=user.username,
+                            owner_username=user.username)
+                    for user in users])
+                MembershipDefault.objects.bulk_create([
+                    MembershipDefault(user=user,
+                                      membership_type=membership_type,
+                                      member_number=str(user.pk),
+                                      join_dt=now - timedelta(days=i % 700),
+                                      expire_dt=now + timedelta(days=i % 365),
+                                      status=True,
+                                      status_detail='active',
+                                      creator_username=user.username,
+                                      owner_username=user.username)
+                    for i, user in enumerate(users)])
+
+            settings.DEBUG = True
+            connection.queries = []
+            start = default_timer()
+            process_export(export_fields=export_fields,
+                           export_type='all',
+                           export_status_detail='active',
+                           identifier=identifier,
+                           user_id=0)
+            elapsed = default_timer() - start
+            num_queries = len(connection.queries)
+        finally:
+            settings.DEBUG = original_debug
+            transaction.rollback()
+            transaction.leave_transaction_management()
+            for name in ('export/memberships/%s_0.csv' % identifier,
+                         'export/memberships/%s_0_temp.csv' % identifier):
+                if default_storage.exists(name):
+                    default_storage.delete(name)
+
+        print "memberships: %d, fields: %s" % (num_members, export_fields)
+        print "export time: %.2f s (%.0f rows/s)" % (elapsed, num_members / elapsed)
+        print "queries: %d" % num_queries
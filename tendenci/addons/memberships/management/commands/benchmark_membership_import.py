@@ -0,0 +1,103 @@
+from optparse import make_option
+from timeit import default_timer
+
+from django.core.management.base import BaseCommand, CommandError
+
+EMAIL_DOMAIN = 'import-benchmark.example.com'
+
+
+class Command(BaseCommand):
+    """
+    Import a generated membership csv and report the time and number
+    of queries of the import_membership_defaults step.
+
+    Half of the rows match users that already exist, by email, the
+    other half are new. The csv uses the first membership type, so
+    the site needs one. The users, memberships and the import created
+    are deleted at the end.
+
+    Usage: ./manage.py benchmark_membership_import --rows 20000 [user_id]
+    """
+    help = 'Benchmark the membership csv import on a generated file'
+
+    option_list = BaseCommand.option_list + (
+        make_option('--rows',
+            action='store',
+            dest='rows',
+            type='int',
+            default=20000,
+            help='Number of csv rows to import'),
+        )
+
+    def handle(self, *args, **options):
+        from StringIO import StringIO
+        from django.conf import settings
+        from django.contrib.auth.models import User
+        from django.core.files.base import ContentFile
+        from django.core.files.storage import default_storage
+        from django.core.management import call_command
+        from django.db import connection
+        from tendenci.addons.memberships.models import MembershipImport, MembershipType
+        from tendenci.apps.profiles.models import Profile
+        from tendenci.core.base.utils import UnicodeWriter
+
+        num_rows = options['rows']
+        request_user = User.objects.get(pk=args[0] if args else 1)
+
+        [membership_type] = MembershipType.objects.order_by('id')[:1] or [None]
+        if not membership_type:
+            raise CommandError('Please add a membership type first.')
+
+        # existing users for the first half of the rows
+        existing = num_rows / 2
+        for offset in range(0, existing, 1000):
+            count = min(1000, existing - offset)
+            User.objects.bulk_create([
+                User(username='import_benchmark_%d' % (offset + i),
+                     email='member%d@%s' % (offset + i, EMAIL_DOMAIN))
+                for i in range(count)])
+        users = User.objects.filter(email__endswith='@%s' % EMAIL_DOMAIN)
+        Profile.objects.bulk_create([
+            Profile(user=user,
+                    creator_username=user.username,
+                    owner_username=user.username)
+            for user in users.iterator()])
+
+        output = StringIO()
+        writer = UnicodeWriter(output, encoding='utf-8')
+        writer.writerow(['first_name', 'last_name', 'email',
+                         'member_number', 'membership_type'])
+        for i in range(num_rows):
+            writer.writerow([u'First%d' % i, u'Last', u'member%d@%s' % (i, EMAIL_DOMAIN),
+                             u'', membership_type.name])
+
+        mimport = MembershipImport(key='email', creator=request_user)
+        mimport.upload_file.save('import_benchmark.csv',
+                                 ContentFile(output.getvalue()), save=False)
+        mimport.total_rows = num_rows
+        mimport.save()
+
+        original_debug = settings.DEBUG
+        try:
+            call_command('membership_import_preprocess', mimport.pk)
+
+            settings.DEBUG = True
+            connection.queries = []
+            start = default_timer()
+            call_command('import_membership_defaults', mimport.pk, request_user.pk)
+            elapsed = default_timer() - start
+            num_queries = len(connection.queries)
+            summary = MembershipImport.objects.get(pk=mimport.pk).summary
+        finally:
+            settings.DEBUG = original_debug
+            mimport = MembershipImport.objects.get(pk=mimport.pk)
+            for f in (mimport.upload_file, mimport.recap_file):
+                if f and default_storage.exists(f.name):
+                    default_storage.delete(f.name)
+            mimport.delete()
+            User.objects.filter(email__endswith='@%s' % EMAIL_DOMAIN).delete()
+
+        print "rows: %d (%d existing users)" % (num_rows, existing)
+        print "import time: %.2f s (%.0f rows/s)" % (elapsed, num_rows / elapsed)
+        print "queries: %d (%.1f per row)" % (num_queries, num_queries * 1.0 / num_rows)
+        print "summary: %s" % summary
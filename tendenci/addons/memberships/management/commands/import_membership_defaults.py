@@ -1,9 +1,12 @@
 from datetime import datetime
 
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 from django.contrib.auth.models import User
 
+CHUNK_SIZE = 200
+
 
 class Command(BaseCommand):
     """
@@ -20,29 +23,44 @@ class Command(BaseCommand):
         from tendenci.addons.memberships.models import MembershipImport
         from tendenci.addons.memberships.models import MembershipImportData
         from tendenci.addons.memberships.utils import ImportMembDefault
+        from tendenci.core.background_jobs.utils import set_progress
 
         mimport = get_object_or_404(MembershipImport, pk=args[0])
         request_user = User.objects.get(pk=args[1])
         data_list = MembershipImportData.objects.filter(mimport=mimport).order_by('pk')
         imd = ImportMembDefault(request_user, mimport, dry_run=False)
 
-        for idata in data_list:
-            try:
-                imd.process_default_membership(idata)
-            except Exception, e:
-                print e
-
-            mimport.num_processed += 1
-
-            # save the status -----------------------------------------------
-            summary = 'insert:%d,update:%d,update_insert:%d,invalid:%d' % (
-                imd.summary_d['insert'],
-                imd.summary_d['update'],
-                imd.summary_d['update_insert'],
-                imd.summary_d['invalid'],
-            )
-            mimport.summary = summary
-            mimport.save()
+        # rows are read, resolved and committed a chunk at a time
+        last_pk = 0
+        while True:
+            chunk = list(data_list.filter(pk__gt=last_pk)[:CHUNK_SIZE])
+            if not chunk:
+                break
+            last_pk = chunk[-1].pk
+            imd.prepare_chunk(chunk)
+
+            with transaction.commit_on_success():
+                for idata in chunk:
+                    sid = transaction.savepoint()
+                    try:
+                        imd.process_default_membership(idata)
+                        transaction.savepoint_commit(sid)
+                    except Exception, e:
+                        transaction.savepoint_rollback(sid)
+                        print e
+
+                    mimport.num_processed += 1
+
+                # save the status -------------------------------------------
+                summary = 'insert:%d,update:%d,update_insert:%d,invalid:%d' % (
+                    imd.summary_d['insert'],
+                    imd.summary_d['update'],
+                    imd.summary_d['update_insert'],
+                    imd.summary_d['invalid'],
+                )
+                mimport.summary = summary
+                mimport.save()
+            set_progress(mimport.num_processed, mimport.total_rows)
 
         mimport.status = 'completed'
         mimport.complete_dt = datetime.now()
@@ -65,13 +65,19 @@ class Command(BaseCommand):
                 header_line, data_list = memb_import_parse_csv(mimport)
                 mimport.header_line = ','.join(header_line)
 
+                import_data_list = []
                 for i, memb_data in enumerate(data_list):
 
-                    import_data = MembershipImportData(
+                    import_data_list.append(MembershipImportData(
                                     mimport=mimport,
                                     row_data=memb_data,
-                                    row_num=i+2)
-                    import_data.save()
+                                    row_num=i+2))
+                    if len(import_data_list) >= 500:
+                        MembershipImportData.objects.bulk_create(import_data_list)
+                        import_data_list = []
+
+                if import_data_list:
+                    MembershipImportData.objects.bulk_create(import_data_list)
 
                 mimport.status = 'preprocess_done'
                 mimport.save()
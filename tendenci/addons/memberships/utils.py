@@ -1,6 +1,7 @@
 import os
 import csv
 import re
+from copy import copy
 from decimal import Decimal
 from datetime import datetime, date, timedelta, time
 import dateutil.parser as dparser
@@ -10,22 +11,26 @@ import time as ttime
 
 from django.http import Http404, HttpResponseServerError
 from django.conf import settings
+from django.core.cache import cache
+from django.contrib.contenttypes.models import ContentType
 from django.utils import simplejson
 from django.contrib.auth.models import User, AnonymousUser
 from django.template import loader
 from django.template.defaultfilters import slugify
-from django.db.models import Q
+from django.db import connection
+from django.db.models import Q, Count
 from django.core.files.storage import default_storage
 from django.core import exceptions
 from django.utils.safestring import mark_safe
 from django.utils.encoding import smart_str
-from django.db.models.fields import AutoField
+from django.db.models.fields import AutoField, FieldDoesNotExist
 from django.db.models import ForeignKey, OneToOneField
 from django.core.urlresolvers import reverse
 from django.template.loader import render_to_string
 
 from tendenci.core.site_settings.utils import get_setting
 from tendenci.core.perms.utils import has_perm
+from tendenci.core.background_jobs.utils import set_progress
 from tendenci.addons.memberships.models import (App,
                                                 AppField,
                                                 AppEntry,
@@ -35,7 +40,10 @@ from tendenci.addons.memberships.models import (App,
                                                 MembershipDemographic,
                                                 MembershipApp,
                                                 MembershipAppField)
+from tendenci.addons.memberships.timeline import (ActiveMembershipTimeline,
+    get_period_counts)
 from tendenci.core.base.utils import normalize_newline, UnicodeWriter
+from tendenci.apps.invoices.models import Invoice
 from tendenci.apps.profiles.models import Profile
 from tendenci.apps.profiles.utils import make_username_unique, spawn_username
 from tendenci.core.emails.models import Email
@@ -233,6 +241,26 @@ def get_selected_demographic_field_names(membership_app=None):
     return selected_field_names
 
 
+def get_export_attnames(model, field_names, foreign_keys):
+    """
+    Returns the attribute to read for each field name. Foreign keys
+    are exported as their id, so read the <name>_id attribute instead
+    of loading the related object.
+    """
+    attnames = []
+    for field_name in field_names:
+        try:
+            field = model._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            field = None
+        if field and field_name in foreign_keys and \
+                isinstance(field, (ForeignKey, OneToOneField)):
+            attnames.append((field_name, field.attname))
+        else:
+            attnames.append((field_name, field_name))
+    return attnames
+
+
 def get_membership_rows(
         user_field_list,
         profile_field_list,
@@ -242,8 +270,18 @@ def get_membership_rows(
         foreign_keys,
         export_type=u'all',
         export_status_detail=u'',
-        cp_id=0):
+        cp_id=0,
+        chunk_size=1000,
+        progress=None):
+    """
+    Yields a dict of field values for each membership to export.
 
+    Memberships are read in chunks ordered by pk, with their users and
+    membership set invoices joined, and the profiles, demographics and
+    content type invoices of a chunk loaded with one query each.
+    progress, if given, is called with the number of rows done
+    and the total after each chunk.
+    """
     # grab all except the archived
     memberships = MembershipDefault.objects.filter(
         status=True).exclude(status_detail='archive')
@@ -262,38 +300,77 @@ def get_membership_rows(
     if cp_id:
         memberships = memberships.filter(corp_profile_id=cp_id)
 
-    for membership in memberships:
-        row_dict = {}
-
-        user = membership.user
-        invoice = membership.get_invoice()
+    user_attnames = get_export_attnames(User, user_field_list, foreign_keys)
+    profile_attnames = get_export_attnames(Profile, profile_field_list, foreign_keys)
+    demographic_attnames = get_export_attnames(
+        MembershipDemographic, demographic_field_list, foreign_keys)
+    membership_attnames = get_export_attnames(
+        MembershipDefault, membership_field_list, foreign_keys)
+    invoice_attnames = get_export_attnames(Invoice, invoice_field_list, foreign_keys)
+
+    membership_ct = ContentType.objects.get_for_model(MembershipDefault)
+    memberships = memberships.select_related('user', 'membership_set__invoice')
+
+    total = memberships.count() if progress else None
+    done = 0
+    last_pk = 0
+    while True:
+        chunk = list(memberships.filter(pk__gt=last_pk).order_by('pk')[:chunk_size])
+        if not chunk:
+            break
+        last_pk = chunk[-1].pk
+
+        user_ids = set(m.user_id for m in chunk)
+        profiles = {}
+        if profile_attnames:
+            for profile in Profile.objects.filter(user__in=user_ids).order_by('-pk'):
+                profiles[profile.user_id] = profile
+        demographics = {}
+        if demographic_attnames:
+            for demographic in MembershipDemographic.objects.filter(user__in=user_ids):
+                demographics[demographic.user_id] = demographic
+        invoices = {}
+        if invoice_attnames:
+            ids = [m.pk for m in chunk if not m.membership_set_id]
+            if ids:
+                for invoice in Invoice.objects.filter(
+                        object_type=membership_ct, object_id__in=ids).order_by('-pk'):
+                    invoices[invoice.object_id] = invoice
+
+        for membership in chunk:
+            row_dict = {}
+
+            user = membership.user
+            profile = profiles.get(membership.user_id)
+            demographic = demographics.get(membership.user_id)
+            if membership.membership_set_id:
+                invoice = membership.membership_set.invoice
+            else:
+                invoice = invoices.get(membership.pk)
 
-        [profile] = Profile.objects.filter(user=user)[:1] or [None]
-        [demographic] = MembershipDemographic.objects.filter(user=user)[:1] or [None]
+            for field_name, attname in user_attnames:
+                row_dict[field_name] = getattr(user, attname)
 
-        for field_name in user_field_list:
-            row_dict[field_name] = get_obj_field_value(field_name, user)
+            if profile:
+                for field_name, attname in profile_attnames:
+                    row_dict[field_name] = getattr(profile, attname)
 
-        if profile:
-            for field_name in profile_field_list:
-                row_dict[field_name] = get_obj_field_value(
-                    field_name, profile, field_name in foreign_keys)
+            if demographic:
+                for field_name, attname in demographic_attnames:
+                    row_dict[field_name] = getattr(demographic, attname)
 
-        if demographic:
-            for field_name in demographic_field_list:
-                row_dict[field_name] = get_obj_field_value(
-                    field_name, demographic, field_name in foreign_keys)
+            for field_name, attname in membership_attnames:
+                row_dict[field_name] = getattr(membership, attname)
 
-        for field_name in membership_field_list:
-            row_dict[field_name] = get_obj_field_value(
-                field_name, membership, field_name in foreign_keys)
+            if invoice:
+                for field_name, attname in invoice_attnames:
+                    row_dict[field_name] = getattr(invoice, attname)
 
-        if invoice:
-            for field_name in invoice_field_list:
-                row_dict[field_name] = get_obj_field_value(
-                    field_name, invoice, field_name in foreign_keys)
+            yield row_dict
 
-        yield row_dict
+        done += len(chunk)
+        if progress:
+            progress(done, total)
 
 
 def get_obj_field_value(field_name, obj, is_foreign_key=False):
@@ -303,6 +380,48 @@ def get_obj_field_value(field_name, obj, is_foreign_key=False):
     return value
 
 
+def get_export_formatter(field_name, id_names=None):
+    """
+    Returns a function that turns an exported value into the
+    unicode written to the csv, picked once per column.
+    """
+    def format_value(item):
+        if isinstance(item, datetime):
+            item = item.strftime('%Y-%m-%d %H:%M:%S')
+        elif isinstance(item, date):
+            item = item.strftime('%Y-%m-%d')
+        elif isinstance(item, time):
+            item = item.strftime('%H:%M:%S')
+        elif isinstance(item, basestring):
+            item = item.encode("utf-8")
+        elif id_names is not None:
+            # display the name instead of the id
+            item = id_names[item]
+        return smart_str(item).decode('utf-8')
+
+    def format_column(item):
+        if item is None:
+            return u''
+        if not item:
+            return smart_str(item).decode('utf-8')
+        return format_value(item)
+
+    return format_column
+
+
+def get_export_progress_key(identifier, cp_id=0):
+    return '.'.join([settings.CACHE_PRE_KEY, 'memberships', 'export',
+                     '%s_%d' % (identifier, int(cp_id))])
+
+
+def get_export_progress(identifier, cp_id=0):
+    """
+    Returns a dict with the rows done and total rows
+    of a running export, or None.
+    """
+    return cache.get(get_export_progress_key(identifier, cp_id))
+
+
 def process_export(
         export_fields='all_fields',
         export_type='all',
@@ -421,9 +540,22 @@ def process_export(
     membership_ids_dict = dict(MembershipType.objects.all().values_list('id', 'name'))
     app_ids_dict = dict(MembershipApp.objects.all().values_list('id', 'name'))
 
-    identifier = identifier or int(time.time())
+    identifier = identifier or int(ttime.time())
     file_name_temp = 'export/memberships/%s_%d_temp.csv' % (identifier, cp_id)
 
+    id_names = {
+        'membership_type': membership_ids_dict,
+        'app': app_ids_dict,
+    }
+    columns = [(field_name, get_export_formatter(field_name, id_names.get(field_name)))
+               for field_name in title_list]
+
+    progress_key = get_export_progress_key(identifier, cp_id)
+
+    def report_progress(done, total):
+        cache.set(progress_key, {'done': done, 'total': total}, 60 * 60 * 24)
+        set_progress(done, total)
+
     with default_storage.open(file_name_temp, 'wb') as csvfile:
         csv_writer = UnicodeWriter(csvfile, encoding='utf-8')
         csv_writer.writerow(title_list)
@@ -437,33 +569,12 @@ def process_export(
             fks,
             export_type,
             export_status_detail,
-            cp_id)
+            cp_id,
+            progress=report_progress)
 
         for row_dict in membership_rows:
-
-            items_list = []
-            for field_name in title_list:
-                item = row_dict.get(field_name)
-                if item is None:
-                    item = ''
-                if item:
-                    if isinstance(item, datetime):
-                        item = item.strftime('%Y-%m-%d %H:%M:%S')
-                    elif isinstance(item, date):
-                        item = item.strftime('%Y-%m-%d')
-                    elif isinstance(item, time):
-                        item = item.strftime('%H:%M:%S')
-                    elif isinstance(item, basestring):
-                        item = item.encode("utf-8")
-                    elif field_name == 'membership_type':
-                        # display membership type name instead of id
-                        item = membership_ids_dict[item]
-                    elif field_name == 'app':
-                        # display membership type name instead of id
-                        item = app_ids_dict[item]
-                item = smart_str(item).decode('utf-8')
-                items_list.append(item)
-            csv_writer.writerow(items_list)
+            csv_writer.writerow([format_column(row_dict.get(field_name))
+                                 for field_name, format_column in columns])
 
     # rename the file name
     file_name = 'export/memberships/%s_%d.csv' % (identifier, cp_id)
@@ -612,9 +723,12 @@ def prepare_chart_data(days, height=300):
     data = []
     max_count = 0
 
+    # one query for the whole range instead of a count per day
+    timeline = ActiveMembershipTimeline(days[0], days[-1]) if days else None
+
     #append mem count per day
     for day in days:
-        count = count_active_memberships(day)
+        count = timeline.count(day)
         if count > max_count:
             max_count = count
         data.append({
@@ -685,16 +799,12 @@ def get_over_time_stats():
         ("Year to Date", year, 5),
     ]
 
+    counts = get_period_counts([time[1] for time in times])
+
     stats = []
     for time in times:
         start_dt = time[1]
-        d = {}
-        active_mems = MembershipDefault.objects.filter(
-            status=True, status_detail='active')
-        active_mems = active_mems.filter(expire_dt__gt=start_dt)
-        d['new'] = active_mems.filter(join_dt__gt=start_dt).count()  # just joined in that time period
-        d['renewing'] = active_mems.filter(renewal=True).count()
-        d['active'] = active_mems.count()
+        d = dict(counts[start_dt])
         d['time'] = time[0]
         d['start_dt'] = start_dt
         d['end_dt'] = today
@@ -842,21 +952,30 @@ def get_membership_stats():
     total_pending = 0
     total_expired = 0
     total_total = 0
+
+    # count every type and status in one grouped query
+    counts = {}
+    rows = MembershipDefault.objects.filter(
+        status=True, status_detail__in=['active', 'pending', 'expired']
+    ).values('membership_type', 'status_detail').annotate(
+        count=Count('pk')).order_by()
+    for row in rows:
+        counts[(row['membership_type'], row['status_detail'])] = row['count']
+
     for mem_type in types:
-        mems = MembershipDefault.objects.filter(membership_type=mem_type)
-        active = mems.filter(status=True, status_detail='active')
-        pending = mems.filter(status=True, status_detail='pending')
-        expired = mems.filter(status=True, status_detail='expired')
-        total_all = active.count() + pending.count() + expired.count()
-        total_active += active.count()
-        total_pending += pending.count()
-        total_expired += expired.count()
+        active = counts.get((mem_type.pk, 'active'), 0)
+        pending = counts.get((mem_type.pk, 'pending'), 0)
+        expired = counts.get((mem_type.pk, 'expired'), 0)
+        total_all = active + pending + expired
+        total_active += active
+        total_pending += pending
+        total_expired += expired
         total_total += total_all
         summary.append({
             'type': mem_type,
-            'active': active.count(),
-            'pending': pending.count(),
-            'expired': expired.count(),
+            'active': active,
+            'pending': pending,
+            'expired': expired,
             'total': total_all,
         })
 
@@ -1040,6 +1159,16 @@ def get_user_by_fn_ln_phone(first_name, last_name, phone):
     return None
 
 
+def get_fn_ln_phone_key(first_name, last_name, phone):
+    """
+    Returns the key get_user_by_fn_ln_phone() looks users up by,
+    or None when it would not look them up.
+    """
+    if not first_name or last_name or phone:
+        return None
+    return (first_name, last_name, phone)
+
+
 class ImportMembDefault(object):
     """
     Check and process (insert/update) a membership.
@@ -1082,10 +1211,12 @@ class ImportMembDefault(object):
                              }
         self.t4_timezone_map_keys = self.t4_timezone_map.keys()
         # all membership types
-        self.all_membership_type_ids = MembershipType.objects.values_list(
-                                        'id', flat=True)
-        self.all_membership_type_names = MembershipType.objects.values_list(
-                                        'name', flat=True)
+        self.membership_types = dict([(mt.id, mt) for mt in
+                            MembershipType.objects.select_related('group')])
+        self.membership_type_ids_by_name = dict([(mt.name, mt.id) for mt in
+                                            self.membership_types.values()])
+        self.all_membership_type_ids = self.membership_types.keys()
+        self.all_membership_type_names = self.membership_type_ids_by_name.keys()
         # membership types associated membership apps
         self.membership_type_ids = [mt.id for mt in MembershipType.objects.all(
                                     )
@@ -1133,6 +1264,15 @@ class ImportMembDefault(object):
                                                   flat=True
                                     )[:1] or [None]
 
+        # foreign keys resolved from memory in clean_data
+        self.fk_objects = {
+            MembershipType: self.membership_types,
+            MembershipApp: self.membership_app_ids_dict,
+        }
+
+        # lookup indexes for the current chunk, see prepare_chunk
+        self.chunk_prepared = False
+
     def init_summary(self):
         return {
                  'insert': 0,
@@ -1178,15 +1318,11 @@ class ImportMembDefault(object):
                 else:
                     memb_data['membership_type'] = value
             else:
-                if not MembershipType.objects.filter(
-                                            name=value).exists():
+                if not value in self.membership_type_ids_by_name:
                     is_valid = False
                     error_msg = 'Invalid membership type "%s"' % value
                 else:
-                    memb_data['membership_type'] = MembershipType.objects.filter(
-                                            name=value
-                                            ).values_list(
-                                            'id', flat=True)[0]
+                    memb_data['membership_type'] = self.membership_type_ids_by_name[value]
         else:
             # the spread sheet doesn't have the membership_type field,
             # assign the default one
@@ -1279,6 +1415,155 @@ class ImportMembDefault(object):
 
         return False
 
+    def get_lookup_keys(self):
+        """
+        Returns the user lookups in the order of the import key.
+        """
+        keys = [k for k in self.key.split('/') if k in
+                ('member_number', 'email', 'fn_ln_phone')]
+        return keys or ['email']
+
+    def prepare_chunk(self, data_list):
+        """
+        Resolves the user lookup keys of a chunk of import rows with a
+        few __in queries and indexes the matching users, profiles,
+        demographics and memberships in memory, so
+        process_default_membership does not query for each row.
+
+        :param data_list: a list of MembershipImportData
+        """
+        lookup_keys = self.get_lookup_keys()
+        member_numbers = set()
+        emails = set()
+        names = set()
+        for idata in data_list:
+            memb_data = idata.row_data
+            if 'member_number' in lookup_keys and memb_data.get('member_number'):
+                member_numbers.add(memb_data['member_number'])
+            if 'email' in lookup_keys and memb_data.get('email'):
+                emails.add(memb_data['email'].lower())
+            if 'fn_ln_phone' in lookup_keys:
+                key = get_fn_ln_phone_key(memb_data.get('first_name'),
+                                          memb_data.get('last_name'),
+                                          memb_data.get('phone'))
+                if key:
+                    names.add(key)
+
+        profile_order = ('-user__is_active', '-user__is_superuser', '-user__is_staff')
+        users = {}
+
+        self.users_by_member_number = {}
+        if member_numbers:
+            profiles = Profile.objects.filter(
+                member_number__in=member_numbers
+            ).select_related('user').order_by(*profile_order)
+            for profile in profiles:
+                user = users.setdefault(profile.user_id, profile.user)
+                self.users_by_member_number.setdefault(
+                    profile.member_number, []).append(user)
+
+        self.users_by_email = {}
+        if emails:
+            qn = connection.ops.quote_name
+            where = 'LOWER(%s.%s) IN (%s)' % (qn(User._meta.db_table), qn('email'),
+                                              ', '.join(['%s'] * len(emails)))
+            email_users = User.objects.extra(where=[where], params=list(emails)
+                            ).order_by('-is_active', '-is_superuser', '-is_staff')
+            for user in email_users:
+                user = users.setdefault(user.pk, user)
+                self.users_by_email.setdefault(user.email.lower(), []).append(user)
+
+        self.users_by_fn_ln_phone = {}
+        if names:
+            profiles = Profile.objects.filter(
+                user__first_name__in=set(n[0] for n in names),
+                user__last_name__in=set(n[1] for n in names),
+                phone__in=set(n[2] for n in names)
+            ).select_related('user').order_by(*profile_order)
+            for profile in profiles:
+                key = (profile.user.first_name, profile.user.last_name, profile.phone)
+                if key in names:
+                    user = users.setdefault(profile.user_id, profile.user)
+                    self.users_by_fn_ln_phone.setdefault(key, []).append(user)
+
+        # the profiles, so user.get_profile() does not query
+        for profile in Profile.objects.filter(user__in=users.keys()):
+            users[profile.user_id]._profile_cache = profile
+
+        # the most recent membership of each user and membership type
+        self.memberships = {}
+        memberships = MembershipDefault.objects.filter(
+            user__in=users.keys()).exclude(status_detail='archive').order_by('id')
+        for memb in memberships:
+            self.memberships[(memb.user_id, memb.membership_type_id)] = memb
+
+        self.demographics = dict([(d.user_id, d) for d in
+                                  MembershipDemographic.objects.filter(
+                                      user__in=users.keys())])
+
+        self.chunk_prepared = True
+
+    def find_users(self, lookup_key, memb_data):
+        """
+        Returns the users matching the row for one lookup key.
+        """
+        if lookup_key == 'member_number':
+            if not self.chunk_prepared:
+                return get_user_by_member_number(memb_data['member_number'])
+            return self.users_by_member_number.get(memb_data['member_number'])
+        if lookup_key == 'fn_ln_phone':
+            if not self.chunk_prepared:
+                return get_user_by_fn_ln_phone(memb_data['first_name'],
+                                               memb_data['last_name'],
+                                               memb_data['phone'])
+            key = get_fn_ln_phone_key(memb_data['first_name'],
+                                      memb_data['last_name'],
+                                      memb_data['phone'])
+            return self.users_by_fn_ln_phone.get(key)
+        if not self.chunk_prepared:
+            return get_user_by_email(memb_data['email'])
+        if not memb_data['email']:
+            return None
+        return self.users_by_email.get(memb_data['email'].lower())
+
+    def find_membership(self, user, membership_type_id):
+        """
+        Returns the most recent membership of the user
+        for the membership type, excluding the archived.
+        """
+        if self.chunk_prepared:
+            return self.memberships.get((user.pk, membership_type_id))
+
+        memberships = MembershipDefault.objects.filter(
+                        user=user,
+                        membership_type__id=membership_type_id
+                                          ).exclude(
+                          status_detail='archive')
+        [memb] = memberships.order_by('-id')[:1] or [None]
+        return memb
+
+    def remember_import(self, user, profile, memb, demographic=None):
+        """
+        Adds the saved records to the chunk indexes so later
+        rows in the same chunk find them.
+        """
+        if not self.chunk_prepared:
+            return
+
+        def add(index, key, user):
+            if key:
+                users = index.setdefault(key, [])
+                if not [u for u in users if u.pk == user.pk]:
+                    users.append(user)
+
+        add(self.users_by_member_number, profile.member_number, user)
+        add(self.users_by_email, (user.email or '').lower(), user)
+        add(self.users_by_fn_ln_phone, get_fn_ln_phone_key(
+            user.first_name, user.last_name, profile.phone), user)
+        self.memberships[(user.pk, memb.membership_type_id)] = memb
+        if demographic:
+            self.demographics[user.pk] = demographic
+
     def process_default_membership(self, idata, **kwargs):
         """
         Check if it's insert or update. If dry_run is False,
@@ -1314,42 +1599,11 @@ class ImportMembDefault(object):
                 idata.error = user_display['error']
                 idata.save()
         else:
-            if self.key == 'member_number/email/fn_ln_phone':
-                users = get_user_by_member_number(
-                                    self.memb_data['member_number'])
-                if not users:
-                    users = get_user_by_email(self.memb_data['email'])
-                    if not users:
-                        users = get_user_by_fn_ln_phone(
-                                           self.memb_data['first_name'],
-                                           self.memb_data['last_name'],
-                                           self.memb_data['phone']
-                                           )
-            elif self.key == 'email/member_number/fn_ln_phone':
-                users = get_user_by_email(self.memb_data['email'])
-                if not users:
-                    users = get_user_by_member_number(
-                                self.memb_data['member_number'])
-                    if not users:
-                        users = get_user_by_fn_ln_phone(
-                                           self.memb_data['first_name'],
-                                           self.memb_data['last_name'],
-                                           self.memb_data['phone'])
-            elif self.key == 'member_number/email':
-                users = get_user_by_member_number(
-                                self.memb_data['member_number'])
-                if not users:
-                    users = get_user_by_email(self.memb_data['email'])
-            elif self.key == 'email/member_number':
-                users = get_user_by_email(self.memb_data['email'])
-                if not users:
-                    users = get_user_by_member_number(
-                                self.memb_data['member_number'])
-            elif self.key == 'member_number':
-                users = get_user_by_member_number(
-                                self.memb_data['member_number'])
-            else:  # email
-                users = get_user_by_email(self.memb_data['email'])
+            users = None
+            for lookup_key in self.get_lookup_keys():
+                users = self.find_users(lookup_key, self.memb_data)
+                if users:
+                    break
 
             if users:
                 user_display['user_action'] = 'update'
@@ -1357,14 +1611,9 @@ class ImportMembDefault(object):
                 # pick the most recent one
                 memb = None
                 for user in users:
-                    memberships = MembershipDefault.objects.filter(
-                                    user=user,
-                                    membership_type__id=self.memb_data['membership_type']
-                                                      ).exclude(
-                                      status_detail='archive')
-                    if memberships.exists():
-
-                        [memb] = memberships.order_by('-id')[:1] or [None]
+                    memb = self.find_membership(user,
+                                    self.memb_data['membership_type'])
+                    if memb:
                         user_display['user'] = user
                         break
 
@@ -1487,9 +1736,13 @@ class ImportMembDefault(object):
             self.should_handle_demographic = self.has_demographic_fields(
                                         self.memb_data.keys())
 
+        demographic = None
         if self.should_handle_demographic:
             # process only if we have demographic fields in the import.
-            demographic = MembershipDemographic.objects.get_or_create(
+            if self.chunk_prepared and user.pk in self.demographics:
+                demographic = self.demographics[user.pk]
+            else:
+                demographic = MembershipDemographic.objects.get_or_create(
                                     user=user)[0]
             self.assign_import_values_from_dict(demographic,
                                                 action_info['user_action'])
@@ -1590,6 +1843,8 @@ class ImportMembDefault(object):
                       'owner_username': self.request_user.username}
             memb.membership_type.group.add_user(memb.user, **params)
 
+        self.remember_import(user, profile, memb, demographic)
+
     def is_active(self, memb):
         return all([memb.status,
                     memb.status_detail == 'active',
@@ -1744,13 +1999,19 @@ class ImportMembDefault(object):
                 value = None
 
             if value:
-                [value] = field.related.parent_model.objects.filter(
+                parent_model = field.related.parent_model
+                if parent_model in self.fk_objects:
+                    # a copy, the instance may be changed for this row
+                    value = copy(self.fk_objects[parent_model].get(value))
+                else:
+                    [value] = parent_model.objects.filter(
                                             pk=value)[:1] or [None]
 
             # membership_type - look up by name in case
             # they entered name instead of id
             if not value and field.name == 'membership_type':
-                value = get_membership_type_by_name(orignal_value)
+                value = copy(self.membership_types.get(
+                    self.membership_type_ids_by_name.get(orignal_value)))
 
             if not value and not field.null:
                 # if the field doesn't allow null, grab the first one.
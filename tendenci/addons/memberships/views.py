@@ -6,7 +6,6 @@ from hashlib import md5
 from dateutil.parser import parse
 from datetime import datetime, timedelta, date
 import time as ttime
-import subprocess
 from sets import Set
 import calendar
 
@@ -37,11 +36,12 @@ from tendenci.apps.notifications.utils import send_welcome_email
 
 from tendenci.core.site_settings.utils import get_setting
 from tendenci.core.event_logs.models import EventLog
+from tendenci.core.background_jobs.utils import enqueue
 from tendenci.core.base.http import Http403
 from tendenci.core.base.decorators import password_required
 from tendenci.core.base.utils import send_email_notification
 from tendenci.core.perms.decorators import superuser_required
-from tendenci.core.perms.utils import has_perm, update_perms_and_save, get_query_filters
+from tendenci.core.perms.utils import has_perm, update_perms_and_save, get_query_filters, distinct_if_needed
 from tendenci.apps.invoices.models import Invoice
 from tendenci.addons.corporate_memberships.models import (CorpMembership,
                                                           CorpProfile,
@@ -68,7 +68,8 @@ from tendenci.addons.memberships.forms import (
     MembershipDefault2Form)
 from tendenci.addons.memberships.utils import (is_import_valid, prepare_chart_data,
     get_days, get_over_time_stats, get_status_filter,
-    get_membership_stats, NoMembershipTypes, ImportMembDefault)
+    get_membership_stats, NoMembershipTypes, ImportMembDefault,
+    get_export_progress)
 from tendenci.addons.memberships.importer.forms import ImportMapForm, UploadForm
 from tendenci.addons.memberships.importer.utils import parse_mems_from_csv
 from tendenci.addons.memberships.importer.tasks import ImportMembershipsTask
@@ -98,7 +99,7 @@ def membership_search(request, template_name="memberships/search.html"):
         members = members.order_by('last_name')
     else:
         filters = get_query_filters(request.user, 'memberships.view_membership')
-        members = Membership.objects.filter(filters).distinct()
+        members = distinct_if_needed(Membership.objects.filter(filters))
         if mem_type:
             members = members.filter(membership_type__pk=mem_type)
         members = members.exclude(status_detail='expired')
@@ -775,7 +776,7 @@ def application_entries_search(request, template_name="memberships/entries/searc
         status = request.GET.get('status', None)
 
         filters = get_query_filters(request.user, 'memberships.view_appentry')
-        entries = AppEntry.objects.filter(filters).distinct()
+        entries = distinct_if_needed(AppEntry.objects.filter(filters))
         if status:
             status_filter = get_status_filter(status)
             entries = entries.filter(status_filter)
@@ -1109,6 +1110,8 @@ def membership_default_import_preview(request, mimport_id,
         #print data_list
         imd = ImportMembDefault(request.user, mimport, dry_run=True)
         # to be efficient, we only process memberships on the current page
+        data_list = list(data_list)
+        imd.prepare_chunk(data_list)
         fieldnames = None
         for idata in data_list:
             user_display = imd.process_default_membership(idata)
@@ -1135,9 +1138,7 @@ def membership_default_import_preview(request, mimport_id,
                                      args=[mimport.id]))
         else:
             if mimport.status == 'not_started':
-                subprocess.Popen(["python", "manage.py",
-                              "membership_import_preprocess",
-                              str(mimport.pk)])
+                enqueue('membership_import_preprocess', [mimport.pk])
 
             return render_to_response(template_name, {
                 'mimport': mimport,
@@ -1159,10 +1160,7 @@ def membership_default_import_process(request, mimport_id):
         mimport.num_processed = 0
         mimport.save()
         # start the process
-        subprocess.Popen(["python", "manage.py",
-                          "import_membership_defaults",
-                          str(mimport.pk),
-                          str(request.user.pk)])
+        enqueue('import_membership_defaults', [mimport.pk, request.user.pk])
 
         # log an event
         EventLog.objects.log()
@@ -1331,14 +1329,13 @@ def membership_default_export(
             default_storage.save(temp_file_path, ContentFile(''))
 
             # start the process
-            subprocess.Popen(["python", "manage.py",
-                          "membership_export_process",
-                          '--export_fields=%s' % export_fields,
-                          '--export_type=%s' % export_type,
-                          '--export_status_detail=%s' % export_status_detail,
-                          '--identifier=%s' % identifier,
-                          '--user=%s' % request.user.id,
-                          '--cp_id=%d' % cp_id])
+            enqueue('membership_export_process', options={
+                'export_fields': export_fields,
+                'export_type': export_type,
+                'export_status_detail': export_status_detail,
+                'identifier': unicode(identifier),
+                'user': unicode(request.user.id),
+                'cp_id': unicode(cp_id)})
             # log an event
             EventLog.objects.log()
             status_url = reverse('memberships.default_export_status', args=[identifier])
@@ -1388,6 +1385,7 @@ def membership_default_export_status(request, identifier,
 
     context = {'identifier': identifier,
                'download_ready': download_ready,
+               'progress': get_export_progress(identifier, cp_id),
                'corp_profile': corp_profile}
     return render_to_response(template, context, RequestContext(request))
 
@@ -14,7 +14,7 @@ from tendenci.core.site_settings.utils import get_setting
 from tendenci.core.meta.forms import MetaForm
 from tendenci.core.perms.decorators import is_enabled
 from tendenci.core.perms.utils import (get_notice_recipients, has_perm,
-    update_perms_and_save, get_query_filters)
+    update_perms_and_save, get_query_filters, distinct_if_needed)
 from tendenci.core.theme.shortcuts import themed_response as render_to_response
 from tendenci.core.exports.utils import run_export_task
 
@@ -52,7 +52,7 @@ def search(request, template_name="news/search.html"):
         news = News.objects.search(query, user=request.user)
     else:
         filters = get_query_filters(request.user, 'news.view_news')
-        news = News.objects.filter(filters).distinct()
+        news = distinct_if_needed(News.objects.filter(filters))
 
     if not has_perm(request.user, 'news.view_news'):
         news = news.filter(release_dt__lte=datetime.now())
@@ -1,8 +1,6 @@
 import os
 import re
 
-from subprocess import Popen
-
 from django.shortcuts import get_object_or_404, redirect
 from django.http import HttpResponseRedirect, HttpResponse, Http404
 from django.utils.translation import ugettext_lazy as _
@@ -24,11 +22,12 @@ from django.middleware.csrf import get_token as csrf_get_token
 from tendenci.core.theme.shortcuts import themed_response as render_to_response
 from tendenci.core.base.http import Http403
 from tendenci.core.perms.decorators import is_enabled
-from tendenci.core.perms.utils import has_perm, update_perms_and_save, get_query_filters, has_view_perm
+from tendenci.core.perms.utils import has_perm, update_perms_and_save, get_query_filters, distinct_if_needed, has_view_perm
 from tendenci.core.site_settings.utils import get_setting
 from tendenci.core.event_logs.models import EventLog
 from tendenci.core.files.utils import get_image, aspect_ratio, generate_image_cache_key
 from tendenci.apps.user_groups.models import Group
+from tendenci.core.background_jobs.utils import enqueue
 from djcelery.models import TaskMeta
 
 from tendenci.addons.photos.cache import PHOTO_PRE_KEY
@@ -47,7 +46,7 @@ def search(request, template_name="photos/search.html"):
         photos = Image.objects.search(query, user=request.user)
     else:
         filters = get_query_filters(request.user, 'photos.view_image')
-        photos = Image.objects.filter(filters).distinct()
+        photos = distinct_if_needed(Image.objects.filter(filters))
         if not request.user.is_anonymous():
             photos = photos.select_related()
 
@@ -472,7 +471,7 @@ def photoset_view_latest(request, template_name="photos/photo-set/latest.html"):
         photo_sets = PhotoSet.objects.search(query, user=request.user)
     else:
         filters = get_query_filters(request.user, 'photos.view_photoset')
-        photo_sets = PhotoSet.objects.filter(filters).distinct()
+        photo_sets = distinct_if_needed(PhotoSet.objects.filter(filters))
         if not request.user.is_anonymous():
             photo_sets = photo_sets.select_related()
     photo_sets = photo_sets.order_by('-create_dt')
@@ -583,7 +582,7 @@ def photos_batch_add(request, photoset_id=0):
                 # serialize queryset
                 data = serializers.serialize("json", Image.objects.filter(id=photo.id))
 
-                cache_image = Popen(["python", "manage.py", "precache_photo", str(photo.pk)])
+                enqueue('precache_photo', [photo.pk])
 
                 # returning a response of "ok" (flash likes this)
                 # response is for flash, not humans
@@ -1,5 +1,10 @@
 import re
+import select
+import socket
+import httplib
+import threading
 import urllib2
+import urlparse
 from xml.etree import ElementTree as ET
 
 from django.conf import settings
@@ -16,6 +21,97 @@ TRANSACTION_EXTRA_OPTIONS = {'x_delim_data': 'TRUE',
                             'x_delim_char': '||', 
                             'x_encap_char': ''}
 
+CIM_TIMEOUT = 60  # seconds
+
+_connections = threading.local()
+
+
+def get_connection(url):
+    """
+    A keep-alive connection to the host of url, one per thread,
+    so a run of many requests doesn't pay a TLS handshake for each.
+    """
+    scheme, netloc = urlparse.urlsplit(url)[:2]
+    pool = getattr(_connections, 'pool', None)
+    if pool is None:
+        pool = _connections.pool = {}
+    conn = pool.get((scheme, netloc))
+    if conn is None:
+        if scheme == 'https':
+            conn = httplib.HTTPSConnection(netloc, timeout=CIM_TIMEOUT)
+        else:
+            conn = httplib.HTTPConnection(netloc, timeout=CIM_TIMEOUT)
+        pool[(scheme, netloc)] = conn
+    return conn
+
+
+def close_connection(url):
+    scheme, netloc = urlparse.urlsplit(url)[:2]
+    conn = getattr(_connections, 'pool', {}).pop((scheme, netloc), None)
+    if conn is not None:
+        conn.close()
+
+
+def is_stale(conn):
+    """
+    An idle kept-alive socket that is readable has been closed
+    by the gateway, or has unexpected data waiting.
+    """
+    if conn.sock is None:
+        return False
+    try:
+        return bool(select.select([conn.sock], [], [], 0)[0])
+    except (select.error, socket.error, ValueError):
+        return True
+
+
+def post_xml(url, body, retry=True):
+    """
+    POST body to url and return the response body.
+
+    If sending on a reused connection fails, the gateway closed it
+    and didn't get the request, so it is sent once more on a new
+    connection when retry is True. Once the request is sent nothing
+    is retried: a timeout waiting for the response doesn't mean the
+    gateway didn't act on it. Pass retry=False for transactions.
+    """
+    parts = urlparse.urlsplit(url)
+    path = parts.path or '/'
+    if parts.query:
+        path = '%s?%s' % (path, parts.query)
+    headers = {'Content-Type': 'text/xml', 'encoding': 'utf-8'}
+
+    conn = get_connection(url)
+    if is_stale(conn):
+        close_connection(url)
+        conn = get_connection(url)
+    reused = conn.sock is not None
+    try:
+        conn.request('POST', path, body, headers)
+    except socket.timeout:
+        close_connection(url)
+        raise
+    except socket.error:
+        close_connection(url)
+        if not (reused and retry):
+            raise
+        conn = get_connection(url)
+        conn.request('POST', path, body, headers)
+
+    try:
+        response = conn.getresponse()
+    except (httplib.HTTPException, socket.error):
+        close_connection(url)
+        raise
+
+    data = response.read()
+    if response.will_close:
+        close_connection(url)
+    if response.status != 200:
+        raise urllib2.HTTPError(url, response.status, response.reason,
+                                response.msg, None)
+    return data
+
 
 class CIMBase(object):
     """
@@ -75,16 +171,11 @@ class CIMBase(object):
             
         
     
-    def process_request(self, xml_root):
+    def process_request(self, xml_root, retry=True):
         request_xml_str = '%s\n%s' % ('<?xml version="1.0" encoding="utf-8"?>', ET.tostring(xml_root))
         #print request_xml_str
-        request = urllib2.Request(self.cim_url, 
-                                request_xml_str, 
-                                {'Content-Type': 'text/xml',
-                                'encoding': 'utf-8'})
-        response = urllib2.urlopen(request)
-        data = response.read()
-        
+        data = post_xml(self.cim_url, request_xml_str, retry=retry)
+
         return self.process_response(data)
 
 
@@ -667,7 +758,9 @@ class CIMCustomerProfileTransaction(CIMBase):
         extra_options_text = '&'.join(['%s=%s' % (x, y) for (x, y) in TRANSACTION_EXTRA_OPTIONS.items()])
         extra_options_node.text = extra_options_text
         
-        return self.process_request(xml_root)
+        # a transaction is never sent twice, the caller reconciles
+        # a failed one with the gateway
+        return self.process_request(xml_root, retry=False)
                 
         
         
@@ -0,0 +1,157 @@
+import re
+import threading
+import time
+from BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+from SocketServer import ThreadingMixIn
+from optparse import make_option
+from xml.etree import ElementTree as ET
+
+from django.core.management.base import BaseCommand
+
+RESPONSE_XML = """<?xml version="1.0" encoding="utf-8"?>
+<%(name)s xmlns="AnetApi/xml/v1/schema/AnetApiSchema.xsd">
+<messages><resultCode>%(result_code)s</resultCode>
+<message><code>%(code)s</code><text>%(text)s</text></message></messages>
+%(body)s
+</%(name)s>"""
+
+APPROVED = '1||1||1||This transaction has been approved.||000000||Y||%(trans_id)s||%(invoice_num)s||||%(amount)s||CC||auth_capture'
+DUPLICATE = '3||1||11||A duplicate transaction has been submitted.||||P||0||%(invoice_num)s||||%(amount)s||CC||auth_capture'
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class FakeCIMHandler(BaseHTTPRequestHandler):
+    # keep connections alive like the real gateway
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        if self.server.verbosity > 1:
+            BaseHTTPRequestHandler.log_message(self, format, *args)
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.getheader('content-length', 0)))
+        root = ET.XML(body)
+        name = re.sub(r'\{.*?\}', '', root.tag)
+        fields = dict((re.sub(r'\{.*?\}', '', e.tag), e.text) for e in root.getiterator())
+
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        xml = self.server.respond(name, fields)
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/xml')
+        self.send_header('Content-Length', str(len(xml)))
+        self.end_headers()
+        self.wfile.write(xml)
+
+
+class FakeCIMServer(ThreadingHTTPServer):
+    """
+    Answers the CIM requests made by the recurring payments run
+    with successful responses, and rejects a transaction on a payment
+    profile within the duplicate window of the previous one, like the
+    real gateway.
+    """
+    def __init__(self, address, latency=0, duplicate_window=120, verbosity=1):
+        ThreadingHTTPServer.__init__(self, address, FakeCIMHandler)
+        self.latency = latency
+        self.duplicate_window = duplicate_window
+        self.verbosity = verbosity
+        self.lock = threading.Lock()
+        self.last_transactions = {}
+        self.counts = {}
+        self.next_id = 1000
+
+    def new_id(self):
+        with self.lock:
+            self.next_id += 1
+            return self.next_id
+
+    def respond(self, name, fields):
+        response_name = name.replace('Request', 'Response')
+        with self.lock:
+            self.counts[name] = self.counts.get(name, 0) + 1
+
+        d = {'name': response_name, 'result_code': 'Ok',
+             'code': 'I00001', 'text': 'Successful.', 'body': ''}
+
+        if name == 'createCustomerProfileRequest':
+            d['body'] = '<customerProfileId>%d</customerProfileId>' % self.new_id()
+
+        elif name == 'getCustomerProfileRequest':
+            profile_id = fields.get('customerProfileId') or ''
+            d['body'] = ('<profile><customerProfileId>%s</customerProfileId>'
+                         '<paymentProfiles><customerPaymentProfileId>%s1</customerPaymentProfileId>'
+                         '</paymentProfiles></profile>') % (profile_id, profile_id)
+
+        elif name == 'createCustomerProfileTransactionRequest':
+            payment_profile_id = fields.get('customerPaymentProfileId')
+            values = {'trans_id': self.new_id(),
+                      'invoice_num': fields.get('invoiceNumber') or '',
+                      'amount': fields.get('amount') or ''}
+            now = time.time()
+            with self.lock:
+                last = self.last_transactions.get(payment_profile_id)
+                duplicate = last is not None and now - last < self.duplicate_window
+                if not duplicate:
+                    self.last_transactions[payment_profile_id] = now
+            if duplicate:
+                d.update(result_code='Error', code='E00027',
+                         text='A duplicate transaction has been submitted.')
+                direct_response = DUPLICATE % values
+            else:
+                direct_response = APPROVED % values
+            d['body'] = '<directResponse>%s</directResponse>' % direct_response
+
+        return RESPONSE_XML % d
+
+
+class Command(BaseCommand):
+    """
+    Run a local stand-in for the Authorize.Net CIM API to test
+    the throughput of make_recurring_payment_transactions.
+
+    Point the site at it with
+        AUTHNET_CIM_TEST_MODE = True
+        AUTHNET_CIM_API_TEST_URL = 'http://127.0.0.1:8011/'
+
+    Usage: ./manage.py fake_cim_server --port 8011 --latency 0.5
+    """
+    help = 'Run a fake Authorize.Net CIM endpoint for testing'
+
+    option_list = BaseCommand.option_list + (
+        make_option('--port',
+            action='store',
+            dest='port',
+            type='int',
+            default=8011,
+            help='Port to listen on'),
+        make_option('--latency',
+            action='store',
+            dest='latency',
+            type='float',
+            default=0.5,
+            help='Seconds to wait before answering each request'),
+        make_option('--duplicate-window',
+            action='store',
+            dest='duplicate_window',
+            type='int',
+            default=120,
+            help='Seconds in which a second transaction on a payment profile is rejected'),
+        )
+
+    def handle(self, *args, **options):
+        server = FakeCIMServer(('127.0.0.1', options['port']),
+                               latency=options['latency'],
+                               duplicate_window=options['duplicate_window'],
+                               verbosity=int(options.get('verbosity', 1)))
+        print "Fake CIM endpoint at http://127.0.0.1:%d/" % options['port']
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        for name, count in sorted(server.counts.items()):
+            print "%s: %d" % (name, count)
@@ -1,4 +1,5 @@
 #import traceback
+from optparse import make_option
 from django.core.management.base import BaseCommand
 #from django.template.loader import render_to_string
 #from django.template import TemplateDoesNotExist
@@ -13,9 +14,21 @@ class Command(BaseCommand):
         2) generate invoice(s) for recurring payments if needed.
         3) make payment transactions for invoice(s) upon due date.
         4) notify admins and customers for after each transaction.
+
+    The recurring payments are processed by a pool of --workers threads
+    (settings.RECURRING_PAYMENTS_WORKERS), and the timing of the run is
+    stored in a RecurringPaymentRun.
     
-    Usage: ./manage.py make_recurring_payment_transactions --verbosity 2
+    Usage: ./manage.py make_recurring_payment_transactions --verbosity 2 [--workers 4]
     """
+    option_list = BaseCommand.option_list + (
+        make_option('--workers',
+            action='store',
+            dest='workers',
+            type='int',
+            default=None,
+            help='Number of recurring payments to process at once'),
+        )
     
     def handle(self, *args, **options):
         verbosity = 1
@@ -27,9 +40,19 @@ class Command(BaseCommand):
             pass
             
         from tendenci.addons.recurring_payments.models import RecurringPayment 
-        from tendenci.addons.recurring_payments.utils import run_a_recurring_payment
+        from tendenci.addons.recurring_payments.runner import RecurringPaymentRunner
      
         recurring_payments = RecurringPayment.objects.filter(status_detail='active', status=True)    
         
-        for rp in recurring_payments:
-            run_a_recurring_payment(rp, verbosity)
\ No newline at end of file
+        runner = RecurringPaymentRunner(options['workers'], verbosity)
+        run = runner.run(recurring_payments)
+
+        if verbosity > 0:
+            print
+            print '%d recurring payments, %d workers, %.1fs' % (
+                run.num_recurring_payments, run.num_workers, run.elapsed)
+            print '%d transactions (%d succeeded, %d failed), %d errors' % (
+                run.num_transactions, run.num_succeeded, run.num_failed, run.num_errors)
+            if run.num_transactions:
+                print '%.2fs per transaction, slowest recurring payment %.1fs' % (
+                    run.transaction_time / run.num_transactions, run.max_payment_time)
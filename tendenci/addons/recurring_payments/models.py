@@ -635,6 +635,32 @@ class PaymentTransaction(models.Model):
     #status_detail = models.CharField(max_length=50,  null=True)
 
 
+class RecurringPaymentRun(models.Model):
+    """
+    Timing and counts of a make_recurring_payment_transactions run.
+    """
+    start_dt = models.DateTimeField()
+    end_dt = models.DateTimeField(null=True)
+    num_workers = models.IntegerField(default=1)
+    num_recurring_payments = models.IntegerField(default=0)
+    num_transactions = models.IntegerField(default=0)
+    num_succeeded = models.IntegerField(default=0)
+    num_failed = models.IntegerField(default=0)
+    num_errors = models.IntegerField(default=0)
+    # seconds
+    elapsed = models.FloatField(default=0)
+    transaction_time = models.FloatField(default=0)
+    max_payment_time = models.FloatField(default=0)
+
+    class Meta:
+        ordering = ('-start_dt',)
+
+    def __unicode__(self):
+        return u'%s: %d recurring payments, %d transactions in %.1fs' % (
+            self.start_dt, self.num_recurring_payments,
+            self.num_transactions, self.elapsed)
+
+
 
 from django.db.models.signals import post_save, post_delete
 
@@ -0,0 +1,134 @@
+"""
+Processes many recurring payments at once.
+
+Each recurring payment is a RecurringPaymentProcess whose steps are
+run by a bounded pool of threads. When a transaction has to wait
+for the duplicate transaction window of its payment profile, the
+process is put back in the queue until then and the thread moves
+on to other recurring payments instead of sleeping.
+"""
+import heapq
+import itertools
+import threading
+import time
+import traceback
+from datetime import datetime
+
+from django.conf import settings
+from django.db import connection
+
+from tendenci.addons.recurring_payments.models import RecurringPaymentRun
+from tendenci.addons.recurring_payments.utils import (RecurringPaymentProcess,
+    DuplicateTransactionWindow)
+
+
+class RecurringPaymentRunner(object):
+    def __init__(self, num_workers=None, verbosity=0, window=None):
+        if num_workers is None:
+            num_workers = getattr(settings, 'RECURRING_PAYMENTS_WORKERS', 4)
+        self.num_workers = max(1, num_workers)
+        self.verbosity = verbosity
+        self.window = window or DuplicateTransactionWindow()
+
+        # (ready time, sequence, process, steps, waiting payment profile id)
+        # of the processes waiting to run
+        self.queue = []
+        self.active = 0
+        self.condition = threading.Condition()
+        self.run_log = None
+
+    def run(self, recurring_payments):
+        """
+        Process the recurring payments and return the RecurringPaymentRun
+        with the timing and counts of the run.
+        """
+        self.run_log = RecurringPaymentRun.objects.create(
+            start_dt=datetime.now(), num_workers=self.num_workers)
+        started = time.time()
+
+        for i, rp in enumerate(recurring_payments):
+            process = RecurringPaymentProcess(rp, self.verbosity, self.window)
+            self.queue.append((0, i, process, process.steps(), None))
+            self.run_log.num_recurring_payments += 1
+        heapq.heapify(self.queue)
+
+        workers = [threading.Thread(target=self.work)
+                   for i in range(min(self.num_workers, len(self.queue)))]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        self.run_log.end_dt = datetime.now()
+        self.run_log.elapsed = time.time() - started
+        self.run_log.save()
+        return self.run_log
+
+    def next_ready(self):
+        """
+        Wait for a process that is ready to run and take it off the
+        queue. Returns None once every process has finished.
+        """
+        with self.condition:
+            while True:
+                if not self.queue and not self.active:
+                    return None
+                wait = None
+                if self.queue:
+                    wait = self.queue[0][0] - time.time()
+                    if wait <= 0:
+                        self.active += 1
+                        return heapq.heappop(self.queue)
+                self.condition.wait(wait)
+
+    def work(self):
+        try:
+            while True:
+                item = self.next_ready()
+                if item is None:
+                    break
+                ready_at, seq, process, steps, waiting_for = item
+                ready_at, waiting_for = self.advance(process, steps, waiting_for)
+
+                with self.condition:
+                    self.active -= 1
+                    if ready_at is not None:
+                        heapq.heappush(self.queue,
+                                       (ready_at, seq, process, steps, waiting_for))
+                    self.condition.notify_all()
+        finally:
+            # each thread has its own connection
+            connection.close()
+
+    def advance(self, process, steps, waiting_for=None):
+        """
+        Run the process until its next transaction has to wait,
+        starting with the payment profile it was waiting for, if any.
+        Returns the time to continue at and the payment profile id
+        to reserve then, or (None, None) when it is done.
+        """
+        pending = [waiting_for] if waiting_for is not None else []
+        try:
+            for payment_profile_id in itertools.chain(pending, steps):
+                wait = self.window.reserve(payment_profile_id)
+                if wait > 0:
+                    return time.time() + wait, payment_profile_id
+        except Exception:
+            print 'Error processing "%s":' % process.rp
+            print traceback.format_exc()
+            self.record(process, error=True)
+            return None, None
+
+        self.record(process)
+        return None, None
+
+    def record(self, process, error=False):
+        with self.condition:
+            log = self.run_log
+            log.num_transactions += process.num_transactions
+            log.num_succeeded += process.num_processed
+            log.num_failed += process.num_failed
+            log.transaction_time += process.transaction_time
+            log.max_payment_time = max(log.max_payment_time, process.elapsed)
+            if error:
+                log.num_errors += 1
@@ -1,4 +1,5 @@
 from datetime import datetime
+import threading
 import time
 from decimal import Decimal
 from django.template.loader import render_to_string
@@ -203,15 +204,73 @@ class RecurringPaymentEmailNotices(object):
                 pass
             
             
-def run_a_recurring_payment(rp, verbosity=0):
+class DuplicateTransactionWindow(object):
     """
+    The payment gateway rejects a transaction on a payment profile
+    within a couple of minutes of the previous one as a duplicate.
+    Tracks when the next transaction of each profile may be sent.
+    """
+    def __init__(self, seconds=None):
+        if seconds is None:
+            seconds = getattr(settings, 'RECURRING_PAYMENTS_DUPLICATE_WINDOW', 3*60)
+        self.seconds = seconds
+        self.next_times = {}
+        self.lock = threading.Lock()
+
+    def reserve(self, payment_profile_id):
+        """
+        Reserve the payment profile for a transaction sent now.
+        Returns 0 when reserved, otherwise the number of seconds to
+        wait before calling reserve again.
+        """
+        with self.lock:
+            now = time.time()
+            wait = self.next_times.get(payment_profile_id, now) - now
+            if wait > 0:
+                return wait
+            # held until sent() records when the transaction went out
+            self.next_times[payment_profile_id] = now + self.seconds
+            return 0
+
+    def sent(self, payment_profile_id):
+        """
+        Start the window of the payment profile from a transaction
+        that has just returned.
+        """
+        with self.lock:
+            self.next_times[payment_profile_id] = time.time() + self.seconds
+
+
+class RecurringPaymentProcess(object):
+    """
+    The steps of processing a recurring payment:
         1) check and populate payment profile for each recurring payment entry.
         2) generate invoice(s) for recurring payments if needed.
         3) make payment transactions for invoice(s) upon due date.
         4) notify admins and customers for after each transaction.
+
+    steps() yields the payment profile id before each transaction, so
+    the caller can hold it back until window.reserve() succeeds for
+    that payment profile.
     """
-    num_processed = 0
-    if rp.status_detail == 'active':
+    def __init__(self, rp, verbosity=0, window=None):
+        self.rp = rp
+        self.verbosity = verbosity
+        self.window = window or DuplicateTransactionWindow()
+        self.num_processed = 0
+        self.num_transactions = 0
+        self.num_failed = 0
+        # seconds spent processing, and in transactions
+        self.elapsed = 0
+        self.transaction_time = 0
+
+    def steps(self):
+        rp = self.rp
+        verbosity = self.verbosity
+        if rp.status_detail != 'active':
+            return
+
+        started = time.time()
         rp_email_notice = RecurringPaymentEmailNotices()
         now = datetime.now()
         currency_symbol = get_setting('site', 'global', 'currencysymbol')
@@ -244,11 +303,7 @@ def run_a_recurring_payment(rp, verbosity=0):
             
             if payment_profiles:
         
-                for i, rp_invoice in enumerate(rp_invoices):
-                    # wait for 3 minutes (duplicate transaction window is 2 minutes) if this is not the first invoice,
-                    # otherwise, the payment gateway would through the "duplicate transaction" error.
-                    if i > 0: time.sleep(3*60)
-                    
+                for rp_invoice in rp_invoices:
                     payment_profile = payment_profiles[0]
                     if rp_invoice.last_payment_failed_dt and \
                         rp_invoice.last_payment_failed_dt > payment_profile.update_dt:
@@ -258,6 +313,14 @@ def run_a_recurring_payment(rp, verbosity=0):
                         last_error_code = rp_invoice.get_last_transaction_error_code()
                         if last_error_code and last_error_code in UNSUCCESSFUL_TRANS_CODE:
                             continue
+
+                    payment_profile_id = payment_profile.payment_profile_id
+
+                    # wait for the duplicate transaction window of the payment profile,
+                    # otherwise, the payment gateway would through the "duplicate transaction" error.
+                    self.elapsed += time.time() - started
+                    yield payment_profile_id
+                    started = time.time()
                     
                     # make payment transaction and then update recurring_payment fields
                     if verbosity > 1:
@@ -269,11 +332,13 @@ def run_a_recurring_payment(rp, verbosity=0):
                      
                     success = False    
                     
-                    payment_profile_id = payment_profile.payment_profile_id
                     payment_transaction = rp_invoice.make_payment_transaction(payment_profile_id)
+                    self.window.sent(payment_profile_id)
+                    self.num_transactions += 1
+                    self.transaction_time += time.time() - started
                     if payment_transaction.status:
                         success = True
-                        num_processed += 1
+                        self.num_processed += 1
                     
                     
                     if success:
@@ -283,6 +348,7 @@ def run_a_recurring_payment(rp, verbosity=0):
                         rp.num_billing_cycle_completed += 1
                         print '...Success.'
                     else:
+                        self.num_failed += 1
                         rp.num_billing_cycle_failed += 1
                         print '...Failed  - \n\t code - %s \n\t text - %s' \
                                             % (payment_transaction.message_code,
@@ -310,8 +376,23 @@ def run_a_recurring_payment(rp, verbosity=0):
         rp.balance = rp.get_current_balance()
         rp.outstanding_balance = rp.get_outstanding_balance()
         rp.save()
-        
-    return num_processed  
+        self.elapsed += time.time() - started
+
+
+def run_a_recurring_payment(rp, verbosity=0, window=None):
+    """
+    Process a recurring payment, waiting out the duplicate
+    transaction window between its transactions.
+    Returns the number of successful transactions.
+    """
+    window = window or DuplicateTransactionWindow()
+    process = RecurringPaymentProcess(rp, verbosity, window)
+    for payment_profile_id in process.steps():
+        wait = window.reserve(payment_profile_id)
+        while wait > 0:
+            time.sleep(wait)
+            wait = window.reserve(payment_profile_id)
+    return process.num_processed
 
 
 def api_rp_setup(data): 
@@ -15,7 +15,7 @@ from tendenci.core.perms.object_perms import ObjectPermission
 
 from tendenci.core.perms.decorators import is_enabled
 from tendenci.core.perms.utils import (update_perms_and_save, get_notice_recipients,
-    has_perm, has_view_perm, get_query_filters)
+    has_perm, has_view_perm, get_query_filters, distinct_if_needed)
 from tendenci.core.event_logs.models import EventLog
 from tendenci.core.meta.models import Meta as MetaTags
 from tendenci.core.meta.forms import MetaForm
@@ -83,7 +83,7 @@ def search(request, template_name="resumes/search.html"):
         resumes = Resume.objects.search(query, user=request.user)
     else:
         filters = get_query_filters(request.user, 'resumes.view_resume')
-        resumes = Resume.objects.filter(filters).distinct()
+        resumes = distinct_if_needed(Resume.objects.filter(filters))
         if request.user.is_authenticated():
             resumes = resumes.select_related()
     resumes = resumes.order_by('-create_dt')
@@ -17,7 +17,7 @@ from tendenci.apps.contacts.forms import ContactForm, SubmitContactForm
 from tendenci.apps.contacts.utils import listed_in_email_block
 from tendenci.apps.profiles.models import Profile
 from tendenci.core.perms.object_perms import ObjectPermission
-from tendenci.core.perms.utils import has_perm, has_view_perm, get_query_filters, get_notice_recipients
+from tendenci.core.perms.utils import has_perm, has_view_perm, get_query_filters, distinct_if_needed, get_notice_recipients
 from tendenci.core.event_logs.models import EventLog
 
 
@@ -46,7 +46,7 @@ def search(request, template_name="contacts/search.html"):
         contacts = Contact.objects.search(query, user=request.user)
     else:
         filters = get_query_filters(request.user, 'contacts.view_contact')
-        contacts = Contact.objects.filter(filters).distinct()
+        contacts = distinct_if_needed(Contact.objects.filter(filters))
         if not request.user.is_anonymous():
             contacts = contacts.select_related()
 
@@ -269,6 +269,7 @@ def index(request, form_class=SubmitContactForm, template_name="form.html"):
                 instance=contact,
                 user=contact_user,
                 action='submitted',
+                immediate=True,
                 **event_log_dict
             )
 
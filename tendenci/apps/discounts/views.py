@@ -10,7 +10,7 @@ from django.conf import settings
 
 from tendenci.core.base.http import Http403
 from tendenci.core.perms.decorators import is_enabled
-from tendenci.core.perms.utils import has_perm, update_perms_and_save, get_query_filters
+from tendenci.core.perms.utils import has_perm, update_perms_and_save, get_query_filters, distinct_if_needed
 from tendenci.core.event_logs.models import EventLog
 from tendenci.core.theme.shortcuts import themed_response as render_to_response
 from tendenci.core.exports.utils import run_export_task
@@ -28,7 +28,7 @@ def search(request, template_name="discounts/search.html"):
         raise Http403
 
     filters = get_query_filters(request.user, 'discounts.view_discount')
-    discounts = Discount.objects.filter(filters).distinct()
+    discounts = distinct_if_needed(Discount.objects.filter(filters))
     query = request.GET.get('q', None)
     if query:
         discounts = discounts.filter(discount_code__icontains=query)
@@ -10,7 +10,7 @@ from tendenci.apps.entities.models import Entity
 from tendenci.apps.entities.forms import EntityForm
 from tendenci.core.perms.object_perms import ObjectPermission
 from tendenci.core.event_logs.models import EventLog
-from tendenci.core.perms.utils import has_perm, update_perms_and_save, get_query_filters
+from tendenci.core.perms.utils import has_perm, update_perms_and_save, get_query_filters, distinct_if_needed
 
 
 def index(request, id=None, template_name="entities/view.html"):
@@ -27,7 +27,7 @@ def index(request, id=None, template_name="entities/view.html"):
 
 def search(request, template_name="entities/search.html"):
     filters = get_query_filters(request.user, 'entities.view_entity')
-    entities = Entity.objects.filter(filters).distinct()
+    entities = distinct_if_needed(Entity.objects.filter(filters))
 
     EventLog.objects.log()
 
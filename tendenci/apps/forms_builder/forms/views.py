@@ -26,7 +26,7 @@ from tendenci.core.theme.shortcuts import themed_response as render_to_response
 from tendenci.core.base.http import Http403
 from tendenci.core.base.utils import check_template, template_exists
 from tendenci.core.perms.utils import (has_perm, update_perms_and_save,
-    get_query_filters, has_view_perm)
+    get_query_filters, distinct_if_needed, has_view_perm)
 from tendenci.core.event_logs.models import EventLog
 from tendenci.core.site_settings.utils import get_setting
 from tendenci.apps.invoices.models import Invoice
@@ -353,7 +353,7 @@ def search(request, template_name="forms/search.html"):
         raise Http403
 
     filters = get_query_filters(request.user, 'forms.view_form')
-    forms = Form.objects.filter(filters).distinct()
+    forms = distinct_if_needed(Form.objects.filter(filters))
     query = request.GET.get('q', None)
     if query:
         forms = forms.filter(Q(title__icontains=query)|Q(intro__icontains=query)|Q(response__icontains=query))
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    """
+    Recompute the per-user invoice totals used by the top spenders
+    report when INVOICES_SPEND_SUMMARY is on.
+
+    Usage:
+        ./manage.py rebuild_spend_summary
+    """
+    help = 'Recompute the per-user invoice spend summary'
+
+    def handle(self, *args, **options):
+        from tendenci.apps.invoices.spending import rebuild_spend_summary
+
+        count = rebuild_spend_summary()
+        print "%d users with invoices" % count
@@ -9,6 +9,7 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         from tendenci.core.exports.models import Export
         from tendenci.apps.invoices.tasks import InvoiceExportTask
+        from tendenci.core.exports.utils import get_export_file_path
         if args:
 
             try:
@@ -24,7 +25,9 @@ class Command(BaseCommand):
             model = get_model(export.app_label, export.model_name)
             result = InvoiceExportTask()
             file_name = export.model_name + '.csv'
-            response = result.run(model, start_dt, end_dt, file_name)
+            # the csv is written to storage, the result is its path
+            response = result.run(model, start_dt, end_dt, file_name,
+                file_path=get_export_file_path(export, file_name))
 
             export.status = "completed"
             export.result = response
@@ -347,3 +347,25 @@ class Invoice(models.Model):
 
         # reverse accounting entries
         make_acct_entries_reversing(user, self, amount)
+
+
+class UserSpendSummary(models.Model):
+    """
+    The invoice total of a user, see invoices.spending.
+    Kept current on invoice save when INVOICES_SPEND_SUMMARY is on.
+    """
+    user = models.OneToOneField(User, related_name="spend_summary")
+    total = models.DecimalField(max_digits=15, decimal_places=2,
+                                default=0, db_index=True)
+    update_dt = models.DateTimeField(auto_now=True)
+
+    def __unicode__(self):
+        return u'%s: %s' % (self.user_id, self.total)
+
+
+from tendenci.apps.invoices.spending import (invoice_pre_save,
+    invoice_post_save, invoice_post_delete)
+
+models.signals.pre_save.connect(invoice_pre_save, sender=Invoice, weak=False)
+models.signals.post_save.connect(invoice_post_save, sender=Invoice, weak=False)
+models.signals.post_delete.connect(invoice_post_delete, sender=Invoice, weak=False)
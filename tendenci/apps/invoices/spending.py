@@ -0,0 +1,188 @@
+"""
+Invoice totals per user.
+
+An invoice counts towards a user who created it, owns it or whose
+email is its bill_to_email, and counts once when several of these
+apply. The totals are summed in one grouped query, and can be kept
+in UserSpendSummary, updated on invoice save, for the unfiltered
+top spenders report.
+"""
+import heapq
+from datetime import datetime
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import connection
+
+from tendenci.apps.invoices.models import Invoice, UserSpendSummary
+
+SPENDING_SQL = """
+    SELECT pairs.user_id, SUM(pairs.total)
+    FROM (
+        SELECT i.creator_id AS user_id, i.id AS invoice_id, i.total AS total
+        FROM %(invoice_table)s i
+        WHERE i.creator_id IS NOT NULL %(creator_where)s
+        UNION
+        SELECT i.owner_id, i.id, i.total
+        FROM %(invoice_table)s i
+        WHERE i.owner_id IS NOT NULL %(owner_where)s
+        UNION
+        SELECT u.id, i.id, i.total
+        FROM %(invoice_table)s i
+        INNER JOIN %(user_table)s u ON u.email = i.bill_to_email
+        WHERE i.bill_to_email <> '' %(email_where)s
+    ) pairs
+    GROUP BY pairs.user_id
+"""
+
+
+def summary_enabled():
+    return getattr(settings, 'INVOICES_SPEND_SUMMARY', False)
+
+
+def _in_clause(column, values):
+    if not values:
+        return '1 = 0', []
+    return '%s IN (%s)' % (column, ', '.join(['%s'] * len(values))), list(values)
+
+
+def get_user_totals(start_dt=None, end_dt=None, object_types=None, user_ids=None):
+    """
+    Yields (user_id, total) for every user with invoices.
+
+    start_dt and end_dt limit the invoices by create_dt, object_types
+    is a list of ContentTypes or their ids, and user_ids limits the
+    users totalled.
+    """
+    where, params = [], []
+    if start_dt:
+        where.append('i.create_dt >= %s')
+        params.append(start_dt)
+    if end_dt:
+        where.append('i.create_dt <= %s')
+        params.append(end_dt)
+    if object_types is not None:
+        clause, values = _in_clause('i.object_type_id',
+            [getattr(t, 'pk', t) for t in object_types])
+        where.append(clause)
+        params.extend(values)
+
+    # the same invoice filters apply to the three sources of pairs
+    wheres, all_params = {}, []
+    for name, user_column in (('creator_where', 'i.creator_id'),
+                              ('owner_where', 'i.owner_id'),
+                              ('email_where', 'u.id')):
+        source_where, source_params = list(where), list(params)
+        if user_ids is not None:
+            clause, values = _in_clause(user_column, user_ids)
+            source_where.append(clause)
+            source_params.extend(values)
+        wheres[name] = ''.join([' AND %s' % w for w in source_where])
+        all_params.extend(source_params)
+
+    sql = SPENDING_SQL % dict(wheres,
+        invoice_table=connection.ops.quote_name(Invoice._meta.db_table),
+        user_table=connection.ops.quote_name(User._meta.db_table))
+
+    cursor = connection.cursor()
+    cursor.execute(sql, all_params)
+    while True:
+        rows = cursor.fetchmany(1000)
+        if not rows:
+            break
+        for user_id, total in rows:
+            yield user_id, total
+
+
+def get_top_spenders(limit=20, start_dt=None, end_dt=None, object_types=None):
+    """
+    Returns [{'user': user, 'total': total}, ...] for the limit users
+    with the highest positive totals, highest first.
+    """
+    filtered = start_dt or end_dt or object_types is not None
+    if summary_enabled() and not filtered:
+        summaries = UserSpendSummary.objects.filter(total__gt=0).select_related(
+            'user').order_by('-total')[:limit]
+        return [{'user': s.user, 'total': s.total} for s in summaries]
+
+    # keep the top totals in a heap instead of sorting every user
+    top = heapq.nlargest(limit, ((total, user_id) for user_id, total in
+        get_user_totals(start_dt, end_dt, object_types) if total and total > 0))
+    users = User.objects.in_bulk([user_id for total, user_id in top])
+    return [{'user': users[user_id], 'total': total}
+            for total, user_id in top if user_id in users]
+
+
+def update_spend_summary(user_ids):
+    """
+    Recompute the UserSpendSummary of these users.
+    """
+    user_ids = set(user_ids)
+    if not user_ids:
+        return
+    totals = dict(get_user_totals(user_ids=user_ids))
+    existing = set(UserSpendSummary.objects.filter(
+        user__in=user_ids).values_list('user_id', flat=True))
+    now = datetime.now()
+    for user_id in user_ids:
+        total = totals.get(user_id) or 0
+        if user_id in existing:
+            UserSpendSummary.objects.filter(user=user_id).update(
+                total=total, update_dt=now)
+        else:
+            UserSpendSummary.objects.create(user_id=user_id, total=total)
+
+
+def rebuild_spend_summary():
+    """
+    Recompute the UserSpendSummary of every user.
+    Returns the number of users with invoices.
+    """
+    UserSpendSummary.objects.all().delete()
+    summaries = []
+    count = 0
+    for user_id, total in get_user_totals():
+        summaries.append(UserSpendSummary(user_id=user_id, total=total or 0))
+        count += 1
+        if len(summaries) >= 1000:
+            UserSpendSummary.objects.bulk_create(summaries)
+            summaries = []
+    if summaries:
+        UserSpendSummary.objects.bulk_create(summaries)
+    return count
+
+
+def get_attributed_user_ids(creator_id, owner_id, bill_to_email):
+    user_ids = set([creator_id, owner_id])
+    if bill_to_email:
+        user_ids.update(User.objects.filter(
+            email=bill_to_email).values_list('id', flat=True))
+    user_ids.discard(None)
+    return user_ids
+
+
+def invoice_pre_save(sender, instance, **kwargs):
+    """
+    Remember who the invoice counted towards before the save.
+    """
+    if not summary_enabled() or not instance.pk:
+        return
+    [old] = Invoice.objects.filter(pk=instance.pk).values_list(
+        'creator_id', 'owner_id', 'bill_to_email') or [None]
+    instance._spend_user_ids = get_attributed_user_ids(*old) if old else set()
+
+
+def invoice_post_save(sender, instance, **kwargs):
+    if not summary_enabled():
+        return
+    user_ids = get_attributed_user_ids(instance.creator_id,
+        instance.owner_id, instance.bill_to_email)
+    user_ids.update(getattr(instance, '_spend_user_ids', ()))
+    update_spend_summary(user_ids)
+
+
+def invoice_post_delete(sender, instance, **kwargs):
+    if not summary_enabled():
+        return
+    update_spend_summary(get_attributed_user_ids(instance.creator_id,
+        instance.owner_id, instance.bill_to_email))
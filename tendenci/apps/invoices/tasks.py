@@ -1,21 +1,18 @@
-import os
 from datetime import datetime
 
-from django.forms.models import model_to_dict
-from django.db.models.fields import DateTimeField
-from django.db.models.fields.related import ManyToManyField, ForeignKey
-from django.contrib.contenttypes import generic
 from celery.task import Task
-from tendenci.core.perms.models import TendenciBaseModel
-from tendenci.core.exports.utils import render_csv
+from tendenci.core.exports.utils import iter_export_rows, write_export_csv
 
 class InvoiceExportTask(Task):
     """Export Task for Celery
     This exports the entire queryset of a given TendenciBaseModel.
     """
     
-    def run(self, model, start_dt, end_dt, file_name, **kwargs):
-        """Create the xls file"""
+    def run(self, model, start_dt, end_dt, file_name, file_path=None, **kwargs):
+        """
+        Write the csv file to the default storage a chunk of
+        invoices at a time, and return the name it was saved under.
+        """
         fields = (
             'id',
             'guid',
@@ -92,36 +89,7 @@ class InvoiceExportTask(Task):
         start_dt_date = datetime.strptime(start_dt, "%Y-%m-%d")
         end_dt_date = datetime.strptime(end_dt, "%Y-%m-%d")
 
+        if file_path is None:
+            file_path = 'export/invoices/%s' % file_name
         items = model.objects.filter(status=True, tender_date__gte=start_dt_date, tender_date__lte=end_dt_date)
-        data_row_list = []
-        for item in items:
-            # get the available fields from the model's meta
-            opts = item._meta
-            d = {}
-            for f in opts.fields + opts.many_to_many:
-                if f.name in fields:  # include specified fields only
-                    if isinstance(f, ManyToManyField):
-                        value = ["%s" % obj for obj in f.value_from_object(item)]
-                    if isinstance(f, ForeignKey):
-                        value = getattr(item, f.name)
-                    if isinstance(f, generic.GenericRelation):
-                        generics = f.value_from_object(item).all()
-                        value = ["%s" % obj for obj in generics]
-                    if isinstance(f, DateTimeField):
-                        if f.value_from_object(item):
-                            value = f.value_from_object(item).strftime("%Y-%m-%d %H:%M")
-                    else:
-                        value = f.value_from_object(item)
-                    d[f.name] = value
-            
-            # append the accumulated values as a data row
-            # keep in mind the ordering of the fields
-            data_row = []
-            for field in fields:
-                # clean the derived values into unicode
-                value = unicode(d[field]).rstrip()
-                data_row.append(value)
-            
-            data_row_list.append(data_row)
-        
-        return render_csv(file_name, fields, data_row_list)
+        return write_export_csv(file_path, fields, iter_export_rows(items, fields))
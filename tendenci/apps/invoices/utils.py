@@ -1,8 +1,7 @@
-import subprocess
-
 from django.conf import settings
 
 from tendenci.core.exports.models import Export
+from tendenci.core.background_jobs.utils import enqueue
 
 
 def run_invoice_export_task(app_label, model_name, start_dt, end_dt):
@@ -12,7 +11,7 @@ def run_invoice_export_task(app_label, model_name, start_dt, end_dt):
     )
 
     if settings.USE_SUBPROCESS:
-        subprocess.Popen(['python', 'manage.py', 'run_invoice_export_task', unicode(export.pk), start_dt, end_dt])
+        enqueue('run_invoice_export_task', [export.pk, start_dt, end_dt])
     else:
         from django.core.management import call_command
         args = [unicode(export.pk), start_dt, end_dt]
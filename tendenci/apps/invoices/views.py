@@ -2,7 +2,7 @@ from __future__ import unicode_literals
 from datetime import datetime, time, timedelta
 
 from django.template import RequestContext
-from django.db.models import Sum, Q
+from django.db.models import Q
 from django.contrib import messages
 from django.contrib.auth.models import User
 from django.contrib.auth.decorators import login_required
@@ -23,6 +23,7 @@ from tendenci.apps.notifications.utils import send_notifications
 from tendenci.core.payments.forms import MarkAsPaidForm
 from tendenci.apps.invoices.utils import run_invoice_export_task
 from tendenci.apps.invoices.models import Invoice
+from tendenci.apps.invoices.spending import get_top_spenders
 from tendenci.apps.invoices.forms import AdminNotesForm, AdminAdjustForm, InvoiceSearchForm
 
 
@@ -474,14 +475,7 @@ def report_top_spenders(request, template_name="reports/top_spenders.html"):
     if not request.user.is_superuser:
         raise Http403
     
-    entry_list = []
-    users = User.objects.all()
-    for user in users:
-        invoices = Invoice.objects.filter(Q(creator=user) | Q(owner=user) | Q(bill_to_email=user.email)).aggregate(Sum('total'))
-        if invoices['total__sum'] is not None and invoices['total__sum'] > 0:
-            entry_list.append({'user':user, 'invoices':invoices})
-
-    entry_list = sorted(entry_list, key=lambda entry:entry['invoices']['total__sum'], reverse=True)[:20]
+    entry_list = get_top_spenders(20)
 
     return render_to_response(template_name, {
         'entry_list': entry_list,
@@ -1 +1,37 @@
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
 NAV_PRE_KEY = "nav"
+
+# rendered navs and their items
+NAV_CACHE_TIMEOUT = 432000  # 5 days
+# whether a visibility class can view a nav
+NAV_PERMS_CACHE_TIMEOUT = 60 * 10
+
+
+def get_nav_version_key(id):
+    return '.'.join([settings.CACHE_PRE_KEY, NAV_PRE_KEY, str(id), 'version'])
+
+
+def get_nav_version(id):
+    """
+    The keys of a nav's cached html, items and permissions include
+    this version, so changing it drops them all.
+    """
+    version = cache.get(get_nav_version_key(id))
+    if version is None:
+        version = bump_nav_version(id)
+    return version
+
+
+def bump_nav_version(id):
+    version = str(time.time())
+    cache.set(get_nav_version_key(id), version, NAV_CACHE_TIMEOUT)
+    return version
+
+
+def get_nav_cache_key(id, *parts):
+    keys = [settings.CACHE_PRE_KEY, NAV_PRE_KEY, str(id), get_nav_version(id)]
+    return '.'.join(keys + list(parts))
@@ -1,10 +1,12 @@
 from django.db import models
+from django.db.models.signals import post_save, post_delete
 from django.utils.translation import ugettext_lazy as _
 from django.contrib.contenttypes import generic
 
 from tendenci.core.perms.object_perms import ObjectPermission
 from tendenci.core.perms.models import TendenciBaseModel
 from tendenci.apps.pages.models import Page
+from tendenci.apps.navs.cache import bump_nav_version
 from tendenci.apps.navs.managers import NavManager
 from tendenci.libs.abstracts.models import OrderingBaseModel
 
@@ -60,6 +62,10 @@ class NavItem(OrderingBaseModel):
         """
         returns the item's direct children
         """
+        if hasattr(self, '_nav_children'):
+            # linked by navs.utils.build_nav_tree
+            return self._nav_children
+
         level = self.level or 0
         level_down = level + 1
         position = self.position or 0
@@ -90,8 +96,26 @@ class NavItem(OrderingBaseModel):
             ).order_by('position')
             return children
     
+    @property
+    def parent(self):
+        """
+        returns the item's parent, the closest item one level up before it
+        """
+        if hasattr(self, '_nav_parent'):
+            return self._nav_parent
+        if not self.level:
+            return None
+        parents = NavItem.objects.filter(
+            nav=self.nav,
+            level=self.level - 1,
+            position__lt=self.position or 0
+        ).order_by('-position')[:1]
+        return parents and parents[0] or None
+
     @property
     def next(self):
+        if hasattr(self, '_nav_next'):
+            return self._nav_next
         try:
             next = NavItem.objects.get(position=self.position+1, nav=self.nav)
         except NavItem.DoesNotExist:
@@ -100,6 +124,8 @@ class NavItem(OrderingBaseModel):
         
     @property
     def prev(self):
+        if hasattr(self, '_nav_prev'):
+            return self._nav_prev
         try:
             prev = NavItem.objects.get(position=self.position-1, nav=self.nav)
         except NavItem.DoesNotExist:
@@ -108,8 +134,9 @@ class NavItem(OrderingBaseModel):
     
     @property
     def next_range(self):
-        if self.next:
-            next = range(0, self.next.level-self.level)
+        next_item = self.next
+        if next_item:
+            next = range(0, next_item.level-self.level)
         else:
             #first item
             next = range(0, self.level+1)
@@ -117,9 +144,25 @@ class NavItem(OrderingBaseModel):
         
     @property
     def prev_range(self):
-        if self.prev:
-            prev = range(0, self.prev.level-self.level)
+        prev_item = self.prev
+        if prev_item:
+            prev = range(0, prev_item.level-self.level)
         else:
             #last item
             prev = range(0, self.level+1)
         return prev
+
+
+def clear_nav_cache(sender, instance, **kwargs):
+    """
+    Drops the cached html, items and permissions of the nav.
+    """
+    if isinstance(instance, NavItem):
+        bump_nav_version(instance.nav_id)
+    else:
+        bump_nav_version(instance.pk)
+
+post_save.connect(clear_nav_cache, sender=Nav, weak=False)
+post_delete.connect(clear_nav_cache, sender=Nav, weak=False)
+post_save.connect(clear_nav_cache, sender=NavItem, weak=False)
+post_delete.connect(clear_nav_cache, sender=NavItem, weak=False)
@@ -3,7 +3,7 @@ from tendenci.core.base.template_tags import ListNode, parse_tag_kwargs
 from tendenci.core.perms.utils import get_query_filters
 from django.contrib.auth.models import AnonymousUser, User
 from tendenci.apps.navs.models import Nav
-from tendenci.apps.navs.utils import get_nav, cache_nav
+from tendenci.apps.navs.utils import get_nav, cache_nav, can_view_nav, get_nav_tree
 
 register = Library()
 
@@ -50,7 +50,7 @@ def navigation(context, nav_id):
         return None
     context.update({
         "nav": nav,
-        "items": nav.top_items,
+        "items": get_nav_tree(nav.pk),
     })
     return context
 
@@ -68,7 +68,7 @@ def load_nav(context, nav_id):
         return None
     context.update({
         "nav": nav,
-        "items": nav.top_items,
+        "items": get_nav_tree(nav.pk),
     })
     return context
 
@@ -101,16 +101,13 @@ def nav(context, nav_id):
         pass
 
     try:
-        filters = get_query_filters(user, 'navs.view_nav')
-        navs = Nav.objects.filter(filters).filter(id=nav_id)
-        if user.is_authenticated():
-            if not user.profile.is_superuser:
-                navs = navs.distinct()
-
-        nav_object = navs[0]
+        # the permission check and the html are both cached
+        nav_object = can_view_nav(user, nav_id)
+        if not nav_object:
+            return None
         nav = get_nav(nav_object.pk)
         if not nav:
-            cache_nav(nav_object)
+            nav = cache_nav(nav_object)
     except:
         return None
 
@@ -2,26 +2,103 @@ from django.core.cache import cache
 from django.conf import settings
 from django.template.loader import render_to_string
 from django.forms.models import model_to_dict
-from tendenci.apps.navs.cache import NAV_PRE_KEY
-from tendenci.apps.navs.models import Nav
+from tendenci.apps.navs.cache import (NAV_CACHE_TIMEOUT, NAV_PERMS_CACHE_TIMEOUT,
+    get_nav_cache_key)
+from tendenci.apps.navs.models import Nav, NavItem
+from tendenci.core.perms.utils import get_query_filters
+from tendenci.core.perms.visibility import get_visibility_class
+
+
+def build_nav_tree(items):
+    """
+    Links the items of a nav, ordered by position, in one pass and
+    returns the top level items. Each item's children, parent, next
+    and prev are then read without queries.
+
+    An item's children are the items one level down that follow it
+    before the next item of its level or above.
+    """
+    by_position = {}
+    for item in items:
+        item._nav_children = []
+        item._nav_parent = None
+        by_position.setdefault(item.position or 0, item)
+
+    top_items = []
+    ancestors = []
+    for item in items:
+        level = item.level or 0
+        while ancestors and (ancestors[-1].level or 0) >= level:
+            ancestors.pop()
+        if level == 0:
+            top_items.append(item)
+        elif ancestors and (ancestors[-1].level or 0) == level - 1:
+            item._nav_parent = ancestors[-1]
+            ancestors[-1]._nav_children.append(item)
+        ancestors.append(item)
+
+        position = item.position or 0
+        item._nav_next = by_position.get(position + 1)
+        item._nav_prev = by_position.get(position - 1)
+
+    return top_items
+
+
+def get_nav_items(nav_id):
+    """
+    Returns all items of the nav ordered by position,
+    from one query or from the cache.
+    """
+    key = get_nav_cache_key(nav_id, 'items')
+    items = cache.get(key)
+    if items is None:
+        items = list(NavItem.objects.filter(nav=nav_id).select_related('page').order_by('position'))
+        cache.set(key, items, NAV_CACHE_TIMEOUT)
+    return items
+
+
+def get_nav_tree(nav_id):
+    """
+    Returns the top level items of the nav, linked to their children.
+    """
+    return build_nav_tree(get_nav_items(nav_id))
+
+
+def can_view_nav(user, nav_id):
+    """
+    Returns the nav if the user can view it, else None. The answer
+    is cached per visibility class.
+    """
+    key = get_nav_cache_key(nav_id, 'perms', get_visibility_class(user))
+    nav = cache.get(key)
+    if nav is None:
+        filters = get_query_filters(user, 'navs.view_nav')
+        navs = Nav.objects.filter(filters).filter(id=nav_id)
+        if user.is_authenticated():
+            if not user.profile.is_superuser:
+                navs = navs.distinct()
+        navs = list(navs[:1])
+        # False for a nav the user can't view
+        nav = navs and navs[0] or False
+        cache.set(key, nav, NAV_PERMS_CACHE_TIMEOUT)
+    return nav or None
+
 
 def cache_nav(nav):
     """
     Caches a nav's rendered html code
     """
-    
-    keys = [settings.CACHE_PRE_KEY, NAV_PRE_KEY, str(nav.id)]
-    key = '.'.join(keys)
+    key = get_nav_cache_key(nav.id, 'html')
     value = render_to_string("navs/render_nav.html", {'nav':nav})
-    is_set = cache.add(key, value, 432000) #5 days
+    is_set = cache.add(key, value, NAV_CACHE_TIMEOUT)
     if not is_set:
-        cache.set(key, value, 432000) #5 days
-        
+        cache.set(key, value, NAV_CACHE_TIMEOUT)
+    return value
+
 def get_nav(id):
     """
     Get the nav from the cache.
     """
-    keys = [settings.CACHE_PRE_KEY, NAV_PRE_KEY, str(id)]
-    key = '.'.join(keys)
+    key = get_nav_cache_key(id, 'html')
     nav = cache.get(key)
     return nav
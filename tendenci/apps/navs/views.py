@@ -15,7 +15,7 @@ from tendenci.core.base.http import Http403
 from tendenci.core.event_logs.models import EventLog
 from tendenci.core.site_settings.utils import get_setting
 from tendenci.core.perms.decorators import is_enabled
-from tendenci.core.perms.utils import has_perm, update_perms_and_save, get_query_filters, has_view_perm
+from tendenci.core.perms.utils import has_perm, update_perms_and_save, get_query_filters, distinct_if_needed, has_view_perm
 from tendenci.apps.pages.models import Page
 from tendenci.core.exports.utils import run_export_task
 
@@ -30,7 +30,7 @@ def search(request, template_name="navs/search.html"):
     query = request.GET.get('q', None)
 
     filters = get_query_filters(request.user, 'navs.view_nav')
-    navs = Nav.objects.filter(filters).distinct()
+    navs = distinct_if_needed(Nav.objects.filter(filters))
     if query:
         navs = navs.filter(Q(title__icontains=query)|Q(description__icontains=query))
 
@@ -3,6 +3,7 @@ import sys
 import time
 import logging
 import traceback
+from itertools import groupby
 
 try:
     import cPickle as pickle
@@ -45,13 +46,20 @@ def send_all():
         try:
             for queued_batch in NoticeQueueBatch.objects.all():
                 notices = pickle.loads(str(queued_batch.pickled_data).decode("base64"))
-                for user, label, extra_context, on_site in notices:
-                    user = User.objects.get(pk=user)
-                    logging.info("emitting notice to %s" % user)
-                    # call this once per user to be atomic and allow for logging to
-                    # accurately show how long each takes.
-                    notification.send_now([user], label, extra_context, on_site)
-                    sent += 1
+                users = User.objects.in_bulk([notice[0] for notice in notices])
+                # queue() stores one notice per user with the same label and
+                # extra_context, send the users of a notice together so the
+                # templates are rendered once for all of them
+                for key, group in groupby(notices, lambda n: (n[1], id(n[2]), n[3])):
+                    group = list(group)
+                    label, extra_context, on_site = group[0][1:]
+                    recipients = [users[n[0]] for n in group if n[0] in users]
+                    if len(recipients) < len(group):
+                        logging.warning("%d users of %s notice no longer exist" % (
+                            len(group) - len(recipients), label))
+                    logging.info("emitting %s notice to %d users" % (label, len(recipients)))
+                    notification.send_now(recipients, label, extra_context, on_site)
+                    sent += len(recipients)
                 queued_batch.delete()
                 batches += 1
         except:
@@ -29,9 +29,14 @@ from django.utils.translation import ugettext_lazy as _
 from django.utils.translation import ugettext, get_language, activate
 
 from tendenci.core.site_settings.utils import get_setting
+from tendenci.core.emails.mailer import send_messages
+from tendenci.apps.notifications.rendering import NoticeTemplates
 
 QUEUE_ALL = getattr(settings, "NOTIFICATION_QUEUE_ALL", False)
 
+# rows per query when notices are sent to many users
+BULK_CREATE_SIZE = getattr(settings, "NOTIFICATION_BULK_CREATE_SIZE", 500)
+
 
 class LanguageStoreNotAvailable(Exception):
     pass
@@ -95,6 +100,30 @@ def get_notification_setting(user, notice_type, medium, *args, **kwargs):
         return setting
 
 
+def get_notification_settings(users, notice_type, medium, *args, **kwargs):
+    """
+    Returns {user id: NoticeSetting} for the users, creating the
+    missing settings together like get_notification_setting does.
+    """
+    user_ids = [user.pk for user in users]
+    settings_by_user = {}
+    for i in range(0, len(user_ids), BULK_CREATE_SIZE):
+        for setting in NoticeSetting.objects.filter(notice_type=notice_type,
+                medium=medium, user__in=user_ids[i:i + BULK_CREATE_SIZE]):
+            settings_by_user[setting.user_id] = setting
+
+    # for now default it to false, they have to opt in to get emails
+    send = kwargs.get('send', False)
+    missing = [NoticeSetting(user_id=user_id, notice_type=notice_type,
+                             medium=medium, send=send)
+               for user_id in set(user_ids) if user_id not in settings_by_user]
+    for i in range(0, len(missing), BULK_CREATE_SIZE):
+        NoticeSetting.objects.bulk_create(missing[i:i + BULK_CREATE_SIZE])
+    for setting in missing:
+        settings_by_user[setting.user_id] = setting
+    return settings_by_user
+
+
 def should_send(user, notice_type, medium, *args, **kwargs):
     return get_notification_setting(user, notice_type, medium, *args, **kwargs).send
 
@@ -281,6 +310,31 @@ def get_notification_language(user):
     raise LanguageStoreNotAvailable
 
 
+def get_notification_languages(users):
+    """
+    Returns {user id: language} of the users, with one query to the
+    language store instead of one per user. Users without a language,
+    or all of them if the site does not use translated notifications,
+    are left out.
+    """
+    if not getattr(settings, 'NOTIFICATION_LANGUAGE_MODULE', False):
+        return {}
+    try:
+        app_label, model_name = settings.NOTIFICATION_LANGUAGE_MODULE.split('.')
+        model = models.get_model(app_label, model_name)
+    except (ImportError, ImproperlyConfigured, ValueError):
+        return {}
+    if model is None or 'language' not in [f.name for f in model._meta.fields]:
+        return {}
+
+    languages = {}
+    user_ids = [user.pk for user in users]
+    for i in range(0, len(user_ids), BULK_CREATE_SIZE):
+        languages.update(model._default_manager.filter(
+            user__in=user_ids[i:i + BULK_CREATE_SIZE]).values_list('user', 'language'))
+    return languages
+
+
 def get_formatted_messages(formats, label, context):
     """
     Returns a dictionary with the format identifier as the key. The values are
@@ -401,6 +455,7 @@ def send_emails(emails, label, extra_context=None, on_site=True):
         # headers = {'Content-Type': 'text/plain'}
         content_type = 'text'
 
+    email_messages = []
     for email_addr in emails:
         recipients = [email_addr]
 
@@ -411,11 +466,11 @@ def send_emails(emails, label, extra_context=None, on_site=True):
             email = EmailMessage(subject, body, sender,
                                  recipients, headers=headers)
         email.content_subtype = content_type
+        email_messages.append(email)
 
-        try:
-            email.send(fail_silently=True)  # should we raise exception or not?
-        except UnicodeError:
-            pass
+    # sent in batches over shared connections,
+    # messages that can't be encoded are skipped
+    send_messages(email_messages, fail_silently=True)
 
     to = ','.join(emails)
     bcc = ','.join(recipient_bcc)
@@ -478,60 +533,60 @@ def send_now(users, label, extra_context=None, on_site=True, *args, **kwargs):
             'notice.html',
         )  # TODO make formats configurable
 
+        # compiled once, the renderings that don't use
+        # the user are shared by every user of a language
+        templates = NoticeTemplates(label, formats)
+
+        # test for request in the extra_context
+        request = extra_context.get('request')
+        if request is not None:
+            context = RequestContext(request)
+        else:
+            context = Context()
+
+        users = list(users)
+        languages = get_notification_languages(users)
+        settings_by_user = get_notification_settings(users, notice_type, "1", send=send)
+
+        notices = []
+        email_messages = []
         for user in users:
-            recipients = []
-            headers = {}
             # get user language for user from language store defined in
             # NOTIFICATION_LANGUAGE_MODULE setting
-            try:
-                language = get_notification_language(user)
-            except LanguageStoreNotAvailable:
-                language = None
-
+            language = languages.get(user.pk)
             if language is not None:
                 # activate the user's language
                 activate(language)
-
-            # test for request in the extra_context
-            if 'request' in extra_context.keys():
-                context = RequestContext(extra_context['request'])
-                extra_context.update({
-                    "user": user,
-                    "notice": ugettext(notice_type.display),
-                    "notices_url": notices_url,
-                    "current_site": current_site,
-                })
-                context.update(extra_context)
             else:
-                # update context with user specific translations
-                context = Context({
-                    "user": user,
-                    "notice": ugettext(notice_type.display),
-                    "notices_url": notices_url,
-                    "current_site": current_site,
-                })
+                activate(current_language)
+
+            # update context with user specific translations
+            user_context = {
+                "user": user,
+                "notice": ugettext(notice_type.display),
+                "notices_url": notices_url,
+                "current_site": current_site,
+            }
+            if request is not None:
+                context.update(dict(extra_context, **user_context))
+                pushed = 1
+            else:
+                context.update(user_context)
                 context.update(extra_context)
+                pushed = 2
+            try:
+                messages, subject, body = templates.render(context, language)
+            finally:
+                for i in range(pushed):
+                    context.pop()
 
-            # get prerendered format messages
-            messages = get_formatted_messages(formats, label, context)
-
-            # Strip newlines from subject
-            subject = ''.join(render_to_string('notification/email_subject.txt', {
-                'message': messages['short'][0],
-            }, context).splitlines())
-
-            body = render_to_string('notification/email_body.txt', {
-                'message': messages['full'][0],
-            }, context)
-
-            Notice.objects.create(user=user,
+            notices.append(Notice(user=user,
                                   message=messages['notice'][0],
                                   notice_type=notice_type,
-                                  on_site=on_site)
-            if should_send(user, notice_type, "1", send=send) and user.email:  # Email
-                recipients.append(user.email)
+                                  on_site=on_site))
 
-            recipients.append('eloyz.email@gmail.com')
+            if not (settings_by_user[user.pk].send and user.email):  # Email
+                continue
 
             if messages['full'][1] == '.html':
                 # headers = {'Content-Type': 'text/html'}
@@ -540,13 +595,18 @@ def send_now(users, label, extra_context=None, on_site=True, *args, **kwargs):
                 # headers = {'Content-Type': 'text/plain'}
                 content_type = 'text'
 
-            email = EmailMessage(subject, body, settings.DEFAULT_FROM_EMAIL, recipients, headers=headers)
+            email = EmailMessage(subject, body, settings.DEFAULT_FROM_EMAIL, [user.email])
             email.content_subtype = content_type
-            email.send()
+            email_messages.append(email)
 
         # reset environment to original language
         activate(current_language)
 
+        for i in range(0, len(notices), BULK_CREATE_SIZE):
+            Notice.objects.bulk_create(notices[i:i + BULK_CREATE_SIZE])
+
+        send_messages(email_messages)
+
 
 def send(*args, **kwargs):
     """
@@ -0,0 +1,178 @@
+"""
+Renders notice templates once for many recipients.
+
+A notice sent to thousands of users is usually the same text for all
+of them. NoticeTemplates compiles the templates of a notice type once,
+finds out which of them use per-recipient variables such as "user",
+and renders the others once per language instead of once per user.
+"""
+from os.path import splitext
+
+from django.template import Template, Variable, FilterExpression, Node, NodeList
+from django.template.base import Token, TOKEN_VAR
+from django.template.loader import get_template, select_template
+from django.template.loader_tags import ExtendsNode, IncludeNode
+
+# the variables send_now sets for each recipient
+RECIPIENT_VARIABLES = ('user',)
+
+INSPECTED_TAG_MODULES = (
+    'django.template.base',
+    'django.template.defaulttags',
+    'django.template.loader_tags',
+    'django.template.smartif',
+    'django.templatetags.i18n',
+)
+
+
+def _root_name(lookup):
+    return lookup.split('.')[0]
+
+
+def _collect(value, names, seen):
+    """
+    Add the context variables used by value, a node or one of
+    its attributes, to names. Returns False when a node can't be
+    inspected and could use any variable.
+    """
+    if id(value) in seen:
+        return True
+    seen.add(id(value))
+
+    if isinstance(value, Template):
+        return _collect(value.nodelist, names, seen)
+    if isinstance(value, Variable):
+        if value.lookups:
+            names.add(value.lookups[0])
+        return True
+    if isinstance(value, FilterExpression):
+        ok = _collect(value.var, names, seen)
+        for func, args in value.filters:
+            for lookup, arg in args:
+                if lookup:
+                    ok = _collect(arg, names, seen) and ok
+        return ok
+    if isinstance(value, Token):
+        if value.token_type == TOKEN_VAR:
+            names.add(_root_name(value.contents))
+        return True
+    if isinstance(value, (list, tuple, NodeList)):
+        return all([_collect(v, names, seen) for v in value])
+    if isinstance(value, dict):
+        return all([_collect(v, names, seen) for v in value.values()])
+    if isinstance(value, Node):
+        # other tags may look up variables by name at render
+        # time, only these are known to use FilterExpressions
+        if type(value).__module__ not in INSPECTED_TAG_MODULES:
+            return False
+        if isinstance(value, IncludeNode):
+            # the template to include is only known at render time
+            return False
+        if isinstance(value, ExtendsNode):
+            parent = value.parent_name.var
+            if not isinstance(parent, basestring):
+                return False
+            ok = _collect(get_template(parent), names, seen)
+            return _collect(value.nodelist, names, seen) and ok
+        return all([_collect(v, names, seen) for v in value.__dict__.values()])
+    if type(value).__module__ in INSPECTED_TAG_MODULES and hasattr(value, '__dict__'):
+        # the conditions of {% if %}
+        return all([_collect(v, names, seen) for v in value.__dict__.values()])
+    return True
+
+
+def template_variables(template):
+    """
+    Returns the set of context variables the template uses, or None
+    if they can't all be known before rendering.
+    """
+    names = set()
+    if not _collect(template, names, set()):
+        return None
+    return names
+
+
+def uses_recipient(template, recipient_variables=RECIPIENT_VARIABLES):
+    names = template_variables(template)
+    if names is None:
+        return True
+    return bool(names.intersection(recipient_variables))
+
+
+class NoticeTemplates(object):
+    """
+    The compiled templates of one notice type. render() reuses the
+    renderings that don't depend on the user for the other users, so
+    the context should only differ by user between calls.
+
+    The shared renderings are kept per language, so the instance
+    can be used for users of any language within one send.
+    """
+    def __init__(self, label, formats):
+        self.formats = formats
+        self.templates = {}
+        self.per_recipient = set()
+        for format in formats:
+            self.templates[format] = select_template((
+                'notification/%s/%s' % (label, format),
+                'notification/%s' % format))
+        self.templates['subject'] = get_template('notification/email_subject.txt')
+        self.templates['body'] = get_template('notification/email_body.txt')
+        for key, template in self.templates.items():
+            if uses_recipient(template):
+                self.per_recipient.add(key)
+
+        # the subject and body include the short and full messages
+        for format in formats:
+            if format in self.per_recipient:
+                if splitext(format)[0] == 'short':
+                    self.per_recipient.add('subject')
+                elif splitext(format)[0] == 'full':
+                    self.per_recipient.add('body')
+
+        self.shared = {}
+
+    def _render(self, key, context, extra=None):
+        # turn off autoescaping for .txt like get_formatted_messages
+        context.autoescape = not key.endswith('.txt')
+        if extra:
+            context.update(extra)
+        try:
+            return self.templates[key].render(context)
+        finally:
+            if extra:
+                context.pop()
+
+    def render(self, context, language=None):
+        """
+        Returns (messages, subject, body) for the user in the context,
+        where messages is {format name: (rendered, extension)} as
+        returned by get_formatted_messages.
+        """
+        shared = self.shared.setdefault(language, {})
+        rendered = {}
+        for key in self.formats:
+            if key in self.per_recipient:
+                rendered[key] = self._render(key, context)
+            else:
+                if key not in shared:
+                    shared[key] = self._render(key, context)
+                rendered[key] = shared[key]
+
+        messages = {}
+        for format in self.formats:
+            name, ext = splitext(format)
+            messages[name] = (rendered[format], ext)
+
+        for key, message in (('subject', messages['short'][0]),
+                             ('body', messages['full'][0])):
+            if key in self.per_recipient:
+                rendered[key] = self._render(key, context, {'message': message})
+            else:
+                if key not in shared:
+                    shared[key] = self._render(key, context, {'message': message})
+                rendered[key] = shared[key]
+
+        # Strip newlines from subject
+        subject = ''.join(rendered['subject'].splitlines())
+        return messages, subject, rendered['body']
@@ -22,7 +22,7 @@ from tendenci.core.perms.utils import (update_perms_and_save,
                                        get_notice_recipients,
                                        has_perm,
                                        has_view_perm,
-                                       get_query_filters)
+                                       get_query_filters, distinct_if_needed)
 from tendenci.core.categories.forms import CategoryForm
 from tendenci.core.categories.models import Category
 from tendenci.core.theme.shortcuts import themed_response as render_to_response
@@ -99,7 +99,7 @@ def search(request, template_name="pages/search.html"):
         pages = Page.objects.search(query, user=request.user)
     else:
         filters = get_query_filters(request.user, 'pages.view_page')
-        pages = Page.objects.filter(filters).distinct()
+        pages = distinct_if_needed(Page.objects.filter(filters))
         if query:
             pages = pages.filter(Q(title__icontains=query) \
                              | Q(content__icontains=query) \
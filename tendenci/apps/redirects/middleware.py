@@ -1,4 +1,6 @@
-from django.core.urlresolvers import resolve
+from django.db.models import F
+
+from tendenci.apps.redirects.utils import engine
 
 
 class RedirectMiddleware(object):
@@ -7,24 +9,15 @@ class RedirectMiddleware(object):
             return response  # No need to check for a redirect for non-404 responses.
 
         path = request.get_full_path()
+        redirect_response = engine.get_response(path)
+        if redirect_response:
+            return redirect_response
+
+        # No redirect was found. Return the response.
+        # Log the 404 with a single atomic update.
+        # Truncate to only get the first 200 characters
         from tendenci.core.handler404.models import Report404
-        try:
-            redirect, args, kwargs = resolve(path, urlconf='tendenci.apps.redirects.dynamic_urls')
-            args = [value for value in kwargs.values()]
-            to_url = kwargs.pop('url')
-            for key in kwargs.keys():
-                to_url = to_url.replace("(%s)" % key, kwargs[key])
-            args[0] = to_url
-            return redirect(request, *args)
-        except Exception, e:
-            # No redirect was found. Return the response.
-            # Log the 404
-            report_list = Report404.objects.filter(url=path)[:1]
-            if report_list:
-                report = report_list[0]
-                report.count = report.count + 1
-            else:
-                # Truncate to only get the first 200 characters
-                report = Report404(url=path[:200])
-            report.save()
-            return response
+        url = path[:200]
+        if not Report404.objects.filter(url=url).update(count=F('count') + 1):
+            Report404.objects.create(url=url)
+        return response
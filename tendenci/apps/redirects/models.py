@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.signals import post_save, post_delete
 from django.utils.translation import ugettext_lazy as _
 
 from tendenci.apps.redirects.managers import RedirectManager
@@ -33,3 +34,11 @@ class Redirect(models.Model):
             return "Redirect from App: %s" % self.from_app
         else:
             return "Redirect from URL: %s" % self.from_url
+
+
+def redirects_changed(sender, **kwargs):
+    from tendenci.apps.redirects.utils import bump_redirects_version
+    bump_redirects_version()
+
+post_save.connect(redirects_changed, sender=Redirect, weak=False)
+post_delete.connect(redirects_changed, sender=Redirect, weak=False)
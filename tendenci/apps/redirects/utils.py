@@ -1,42 +1,155 @@
-from django.conf.urls.defaults import url, patterns
+import re
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponsePermanentRedirect, HttpResponseRedirect
+
 from tendenci.apps.redirects.models import Redirect
 
-def group_aruments(seq, group=254):
+# python's re module only supports 100 groups per pattern
+MAX_GROUPS = 99
+
+NAMED_GROUP_RE = re.compile(r'\(\?P([<=])(\w+)')
+
+
+def get_version_key():
+    return '.'.join([settings.CACHE_PRE_KEY, 'redirects', 'version'])
+
+
+def bump_redirects_version():
     """
-        group the list into lists of 254 items each. 
-        
-        This is due to argument restrictions in python.
-        http://docs.djangoproject.com/en/dev/topics/http/urls/#patterns
+    Every process reloads its redirects on the next 404.
     """
-    return (seq[pos:pos + group] for pos in range(0, len(seq), group))
-    
-def get_redirect_patterns():
+    cache.set(get_version_key(), time.time())
+    engine.invalidate()
+
+
+def normalize_path(path):
     """
-        Gets the redirect patterns out of the database
-        and assigns them to the django patterns object. 
+    Strip the leading slash and one trailing slash the
+    same way the old ^from_url/?$ url patterns did.
     """
-    redirects = Redirect.objects.filter(status=True).order_by('uses_regex')
-    url_patterns = []
-    url_list = []
-    for redirect in redirects:
-        extra = {}
-        pattern = r'^%s/?$' % redirect.from_url
-
-        if 'http' in redirect.to_url:
-            extra.update({'url':'%s' % redirect.to_url}) 
-        elif 'https' in redirect.to_url:
-            extra.update({'url':'%s' % redirect.to_url}) 
-        else:
-            extra.update({'url':'/%s' % redirect.to_url}) 
-
-        if redirect.http_status == 302:
-            extra.update({'permanent': False})
-            url_list.append(url(pattern, 'redirect_to', extra))
-        else:
-            url_list.append(url(pattern, 'redirect_to', extra))
-    arg_groups = list(group_aruments(url_list))
-    
-    for args in arg_groups:
-        url_patterns += patterns('django.views.generic.simple',*args)
-        
-    return url_patterns
+    if path.startswith('/'):
+        path = path[1:]
+    if path.endswith('/'):
+        path = path[:-1]
+    return path
+
+
+def build_to_url(to_url):
+    if 'http' in to_url:
+        return to_url
+    return '/%s' % to_url
+
+
+class RedirectEngine(object):
+    """
+    Finds the active Redirect for a 404 path.
+
+    Redirects that do not use a regular expression are looked up in
+    a dict keyed by their normalized From URL. Regex redirects are
+    combined into as few compiled patterns as python's group limit
+    allows, each redirect wrapped in its own group so the match tells
+    which redirect won. The redirects are reloaded when the version
+    key in the cache changes.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = None
+        self._index = None
+
+    def invalidate(self):
+        self._index = None
+
+    def load(self):
+        exact = {}
+        chunks = []
+        chunk, targets, num_groups = [], {}, 0
+
+        redirects = Redirect.objects.filter(status=True).exclude(from_url='')
+        for redirect in redirects.order_by('uses_regex', 'pk'):
+            target = (build_to_url(redirect.to_url), redirect.http_status)
+
+            if not redirect.uses_regex:
+                exact.setdefault(normalize_path(redirect.from_url), target)
+                continue
+
+            pattern = r'^%s/?$' % redirect.from_url
+            try:
+                groups = re.compile(pattern).groups + 1
+            except re.error:
+                continue  # skip patterns that do not compile
+
+            if groups > MAX_GROUPS:
+                continue
+            if num_groups + groups > MAX_GROUPS:
+                chunks.append((chunk, targets))
+                chunk, targets, num_groups = [], {}, 0
+
+            # prefix the named groups so redirects
+            # can reuse names like (?P<slug>...)
+            prefix = 'r%d_' % redirect.pk
+            pattern = NAMED_GROUP_RE.sub(
+                lambda m: '(?P%s%s%s' % (m.group(1), prefix, m.group(2)), pattern)
+
+            targets[num_groups + 1] = (prefix,) + target
+            chunk.append('(%s)' % pattern)
+            num_groups += groups
+
+        if chunk:
+            chunks.append((chunk, targets))
+
+        patterns = [(re.compile('|'.join(c)), t) for c, t in chunks]
+        return (exact, patterns)
+
+    def get_index(self):
+        """
+        Returns (exact, patterns), reloading them when
+        the version key in the cache has changed.
+        """
+        version = cache.get(get_version_key())
+        index = self._index
+        if index is None or version != self._version:
+            with self._lock:
+                index = self._index = self.load()
+                self._version = version
+        return index
+
+    def match(self, path):
+        """
+        Returns (to_url, http_status) for the path or None.
+        """
+        exact, patterns = self.get_index()
+        path = path[1:] if path.startswith('/') else path
+
+        target = exact.get(normalize_path(path))
+        if target:
+            return target
+
+        for pattern, targets in patterns:
+            m = pattern.match(path)
+            if m:
+                prefix, to_url, http_status = targets[m.lastindex]
+                for key, value in m.groupdict().items():
+                    if key.startswith(prefix) and value is not None:
+                        to_url = to_url.replace("(%s)" % key[len(prefix):], value)
+                return (to_url, http_status)
+
+        return None
+
+    def get_response(self, path):
+        """
+        Returns a redirect response for the path or None.
+        """
+        target = self.match(path)
+        if not target:
+            return None
+        to_url, http_status = target
+        if http_status == 302:
+            return HttpResponseRedirect(to_url)
+        return HttpResponsePermanentRedirect(to_url)
+
+
+engine = RedirectEngine()
@@ -6,14 +6,13 @@ from django.core.urlresolvers import reverse
 from django.contrib import messages
 
 from tendenci.core.base.http import Http403
-from tendenci.core.perms.utils import has_perm, get_query_filters
+from tendenci.core.perms.utils import has_perm, get_query_filters, distinct_if_needed
 from tendenci.core.site_settings.utils import get_setting
 from tendenci.core.theme.shortcuts import themed_response as render_to_response
 from tendenci.core.exports.utils import run_export_task
 
 from tendenci.apps.redirects.models import Redirect
 from tendenci.apps.redirects.forms import RedirectForm
-from tendenci.apps.redirects import dynamic_urls
 
 
 @login_required
@@ -30,7 +29,7 @@ def search(request, template_name="redirects/search.html"):
         redirects = Redirect.objects.search(query, user=request.user)
     else:
         filters = get_query_filters(request.user, 'redirects.add_redirect')
-        redirects = Redirect.objects.filter(filters).distinct()
+        redirects = distinct_if_needed(Redirect.objects.filter(filters))
         if request.user.is_authenticated():
             redirects = redirects.select_related()
         redirects = redirects.order_by('-create_dt')
@@ -58,9 +57,6 @@ def add(request, form_class=RedirectForm, template_name="redirects/add.html"):
 
             messages.add_message(request, messages.SUCCESS, 'Successfully added %s' % redirect)
 
-            # reload the urls
-            reload(dynamic_urls)
-
             return HttpResponseRedirect(reverse('redirects'))
     else:
         form = form_class()
@@ -84,10 +80,7 @@ def edit(request, id, form_class=RedirectForm, template_name="redirects/edit.htm
             redirect.save() # get pk
             
             messages.add_message(request, messages.SUCCESS, 'Successfully edited %s' % redirect)
- 
-            # reload the urls
-            reload(dynamic_urls)
-                       
+
             return HttpResponseRedirect(reverse('redirects'))
        
     return render_to_response(template_name, {'redirect': redirect,'form':form}, context_instance=RequestContext(request))
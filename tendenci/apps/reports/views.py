@@ -1,5 +1,4 @@
 from datetime import datetime, timedelta
-import subprocess
 
 from django.views.generic import DetailView, ListView, CreateView
 from django.utils.decorators import method_decorator
@@ -9,6 +8,7 @@ from django.http import HttpResponseRedirect
 from johnny.cache import invalidate
 
 from tendenci.core.perms.decorators import superuser_required
+from tendenci.core.background_jobs.utils import enqueue
 from tendenci.apps.reports.models import Report, Run
 from tendenci.apps.reports.forms import ReportForm, RunForm
 
@@ -89,7 +89,7 @@ class RunDetailView(DetailView):
         invalidate('reports_run')
         obj = get_object_or_404(Run, pk=self.kwargs['pk'], report_id=self.kwargs['report_id'])
         if obj.status == "unstarted":
-            subprocess.Popen(["python", "manage.py", "process_report_run", str(obj.pk)])
+            enqueue('process_report_run', [obj.pk])
         return obj
 
 
@@ -1,43 +1,83 @@
-from datetime import datetime
+from optparse import make_option
 
 from django.core.management.base import BaseCommand
-from django.core.management import call_command
 
 from tendenci.apps.search.models import UnindexedItem
 
 
 class Command(BaseCommand):
     """
-    Command used to process unindexed items by querying per Model
-    and running update_index based on a calculated age
-    for models with unindexed items.
+    Command used to process unindexed items.
+
+    The queue is read in batches. For each content type in a batch
+    the queued objects are loaded with one query through the search
+    index's index_queryset and sent to the backend in one update.
+    Queued objects that are no longer in the index queryset (deleted
+    or filtered out) are removed from the index.
+
+    Only rows that existed when the command started are processed, and
+    a batch's rows are deleted before its objects are read, so objects
+    saved again during the run are queued again and not lost.
     """
+    option_list = BaseCommand.option_list + (
+        make_option('--batch-size',
+            action='store',
+            dest='batch_size',
+            type='int',
+            default=500,
+            help='Number of queued items to read per batch'),
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options.get('batch_size') or 500
+
+        last = UnindexedItem.objects.order_by('-pk').values_list('pk', flat=True)[:1]
+        if not last:
+            return
+        max_pk = last[0]
+
+        while True:
+            batch = list(UnindexedItem.objects.filter(pk__lte=max_pk).order_by('pk').values_list(
+                'pk', 'content_type', 'object_id', 'create_dt')[:batch_size])
+            if not batch:
+                break
+
+            UnindexedItem.objects.filter(pk__in=[item[0] for item in batch]).delete()
+            try:
+                self.process_batch(batch)
+            except:
+                # queue the items again for the next run
+                UnindexedItem.objects.bulk_create([
+                    UnindexedItem(content_type_id=ct_id, object_id=object_id, create_dt=create_dt)
+                    for pk, ct_id, object_id, create_dt in batch])
+                raise
+
+    def process_batch(self, batch):
+        from django.contrib.contenttypes.models import ContentType
+        from haystack import site
+        from haystack.exceptions import NotRegistered
+
+        object_ids = {}
+        for pk, ct_id, object_id, create_dt in batch:
+            object_ids.setdefault(ct_id, set()).add(object_id)
+
+        for ct_id, ids in object_ids.items():
+            model = ContentType.objects.get_for_id(ct_id).model_class()
+            if model is None:
+                continue
+            try:
+                index = site.get_index(model)
+            except NotRegistered:
+                continue
+
+            objects = list(index.index_queryset().filter(pk__in=ids))
+            found_ids = set([obj.pk for obj in objects])
+
+            objects = [obj for obj in objects if index.should_update(obj)]
+            if objects:
+                index.backend.update(index, objects)
 
-    def handle(self, **options):
-        items = []
-        ages = []
-
-        unindexed_items = UnindexedItem.objects.all().select_related('content_type__app_label').order_by('create_dt')
-        for ui in unindexed_items:
-            app = ui.content_type.app_label
-            if app not in items:
-                items.append(app)
-
-                age = datetime.now() - unindexed_items[0].create_dt
-                age = (int(age.days)*60*60*24) + age.seconds
-                age = (age / 3600) + 1
-                ages.append(int(age))
-
-        # If we have items, then we find the max age and run a single
-        # update_index command for those apps with the longest age.
-        if items and ages:
-            ages.sort()
-            ages.reverse()
-            max_age = ages[0]
-            # Remove is required because soft-deletes cannot be updated
-            # in the index as the index cannot query for them to update
-            # them.
-            params = {'age': max_age, 'batch-size': 50, 'remove': True}
-
-            call_command('update_index', *items, **params)
-            unindexed_items.delete()
+            for object_id in ids - found_ids:
+                index.backend.remove('%s.%s.%s' % (model._meta.app_label,
+                                                   model._meta.module_name,
+                                                   object_id))
@@ -3,15 +3,15 @@ from django.contrib.contenttypes.models import ContentType
 from tendenci.apps.search.models import UnindexedItem
 
 def save_unindexed_item(sender, **kwargs):
+    """
+    Queue the saved instance for process_unindexed.
+
+    This is a single insert; duplicate rows for the same object are
+    collapsed when the queue is processed, so there is no need to
+    check for an existing row first.
+    """
     instance = kwargs['instance']
     content_type = ContentType.objects.get_for_model(instance)
-    # get_or_create fails in rare cases, throwing MultipleObjectsReturned errors
-    # switched to try/except to prevent errors
-
-    params = {
-        'content_type': content_type,
-        'object_id': instance.pk
-    }
 
-    if not UnindexedItem.objects.filter(**params).exists():
-        UnindexedItem.objects.create(**params)
\ No newline at end of file
+    UnindexedItem.objects.create(content_type=content_type,
+                                 object_id=instance.pk)
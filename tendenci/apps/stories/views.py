@@ -10,7 +10,7 @@ from django.contrib import messages
 
 from tendenci.core.base.http import Http403
 from tendenci.core.perms.utils import (has_perm, update_perms_and_save,
-    get_query_filters, has_view_perm)
+    get_query_filters, distinct_if_needed, has_view_perm)
 from tendenci.core.event_logs.models import EventLog
 from tendenci.core.perms.decorators import is_enabled
 from tendenci.core.site_settings.utils import get_setting
@@ -62,7 +62,7 @@ def search(request, template_name="stories/search.html"):
         stories = Story.objects.search(query, user=request.user)
     else:
         filters = get_query_filters(request.user, 'stories.view_story')
-        stories = Story.objects.filter(filters).distinct()
+        stories = distinct_if_needed(Story.objects.filter(filters))
         if request.user.is_authenticated():
             stories = stories.select_related()
         stories = stories.order_by('-create_dt')
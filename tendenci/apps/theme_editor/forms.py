@@ -12,6 +12,7 @@ from django.core.cache import cache
 
 # local
 from tendenci.core.theme.utils import get_theme_root, get_theme, theme_choices
+from tendenci.core.theme.template_cache import invalidate_theme_templates
 from tendenci.apps.theme_editor.utils import archive_file
 from tendenci.libs.boto_s3.utils import save_file_to_s3
 
@@ -80,6 +81,7 @@ class FileForm(forms.Form):
                 if hasattr(settings, 'REMOTE_DEPLOY_URL') and settings.REMOTE_DEPLOY_URL:
                     urllib.urlopen(settings.REMOTE_DEPLOY_URL)
 
+            invalidate_theme_templates()
             return True
         else:
             return False
@@ -1,8 +1,13 @@
 # django
 from django.db import models
+from django.db.models.signals import post_save
 from django.contrib.auth.models import User
 from django.utils.translation import ugettext_lazy as _
 
+from tendenci.core.site_settings.models import Setting
+from tendenci.core.theme.template_cache import invalidate_theme_templates
+
+
 class ThemeFileVersion(models.Model):
     file_name  = models.CharField(max_length=200, blank=False)
     content = models.TextField(max_length=150000,blank=True)
@@ -13,4 +18,14 @@ class ThemeFileVersion(models.Model):
     class Meta:
         verbose_name        = _('theme archive')
         verbose_name_plural = _('theme archives')
-        permissions = (("view_themefileversion","Can view theme version"),)
\ No newline at end of file
+        permissions = (("view_themefileversion","Can view theme version"),)
+
+
+def theme_setting_changed(sender, instance, **kwargs):
+    """
+    Drop the compiled theme templates when the active theme changes.
+    """
+    if instance.scope_category == 'theme_editor' and instance.name == 'theme':
+        invalidate_theme_templates()
+
+post_save.connect(theme_setting_changed, sender=Setting, weak=False)
@@ -15,6 +15,7 @@ from tendenci.core.site_settings.models import Setting
 from tendenci.core.perms.utils import has_perm
 from tendenci.core.event_logs.models import EventLog
 from tendenci.core.theme.utils import get_theme, theme_choices as theme_choice_list
+from tendenci.core.theme.template_cache import invalidate_theme_templates
 from tendenci.libs.boto_s3.utils import delete_file_from_s3
 from tendenci.apps.theme_editor.models import ThemeFileVersion
 from tendenci.apps.theme_editor.forms import FileForm, ThemeSelectForm, UploadForm
@@ -228,6 +229,7 @@ def copy_to_theme(request, app=None):
         raise Http404
 
     copy(chosen_file, current_dir, full_filename)
+    invalidate_theme_templates()
 
     messages.add_message(request, messages.SUCCESS, ('Successfully copied %s/%s to the the theme root' % (current_dir, chosen_file)))
 
@@ -268,6 +270,7 @@ def delete_file(request):
         raise Http404
 
     os.remove(full_filename)
+    invalidate_theme_templates()
 
     if settings.USE_S3_STORAGE:
         delete_file_from_s3(file=settings.AWS_LOCATION + '/' + 'themes/' + get_theme() + '/' + current_dir + chosen_file)
@@ -297,6 +300,7 @@ def upload_file(request):
                 return HttpResponseRedirect('/theme-editor/editor')
             else:
                 handle_uploaded_file(upload, file_dir)
+                invalidate_theme_templates()
                 messages.add_message(request, messages.SUCCESS, ('Successfully uploaded %s.' % (upload.name)))
 
                 EventLog.objects.log()
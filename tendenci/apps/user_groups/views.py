@@ -1,4 +1,3 @@
-import subprocess
 from datetime import datetime
 from datetime import date
 from djcelery.models import TaskMeta
@@ -18,13 +17,14 @@ from django.http import HttpResponse
 
 from tendenci.core.base.http import Http403
 from tendenci.core.site_settings.utils import get_setting
-from tendenci.core.perms.utils import get_notice_recipients, has_perm, get_query_filters, has_view_perm
+from tendenci.core.perms.utils import get_notice_recipients, has_perm, get_query_filters, distinct_if_needed, has_view_perm
 from tendenci.core.imports.forms import ImportForm
 from tendenci.core.imports.models import Import
 from tendenci.core.imports.utils import (extract_from_excel,
                 render_excel)
 from tendenci.apps.entities.models import Entity
 from tendenci.core.event_logs.models import EventLog
+from tendenci.core.background_jobs.utils import enqueue
 from tendenci.core.event_logs.utils import request_month_range, day_bars
 from tendenci.core.event_logs.views import event_colors
 from tendenci.apps.user_groups.models import Group, GroupMembership
@@ -49,7 +49,7 @@ def search(request, template_name="user_groups/search.html"):
         groups = Group.objects.search(query, user=request.user)
     else:
         filters = get_query_filters(request.user, 'groups.view_group', perms_field=False)
-        groups = Group.objects.filter(filters).distinct()
+        groups = distinct_if_needed(Group.objects.filter(filters))
         if request.user.is_authenticated():
             groups = groups.select_related()
         groups = groups.order_by('slug')
@@ -807,7 +807,7 @@ def import_process(request, import_id,
 
     import_i = get_object_or_404(Import, id=import_id)
 
-    subprocess.Popen(['python', 'manage.py', 'import_groups', str(import_id)])
+    enqueue('import_groups', [import_id])
 
     return render_to_response(template_name, {
         'total': import_i.total_created + import_i.total_invalid,
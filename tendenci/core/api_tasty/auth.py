@@ -1,26 +1,59 @@
+import threading
+import time
+
+from django.conf import settings
+from django.db.models.signals import post_save, post_delete
+
 from tastypie.authentication import ApiKeyAuthentication
 from tastypie.authorization import Authorization
+from tastypie.models import ApiKey
+
+# (user id, api key) -> time the key was checked, in this process
+_valid_keys = {}
+_valid_keys_lock = threading.Lock()
+
+
+def clear_api_key_cache(sender=None, **kwargs):
+    with _valid_keys_lock:
+        _valid_keys.clear()
+
+post_save.connect(clear_api_key_cache, sender=ApiKey, weak=False)
+post_delete.connect(clear_api_key_cache, sender=ApiKey, weak=False)
+
 
 class DeveloperApiKeyAuthentication(ApiKeyAuthentication):
     """
     Extends the build in ApiKeyAuthentication and adds in checking
     for a user's superuser status.
+
+    Valid keys are remembered for API_KEY_CACHE_TIMEOUT seconds so
+    that a sync making many requests doesn't look the key up on each.
+    Changing an ApiKey clears them in the process that changed it.
+    The superuser status is not cached.
     """
-    
+
     def get_key(self, user, api_key):
         """
         Attempts to find the API key for the user. Uses ``ApiKey`` by default
         In addition this checks if the user is a superuser.
         If the user is not even if he has a key he will still be unauthorized.
         """
-        from tastypie.models import ApiKey
-        
+        # checked on every request, a demoted superuser loses access at once
         if not user.profile.is_superuser:
             return self._unauthorized()
 
+        timeout = getattr(settings, 'API_KEY_CACHE_TIMEOUT', 300)
+        cache_key = (user.pk, api_key)
+        with _valid_keys_lock:
+            checked = _valid_keys.get(cache_key)
+        if checked is not None and time.time() - checked < timeout:
+            return True
+
         try:
             key = ApiKey.objects.get(user=user, key=api_key)
         except ApiKey.DoesNotExist:
             return self._unauthorized()
 
+        with _valid_keys_lock:
+            _valid_keys[cache_key] = time.time()
         return True
@@ -0,0 +1,154 @@
+from django.conf import settings
+from django.conf.urls.defaults import url
+from django.db import transaction
+
+from tastypie import fields
+from tastypie.exceptions import BadRequest
+from tastypie.utils import trailing_slash, dict_strip_unicode_keys
+
+# GET params of the sync endpoint that aren't resource filters
+SYNC_PARAMS = ('after', 'limit', 'fields', 'format', 'username', 'api_key', 'callback')
+
+
+class BulkSyncMixin(object):
+    """
+    Adds to a ModelResource
+
+    sync: the list of objects ordered by id, a page at a time after
+    the last id of the previous page, which stays fast at any depth
+    unlike offset pagination. fields= returns only those columns
+    without dehydrating the objects.
+    *example: http://0.0.0.0:8000/api_tasty/v1/membership/sync/?format=json&after=0&limit=500&username=sam&api_key=6f21b5cad4841d7ba76e6d76d5b9332dddf109bf
+    *example: http://0.0.0.0:8000/api_tasty/v1/membership/sync/?format=json&fields=id,user,status_detail,expire_dt&username=sam&api_key=6f21b5cad4841d7ba76e6d76d5b9332dddf109bf
+
+    bulk: creates, or updates those with an id, the objects posted
+    as {"objects": [...]} in one transaction.
+    *example: curl -H "Content-Type: application/json" -X POST --data @data.json "http://0.0.0.0:8000/api_tasty/v1/membership/bulk/?format=json&username=sam&api_key=6f21b5cad4841d7ba76e6d76d5b9332dddf109bf"
+
+    The foreign keys declared on the resource are fetched with
+    select_related in every list.
+    """
+
+    def override_urls(self):
+        return [
+            url(r"^(?P<resource_name>%s)/sync%s$" % (self._meta.resource_name, trailing_slash()),
+                self.wrap_view('dispatch_sync'), name="api_dispatch_sync"),
+            url(r"^(?P<resource_name>%s)/bulk%s$" % (self._meta.resource_name, trailing_slash()),
+                self.wrap_view('dispatch_bulk'), name="api_dispatch_bulk"),
+        ]
+
+    def get_related_attributes(self):
+        """
+        The model attributes of the resource's to-one fields.
+        """
+        return [field.attribute for field in self.fields.values()
+                if isinstance(field, fields.ToOneField)
+                and isinstance(field.attribute, basestring)]
+
+    def get_object_list(self, request):
+        objects = super(BulkSyncMixin, self).get_object_list(request)
+        related = self.get_related_attributes()
+        if related:
+            objects = objects.select_related(*related)
+        return objects
+
+    def get_projection(self, names):
+        """
+        Returns the (name, column) pairs of the fields= projection.
+        Foreign keys give the id of the related object.
+        """
+        model_fields = dict((f.name, f) for f in self._meta.object_class._meta.fields)
+        projection = []
+        for name in names:
+            name = name.strip()
+            if name in self.fields and name in model_fields:
+                projection.append((name, model_fields[name].attname))
+            elif name:
+                raise BadRequest("'%s' is not a field available to fields=." % name)
+        return projection
+
+    def dispatch_sync(self, request, **kwargs):
+        self.method_check(request, allowed=['get'])
+        self.is_authenticated(request)
+        self.throttle_check(request)
+
+        max_limit = getattr(settings, 'API_SYNC_MAX_LIMIT', 1000)
+        try:
+            after = int(request.GET.get('after', 0))
+            limit = int(request.GET.get('limit', max_limit))
+        except ValueError:
+            raise BadRequest("after and limit must be integers.")
+        limit = max(1, min(limit, max_limit))
+
+        filters = request.GET.copy()
+        for key in SYNC_PARAMS:
+            filters.pop(key, None)
+        objects = self.apply_filters(request, self.build_filters(filters=filters))
+        objects = self.apply_authorization_limits(request, objects)
+        objects = objects.filter(pk__gt=after).order_by('pk')[:limit]
+
+        if request.GET.get('fields'):
+            projection = self.get_projection(request.GET['fields'].split(','))
+            columns = [column for name, column in projection]
+            if 'id' not in columns:
+                columns.append('id')
+            rows = list(objects.values(*columns))
+            last_id = rows and rows[-1]['id'] or None
+            data = [dict((name, row[column]) for name, column in projection) for row in rows]
+        else:
+            bundles = [self.full_dehydrate(self.build_bundle(obj=obj, request=request))
+                       for obj in objects]
+            last_id = bundles and bundles[-1].obj.pk or None
+            data = bundles
+
+        next_after, next_url = None, None
+        if len(data) == limit:
+            next_after = last_id
+            params = request.GET.copy()
+            params['after'] = next_after
+            next_url = '%s?%s' % (request.path, params.urlencode())
+        response_data = {
+            'meta': {
+                'after': after,
+                'limit': limit,
+                'next_after': next_after,
+                'next': next_url,
+            },
+            'objects': data,
+        }
+        response_data = self.alter_list_data_to_serialize(request, response_data)
+        return self.create_response(request, response_data)
+
+    def dispatch_bulk(self, request, **kwargs):
+        self.method_check(request, allowed=['post'])
+        self.is_authenticated(request)
+        self.throttle_check(request)
+
+        deserialized = self.deserialize(request, request.raw_post_data,
+            format=request.META.get('CONTENT_TYPE', 'application/json'))
+        deserialized = self.alter_deserialized_list_data(request, deserialized)
+        objects = isinstance(deserialized, dict) and deserialized.get('objects')
+        if not isinstance(objects, list):
+            raise BadRequest("Post the records as {\"objects\": [...]}.")
+        max_objects = getattr(settings, 'API_BULK_MAX_OBJECTS', 500)
+        if len(objects) > max_objects:
+            raise BadRequest("At most %d objects can be posted at once." % max_objects)
+
+        results = []
+        # all or none of the records are written
+        with transaction.commit_on_success():
+            for data in objects:
+                data = dict_strip_unicode_keys(data)
+                pk = data.pop('id', None)
+                bundle = self.build_bundle(data=data, request=request)
+                if pk:
+                    if 'put' not in self._meta.detail_allowed_methods:
+                        raise BadRequest("%s can't be updated." % self._meta.resource_name)
+                    bundle = self.obj_update(bundle, request=request, pk=pk)
+                else:
+                    if 'post' not in self._meta.list_allowed_methods:
+                        raise BadRequest("%s can't be created." % self._meta.resource_name)
+                    bundle = self.obj_create(bundle, request=request)
+                results.append({'id': bundle.obj.pk, 'created': not pk})
+
+        return self.create_response(request, {'objects': results})
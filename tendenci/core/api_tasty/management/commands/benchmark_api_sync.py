@@ -0,0 +1,115 @@
+from optparse import make_option
+from timeit import default_timer
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    """
+    Pull every record of an api_tasty resource the way a nightly sync
+    does, through the offset paginated list and through the keyset
+    paginated sync endpoint, and report the throughput of each.
+
+    The requests are made in-process with the test client, so the
+    numbers leave out the network but include authentication,
+    querying and serialization.
+
+    Usage: ./manage.py benchmark_api_sync --username sam --api-key 6f21b5cad4841d7ba76e6d76d5b9332dddf109bf
+    """
+    help = 'Benchmark a full sync of an api_tasty resource'
+
+    option_list = BaseCommand.option_list + (
+        make_option('--resource',
+            action='store',
+            dest='resource',
+            default='membership',
+            help='Resource name, membership by default'),
+        make_option('--username',
+            action='store',
+            dest='username',
+            help='Superuser with an api key'),
+        make_option('--api-key',
+            action='store',
+            dest='api_key',
+            help='Api key of the user'),
+        make_option('--limit',
+            action='store',
+            dest='limit',
+            type='int',
+            default=500,
+            help='Records per request'),
+        make_option('--fields',
+            action='store',
+            dest='fields',
+            default='',
+            help='Also sync with this fields= projection, e.g. id,user,status_detail'),
+        make_option('--max-requests',
+            action='store',
+            dest='max_requests',
+            type='int',
+            default=0,
+            help='Stop each sync after this many requests'),
+        )
+
+    def handle(self, *args, **options):
+        from django.core.urlresolvers import reverse
+        from django.test.client import Client
+        from django.utils import simplejson
+
+        if not options['username'] or not options['api_key']:
+            raise CommandError('--username and --api-key are required')
+
+        client = Client()
+        auth = {'format': 'json', 'username': options['username'],
+                'api_key': options['api_key']}
+        kwargs = {'api_name': 'v1', 'resource_name': options['resource']}
+
+        def pull(path, params, next_params):
+            """
+            Request pages until the last one, returns
+            (records, requests, seconds, bytes).
+            """
+            records = requests = size = 0
+            started = default_timer()
+            while params is not None:
+                response = client.get(path, dict(auth, **params))
+                if response.status_code != 200:
+                    raise CommandError('%s returned %d: %s' % (
+                        path, response.status_code, response.content[:500]))
+                data = simplejson.loads(response.content)
+                records += len(data['objects'])
+                requests += 1
+                size += len(response.content)
+                if options['max_requests'] and requests >= options['max_requests']:
+                    break
+                params = next_params(params, data)
+            return records, requests, default_timer() - started, size
+
+        def next_offset(params, data):
+            if not data['meta'].get('next'):
+                return None
+            return dict(params, offset=params['offset'] + params['limit'])
+
+        def next_after(params, data):
+            if not data['meta'].get('next_after'):
+                return None
+            return dict(params, after=data['meta']['next_after'])
+
+        limit = options['limit']
+        runs = [
+            ('offset list', reverse('api_dispatch_list', kwargs=kwargs),
+             {'limit': limit, 'offset': 0}, next_offset),
+            ('keyset sync', reverse('api_dispatch_sync', kwargs=kwargs),
+             {'limit': limit, 'after': 0}, next_after),
+        ]
+        if options['fields']:
+            runs.append(('keyset sync fields=%s' % options['fields'],
+                         reverse('api_dispatch_sync', kwargs=kwargs),
+                         {'limit': limit, 'after': 0, 'fields': options['fields']},
+                         next_after))
+
+        for name, path, params, next_params in runs:
+            records, requests, elapsed, size = pull(path, params, next_params)
+            print "%s: %d records in %d requests, %.2fs, %.1f records/s, %d KB" % (
+                name, records, requests, elapsed,
+                records / elapsed if elapsed else records, size / 1024)
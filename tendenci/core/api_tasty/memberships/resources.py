@@ -62,7 +62,7 @@ class MembershipResource(TendenciResource):
         username = request.GET.get('mem_username', None)
         userid = request.GET.get('mem_userid', None)
 
-        mems = self._meta.queryset._clone()
+        mems = super(MembershipResource, self).get_object_list(request)
         if mem_id:
             mems = mems.filter(pk=mem_id)
         if mem_type:
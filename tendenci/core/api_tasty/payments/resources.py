@@ -4,9 +4,10 @@ from tastypie import fields
 
 from tendenci.core.api_tasty.auth import DeveloperApiKeyAuthentication
 from tendenci.core.api_tasty.serializers import SafeSerializer
+from tendenci.core.api_tasty.bulk import BulkSyncMixin
 from tendenci.core.payments.models import PaymentMethod
 
-class PaymentMethodResource(ModelResource):
+class PaymentMethodResource(BulkSyncMixin, ModelResource):
     class Meta:
         queryset = PaymentMethod.objects.all()
         resource_name = 'payment_method'
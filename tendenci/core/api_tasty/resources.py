@@ -7,8 +7,9 @@ from tastypie import fields
 from tendenci.core.api_tasty.serializers import SafeSerializer
 from tendenci.core.api_tasty.auth import DeveloperApiKeyAuthentication
 from tendenci.core.api_tasty.users.resources import UserResource
+from tendenci.core.api_tasty.bulk import BulkSyncMixin
 
-class TendenciResource(ModelResource):
+class TendenciResource(BulkSyncMixin, ModelResource):
     owner = fields.ForeignKey(UserResource, 'owner')
     creator = fields.ForeignKey(UserResource, 'creator')
     
@@ -9,9 +9,10 @@ from tastypie import fields
 
 from tendenci.core.api_tasty.auth import DeveloperApiKeyAuthentication
 from tendenci.core.api_tasty.serializers import SafeSerializer
+from tendenci.core.api_tasty.bulk import BulkSyncMixin
 from tendenci.core.api_tasty.users.forms import UserForm
 
-class UserResource(ModelResource):
+class UserResource(BulkSyncMixin, ModelResource):
     class Meta:
         queryset = User.objects.all()
         resource_name = 'user'
@@ -0,0 +1,17 @@
+from django.contrib import admin
+from tendenci.core.background_jobs.models import BackgroundJob, JobWorker
+
+
+class BackgroundJobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'job_type', 'status', 'progress', 'progress_total',
+                    'worker', 'create_dt', 'start_dt', 'finish_dt')
+    list_filter = ('status', 'job_type')
+    readonly_fields = ('heartbeat_dt',)
+
+
+class JobWorkerAdmin(admin.ModelAdmin):
+    list_display = ('name', 'start_dt', 'heartbeat_dt')
+
+
+admin.site.register(BackgroundJob, BackgroundJobAdmin)
+admin.site.register(JobWorker, JobWorkerAdmin)
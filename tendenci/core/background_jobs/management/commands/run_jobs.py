@@ -0,0 +1,141 @@
+import threading
+import time
+import traceback
+from datetime import datetime, timedelta
+from optparse import make_option
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    """
+    Run the queued background jobs.
+
+    Jobs run in a pool of settings.JOBS_WORKER_THREADS threads, and at
+    most settings.JOBS_CONCURRENCY[job_type] jobs of a type run at once
+    across all workers. Running jobs that stop sending heartbeats, i.e.
+    whose worker died, are marked failed.
+
+    Usage:
+        python manage.py run_jobs [--threads 4] [--until-idle]
+    """
+    option_list = BaseCommand.option_list + (
+        make_option('--threads',
+            action='store',
+            dest='threads',
+            type='int',
+            default=None,
+            help='Number of jobs to run at once'),
+        make_option('--until-idle',
+            action='store_true',
+            dest='until_idle',
+            default=False,
+            help='Exit once there are no pending jobs left'),
+        )
+
+    def handle(self, *args, **options):
+        from django.conf import settings
+        from django.db import transaction
+        from tendenci.core.background_jobs.models import BackgroundJob, JobWorker
+        from django.core.cache import cache
+        from tendenci.core.background_jobs.utils import (get_worker_name,
+            get_concurrency_limit, get_start_lock_key, start_worker)
+
+        num_threads = options['threads'] or settings.JOBS_WORKER_THREADS
+        poll_interval = settings.JOBS_POLL_INTERVAL
+        worker_timeout = settings.JOBS_WORKER_TIMEOUT
+        name = get_worker_name()
+
+        worker, created = JobWorker.objects.get_or_create(name=name)
+        threads = {}
+
+        try:
+            while True:
+                now = datetime.now()
+                JobWorker.objects.filter(pk=worker.pk).update(heartbeat_dt=now)
+
+                for job_pk, thread in threads.items():
+                    if not thread.is_alive():
+                        del threads[job_pk]
+                if threads:
+                    BackgroundJob.objects.filter(pk__in=threads.keys(),
+                        status='running').update(heartbeat_dt=now)
+
+                # jobs of workers that went away
+                stale_dt = now - timedelta(seconds=worker_timeout)
+                BackgroundJob.objects.filter(status='running',
+                    heartbeat_dt__lt=stale_dt).update(
+                        status='failed', finish_dt=now,
+                        message='The worker stopped responding.')
+                JobWorker.objects.filter(heartbeat_dt__lt=stale_dt).delete()
+
+                claimed = 0
+                free = num_threads - len(threads)
+                if free > 0:
+                    running = {}
+                    for job_type in BackgroundJob.objects.filter(status='running').values_list(
+                            'job_type', flat=True):
+                        running[job_type] = running.get(job_type, 0) + 1
+
+                    pending = BackgroundJob.objects.filter(status='pending').order_by('id')
+                    for job in pending[:free * 10]:
+                        if claimed >= free:
+                            break
+                        if running.get(job.job_type, 0) >= get_concurrency_limit(job.job_type):
+                            continue
+                        # another worker may have claimed it in the meantime
+                        if not BackgroundJob.objects.filter(pk=job.pk, status='pending').update(
+                                status='running', worker=name, start_dt=now, heartbeat_dt=now):
+                            continue
+                        running[job.job_type] = running.get(job.job_type, 0) + 1
+                        claimed += 1
+
+                        thread = threading.Thread(target=run_job, args=(job.pk,))
+                        thread.daemon = True
+                        thread.start()
+                        threads[job.pk] = thread
+
+                # see the rows other processes committed since the last poll
+                transaction.commit_unless_managed()
+
+                if options['until_idle'] and not threads and not claimed and \
+                        not BackgroundJob.objects.filter(status='pending').exists():
+                    break
+                time.sleep(poll_interval)
+        finally:
+            for thread in threads.values():
+                thread.join()
+            JobWorker.objects.filter(pk=worker.pk).delete()
+            transaction.commit_unless_managed()
+
+        if options['until_idle']:
+            cache.delete(get_start_lock_key())
+            # a job queued while this worker was shutting down
+            if BackgroundJob.objects.filter(status='pending').exists():
+                start_worker()
+
+
+def run_job(job_pk):
+    """
+    Run one job in the current thread and record how it ended.
+    """
+    from django.core.management import call_command
+    from django.db import connection
+    from tendenci.core.background_jobs.models import BackgroundJob
+    from tendenci.core.background_jobs.utils import set_current_job
+
+    job = BackgroundJob.objects.get(pk=job_pk)
+    set_current_job(job)
+    try:
+        call_command(job.job_type, *job.args, **job.options)
+        fields = {'status': 'completed'}
+    except (Exception, SystemExit):
+        fields = {'status': 'failed', 'message': traceback.format_exc()}
+    finally:
+        set_current_job(None)
+
+    try:
+        BackgroundJob.objects.filter(pk=job_pk).update(finish_dt=datetime.now(), **fields)
+    finally:
+        # each thread has its own connection
+        connection.close()
@@ -0,0 +1,74 @@
+# encoding: utf-8
+import datetime
+from south.db import db
+from south.v2 import SchemaMigration
+from django.db import models
+
+class Migration(SchemaMigration):
+
+    def forwards(self, orm):
+
+        # Adding model 'BackgroundJob'
+        db.create_table('background_jobs_backgroundjob', (
+            ('id', self.gf('django.db.models.fields.AutoField')(primary_key=True)),
+            ('job_type', self.gf('django.db.models.fields.CharField')(max_length=100, db_index=True)),
+            ('args', self.gf('picklefield.fields.PickledObjectField')()),
+            ('options', self.gf('picklefield.fields.PickledObjectField')()),
+            ('status', self.gf('django.db.models.fields.CharField')(default='pending', max_length=20, db_index=True)),
+            ('progress', self.gf('django.db.models.fields.IntegerField')(default=0)),
+            ('progress_total', self.gf('django.db.models.fields.IntegerField')(null=True, blank=True)),
+            ('message', self.gf('django.db.models.fields.TextField')(default='', blank=True)),
+            ('worker', self.gf('django.db.models.fields.CharField')(default='', max_length=100, blank=True)),
+            ('create_dt', self.gf('django.db.models.fields.DateTimeField')(auto_now_add=True, blank=True)),
+            ('start_dt', self.gf('django.db.models.fields.DateTimeField')(null=True, blank=True)),
+            ('heartbeat_dt', self.gf('django.db.models.fields.DateTimeField')(null=True, blank=True)),
+            ('finish_dt', self.gf('django.db.models.fields.DateTimeField')(null=True, blank=True)),
+        ))
+        db.send_create_signal('background_jobs', ['BackgroundJob'])
+
+        # Adding model 'JobWorker'
+        db.create_table('background_jobs_jobworker', (
+            ('id', self.gf('django.db.models.fields.AutoField')(primary_key=True)),
+            ('name', self.gf('django.db.models.fields.CharField')(unique=True, max_length=100)),
+            ('start_dt', self.gf('django.db.models.fields.DateTimeField')(default=datetime.datetime.now)),
+            ('heartbeat_dt', self.gf('django.db.models.fields.DateTimeField')(default=datetime.datetime.now)),
+        ))
+        db.send_create_signal('background_jobs', ['JobWorker'])
+
+
+    def backwards(self, orm):
+
+        # Deleting model 'BackgroundJob'
+        db.delete_table('background_jobs_backgroundjob')
+
+        # Deleting model 'JobWorker'
+        db.delete_table('background_jobs_jobworker')
+
+
+    models = {
+        'background_jobs.backgroundjob': {
+            'Meta': {'ordering': "('id',)", 'object_name': 'BackgroundJob'},
+            'args': ('picklefield.fields.PickledObjectField', [], {}),
+            'create_dt': ('django.db.models.fields.DateTimeField', [], {'auto_now_add': 'True', 'blank': 'True'}),
+            'finish_dt': ('django.db.models.fields.DateTimeField', [], {'null': 'True', 'blank': 'True'}),
+            'heartbeat_dt': ('django.db.models.fields.DateTimeField', [], {'null': 'True', 'blank': 'True'}),
+            'id': ('django.db.models.fields.AutoField', [], {'primary_key': 'True'}),
+            'job_type': ('django.db.models.fields.CharField', [], {'max_length': '100', 'db_index': 'True'}),
+            'message': ('django.db.models.fields.TextField', [], {'default': "''", 'blank': 'True'}),
+            'options': ('picklefield.fields.PickledObjectField', [], {}),
+            'progress': ('django.db.models.fields.IntegerField', [], {'default': '0'}),
+            'progress_total': ('django.db.models.fields.IntegerField', [], {'null': 'True', 'blank': 'True'}),
+            'start_dt': ('django.db.models.fields.DateTimeField', [], {'null': 'True', 'blank': 'True'}),
+            'status': ('django.db.models.fields.CharField', [], {'default': "'pending'", 'max_length': '20', 'db_index': 'True'}),
+            'worker': ('django.db.models.fields.CharField', [], {'default': "''", 'max_length': '100', 'blank': 'True'})
+        },
+        'background_jobs.jobworker': {
+            'Meta': {'object_name': 'JobWorker'},
+            'heartbeat_dt': ('django.db.models.fields.DateTimeField', [], {'default': 'datetime.datetime.now'}),
+            'id': ('django.db.models.fields.AutoField', [], {'primary_key': 'True'}),
+            'name': ('django.db.models.fields.CharField', [], {'unique': 'True', 'max_length': '100'}),
+            'start_dt': ('django.db.models.fields.DateTimeField', [], {'default': 'datetime.datetime.now'})
+        }
+    }
+
+    complete_apps = ['background_jobs']
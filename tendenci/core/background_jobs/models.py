@@ -0,0 +1,55 @@
+from datetime import datetime
+
+from django.db import models
+from django.utils.translation import ugettext_lazy as _
+from picklefield.fields import PickledObjectField
+
+
+class BackgroundJob(models.Model):
+    """
+    A management command queued to run in the run_jobs worker.
+
+    job_type is the name of the command, args and options are passed
+    to call_command() as they are.
+    """
+    STATUS_CHOICES = (
+        ("pending", _(u"Pending")),
+        ("running", _(u"Running")),
+        ("completed", _(u"Completed")),
+        ("failed", _(u"Failed")),
+    )
+    job_type = models.CharField(_(u"job type"), max_length=100, db_index=True)
+    args = PickledObjectField(default=list)
+    options = PickledObjectField(default=dict)
+    status = models.CharField(_(u"status"), max_length=20, db_index=True,
+            default="pending", choices=STATUS_CHOICES)
+    progress = models.IntegerField(default=0)
+    progress_total = models.IntegerField(null=True, blank=True)
+    message = models.TextField(blank=True, default='')
+    worker = models.CharField(max_length=100, blank=True, default='')
+    create_dt = models.DateTimeField(auto_now_add=True)
+    start_dt = models.DateTimeField(null=True, blank=True)
+    heartbeat_dt = models.DateTimeField(null=True, blank=True)
+    finish_dt = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ('id',)
+
+    def __unicode__(self):
+        return "%s %s (%s)" % (self.job_type, ' '.join([unicode(a) for a in self.args]), self.status)
+
+    @property
+    def is_done(self):
+        return self.status in ('completed', 'failed')
+
+
+class JobWorker(models.Model):
+    """
+    A running run_jobs process, kept alive by its heartbeat.
+    """
+    name = models.CharField(max_length=100, unique=True)
+    start_dt = models.DateTimeField(default=datetime.now)
+    heartbeat_dt = models.DateTimeField(default=datetime.now)
+
+    def __unicode__(self):
+        return self.name
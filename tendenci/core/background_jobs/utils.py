@@ -0,0 +1,100 @@
+import os
+import socket
+import subprocess
+import threading
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+
+from tendenci.core.background_jobs.models import BackgroundJob, JobWorker
+
+_local = threading.local()
+
+
+def get_worker_name():
+    return '%s:%d' % (socket.gethostname(), os.getpid())
+
+
+def get_concurrency_limit(job_type):
+    """
+    The maximum number of jobs of this type that run at once,
+    from settings.JOBS_CONCURRENCY.
+    """
+    limits = getattr(settings, 'JOBS_CONCURRENCY', {})
+    return limits.get(job_type, limits.get('default', 1))
+
+
+def has_live_worker():
+    stale_dt = datetime.now() - timedelta(seconds=settings.JOBS_WORKER_TIMEOUT)
+    return JobWorker.objects.filter(heartbeat_dt__gt=stale_dt).exists()
+
+
+def get_start_lock_key():
+    return '.'.join([settings.CACHE_PRE_KEY, 'background_jobs', 'start_worker'])
+
+
+def start_worker():
+    """
+    Start a run_jobs process that exits once the queue is empty,
+    for sites that don't keep a worker running. Only one is started
+    at a time.
+    """
+    if not cache.add(get_start_lock_key(), True, settings.JOBS_WORKER_TIMEOUT):
+        return
+    subprocess.Popen(['python', 'manage.py', 'run_jobs', '--until-idle'])
+
+
+def enqueue(job_type, args=None, options=None, unique=True):
+    """
+    Queue the management command job_type to be run with
+    call_command(job_type, *args, **options) by the run_jobs worker.
+
+    With unique, a job identical to one that is still pending is not
+    queued twice. Pass unique=False for jobs that are never repeated,
+    to skip loading every pending job of the type.
+    Returns the BackgroundJob.
+    """
+    args = [unicode(arg) for arg in (args or [])]
+    options = options or {}
+
+    if unique:
+        for job in BackgroundJob.objects.filter(job_type=job_type, status='pending'):
+            if job.args == args and job.options == options:
+                return job
+
+    job = BackgroundJob.objects.create(job_type=job_type,
+                                       args=args,
+                                       options=options)
+
+    if getattr(settings, 'JOBS_AUTOSTART_WORKER', True) and not has_live_worker():
+        start_worker()
+
+    return job
+
+
+def get_current_job():
+    """
+    The job being run in this thread by the worker, if any.
+    """
+    return getattr(_local, 'job', None)
+
+
+def set_current_job(job):
+    _local.job = job
+
+
+def set_progress(done, total=None, message=None):
+    """
+    Record the progress of the job running in this thread.
+    Does nothing when the command was not started by the worker.
+    """
+    job = get_current_job()
+    if not job:
+        return
+    fields = {'progress': done, 'heartbeat_dt': datetime.now()}
+    if total is not None:
+        fields['progress_total'] = total
+    if message is not None:
+        fields['message'] = message
+    BackgroundJob.objects.filter(pk=job.pk).update(**fields)
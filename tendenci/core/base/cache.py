@@ -1,3 +1,31 @@
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
 # BASE CACHE KEYS 
 IMAGE_PREVIEW_CACHE = "image.preview."
-RENDERED_CONTENT_CACHE = "rendered.content."
\ No newline at end of file
+RENDERED_CONTENT_CACHE = "rendered.content."
+LIST_TAGS_PRE_KEY = "list_tags"
+
+
+def get_list_version_key(model):
+    return '.'.join([settings.CACHE_PRE_KEY, LIST_TAGS_PRE_KEY, model._meta.app_label,
+                     model._meta.object_name.lower(), 'version'])
+
+
+def get_list_version(model):
+    """
+    The keys of the cached list_* tags of a model include
+    this version, so changing it drops them all.
+    """
+    version = cache.get(get_list_version_key(model))
+    if version is None:
+        version = bump_list_version(model)
+    return version
+
+
+def bump_list_version(model):
+    version = str(time.time())
+    cache.set(get_list_version_key(model), version)
+    return version
@@ -1,7 +1,17 @@
+import re
 import sys
+import time
+from hashlib import md5
 
-from django.http import HttpResponseForbidden, HttpResponseServerError
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponseForbidden, HttpResponseServerError, HttpResponseNotModified
 from django.template import loader
+from django.utils.http import http_date, parse_http_date, parse_etags, quote_etag
+from django.views.static import was_modified_since
+
+# how long the time a version of a response was first served is kept
+VALIDATOR_CACHE_TIMEOUT = 60 * 60 * 24 * 30
 
 
 class Http403(Exception):
@@ -39,3 +49,65 @@ def render_to_missing_app(*args, **kwargs):
     response = HttpResponseServerError(loader.render_to_string(*args, **kwargs), **httpresponse_kwargs)
         
     return response
+
+
+def get_first_served(digest):
+    """
+    Returns the time the response with this digest was first served.
+    If the key is evicted the response just looks newly modified.
+    """
+    key = '.'.join([settings.CACHE_PRE_KEY, 'http', 'first_served', digest])
+    first_served = cache.get(key)
+    if first_served is None:
+        cache.add(key, int(time.time()), VALIDATOR_CACHE_TIMEOUT)
+        first_served = cache.get(key) or int(time.time())
+    return first_served
+
+
+def get_validators(version):
+    """
+    Returns the ETag and Last-Modified headers of a response whose
+    content is identified by version, any value with a repr that
+    changes whenever the content does.
+
+    Last-Modified is the time this version was first served, not the
+    newest update_dt of the content, so it moves when an item leaves
+    the response as well as when one changes.
+    """
+    digest = md5(repr(version)).hexdigest()
+    return {
+        'ETag': quote_etag(digest),
+        'Last-Modified': http_date(get_first_served(digest)),
+    }
+
+
+def not_modified(request, validators):
+    """
+    Returns a 304 response if the request's If-None-Match, or else
+    its If-Modified-Since, matches the validators, or None.
+    """
+    etag = None
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if if_none_match:
+        # parse_etags unquotes the etags, so compare them unquoted.
+        # GZipMiddleware adds ;gzip to the etag of a compressed
+        # response, which clients send back.
+        digest = parse_etags(validators['ETag'])[0]
+        for sent in parse_etags(if_none_match):
+            if sent == '*' or re.sub(';gzip$', '', sent) == digest:
+                etag = quote_etag(sent)
+                break
+        matched = etag is not None
+    else:
+        if_modified_since = request.META.get('HTTP_IF_MODIFIED_SINCE')
+        matched = bool(if_modified_since) and not was_modified_since(
+            if_modified_since, parse_http_date(validators['Last-Modified']))
+    if not matched:
+        return None
+    response = HttpResponseNotModified()
+    for header, value in validators.items():
+        response[header] = value
+    if etag and etag != '"*"':
+        # the etag the client has
+        response['ETag'] = etag
+    return response
@@ -0,0 +1,26 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db.models.signals import post_save, post_delete
+
+from tendenci.core.base.cache import bump_list_version
+from tendenci.core.perms.object_perms import ObjectPermission
+
+
+def clear_list_cache(sender, instance, **kwargs):
+    """
+    Drops the cached list_* tags of the model saved, or of the
+    model whose permissions changed. The list tags can show any
+    model with a search manager.
+    """
+    if sender is ObjectPermission:
+        model = ContentType.objects.get_for_id(instance.content_type_id).model_class()
+    elif hasattr(getattr(sender, 'objects', None), 'search'):
+        model = sender
+    else:
+        return
+    if model is not None:
+        bump_list_version(model)
+
+# connected here, not in template_tags, so saves in
+# processes that never render a list tag drop them too
+post_save.connect(clear_list_cache, weak=False, dispatch_uid='base_list_cache_save')
+post_delete.connect(clear_list_cache, weak=False, dispatch_uid='base_list_cache_delete')
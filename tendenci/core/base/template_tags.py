@@ -1,6 +1,9 @@
 import random
+from hashlib import md5
 from operator import or_
 
+from django.conf import settings
+from django.core.cache import cache
 from django.template import Node, Variable, Context, loader
 from django.db import models
 from django.core.exceptions import FieldError
@@ -9,7 +12,9 @@ from django.contrib.auth.models import AnonymousUser, User
 from django.db.models import Q
 
 from tendenci.apps.user_groups.models import Group
-from tendenci.core.perms.utils import get_query_filters
+from tendenci.core.base.cache import LIST_TAGS_PRE_KEY, get_list_version
+from tendenci.core.perms.utils import get_query_filters, distinct_if_needed
+from tendenci.core.perms.visibility import get_visibility_class
 
 
 def parse_tag_kwargs(bits):
@@ -32,6 +37,42 @@ def parse_tag_kwargs(bits):
     return kwargs
 
 
+def sample_queryset(items, limit):
+    """
+    Returns limit random items of the queryset in random order.
+    Only the ids are read to pick from, then the items picked.
+    """
+    ids = list(items.order_by().values_list('pk', flat=True))
+    ids = random.sample(ids, min(limit, len(ids)))
+    objects = dict((obj.pk, obj) for obj in items.order_by().filter(pk__in=ids))
+    return [objects[pk] for pk in ids if pk in objects]
+
+
+def sample_search_results(sqs, limit):
+    """
+    Returns limit random results of the SearchQuerySet
+    in random order, fetching only the results picked.
+    """
+    count = sqs.count()
+    return [sqs[i] for i in random.sample(xrange(count), min(limit, count))]
+
+
+def load_search_objects(results):
+    """
+    Returns the objects of the search results in their order with
+    one query per model, skipping results whose object is gone.
+    """
+    pks = {}
+    for result in results:
+        pks.setdefault(result.model, []).append(result.pk)
+    loaded = {}
+    for model, model_pks in pks.items():
+        for pk, obj in model._default_manager.in_bulk(model_pks).items():
+            loaded[(model, unicode(pk))] = obj
+    return [loaded[(result.model, unicode(result.pk))] for result in results
+            if (result.model, unicode(result.pk)) in loaded]
+
+
 class ListNode(Node):
     """
     Base template node for searching for items in haystack
@@ -43,6 +84,12 @@ class ListNode(Node):
 
     class MyModelListNode(ListNode):
         model = MyModel
+
+    With cache=true the list, and its template's html, are cached
+    for LIST_TAGS_CACHE_TIMEOUT seconds (cache=<seconds> to set it)
+    per tag arguments and visibility class of the user, until an
+    object of the model is saved. A cached random list stays the
+    same until it expires.
     """
     def __init__(self, context_var, *args, **kwargs):
         self.context_var = context_var
@@ -55,6 +102,13 @@ class ListNode(Node):
         if not hasattr(self.model.objects, 'search'):
             raise AttributeError(_('Model.objects does not have a search method'))
 
+    def get_cache_key(self, user, args):
+        meta = self.model._meta
+        args = md5(repr((self.__class__.__name__, self.context_var, args))).hexdigest()
+        return '.'.join([settings.CACHE_PRE_KEY, LIST_TAGS_PRE_KEY, meta.app_label,
+                         meta.object_name.lower(), get_list_version(self.model),
+                         get_visibility_class(user), args])
+
     def render(self, context):
         tags = u''
         query = u''
@@ -145,6 +199,30 @@ class ListNode(Node):
             except:
                 status_detail = self.kwargs['status_detail']
 
+        template = None
+        if 'template' in self.kwargs:
+            try:
+                template = Variable(self.kwargs['template'])
+                template = unicode(template.resolve(context))
+            except:
+                template = self.kwargs['template']
+
+        cache_timeout = 0
+        if 'cache' in self.kwargs:
+            try:
+                cache_timeout = int(self.kwargs['cache'])
+            except ValueError:
+                if self.kwargs['cache'].strip('"').lower() != 'false':
+                    cache_timeout = getattr(settings, 'LIST_TAGS_CACHE_TIMEOUT', 600)
+
+        if cache_timeout:
+            cache_key = self.get_cache_key(user, [tags, query, limit, order, exclude,
+                randomize, group, status_detail, template])
+            cached = cache.get(cache_key)
+            if cached is not None:
+                context[self.context_var], html = cached
+                return html
+
         # get the list of items
         self.perms = getattr(self, 'perms', unicode())
 
@@ -158,9 +236,7 @@ class ListNode(Node):
 
         else:
             filters = get_query_filters(user, self.perms)
-            items = self.model.objects.filter(filters)
-            if user.is_authenticated():
-                items = items.distinct()
+            items = distinct_if_needed(self.model.objects.filter(filters))
 
             if tags:  # tags is a comma delimited list
                 # this is fast; but has one hole
@@ -199,23 +275,24 @@ class ListNode(Node):
             items = items.order_by(order)
 
         if randomize:
-            objects = [item for item in random.sample(items, len(items))][:limit]
+            if query:
+                objects = sample_search_results(items, limit)
+            else:
+                objects = sample_queryset(items, limit)
         else:
             objects = [item for item in items[:limit]]
 
         if query:
-            objects = [item.object for item in objects]
+            objects = load_search_objects(objects)
 
         context[self.context_var] = objects
 
-        if 'template' in self.kwargs:
-            try:
-                template = Variable(self.kwargs['template'])
-                template = unicode(template.resolve(context))
-            except:
-                template = self.kwargs['template']
-
+        html = ""
+        if template:
             t = loader.get_template(template)
-            return t.render(Context(context, autoescape=context.autoescape))
+            html = t.render(Context(context, autoescape=context.autoescape))
+
+        if cache_timeout:
+            cache.set(cache_key, (objects, html), cache_timeout)
 
-        return ""
+        return html
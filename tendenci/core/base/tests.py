@@ -0,0 +1,84 @@
+import time
+from datetime import datetime
+
+from django.middleware.gzip import GZipMiddleware
+from django.test import TestCase
+from django.test.client import RequestFactory
+
+from tendenci.core.rss.feeds import GlobalFeed, FeedEntry
+
+
+class TestSubFeed(object):
+    title_template = None
+    description_template = None
+
+    def item_title(self, item):
+        return 'Item %d' % item
+
+    def item_description(self, item):
+        return 'The description of item %d, long enough to be gzipped.' % item
+
+    def item_link(self, item):
+        return 'http://example.com/items/%d/' % item
+
+    def item_author_name(self, item):
+        return 'Author'
+
+
+class TestGlobalFeed(GlobalFeed):
+    """
+    The global feed with fixed entries instead of the apps' feeds.
+    """
+    def __init__(self, entries):
+        super(TestGlobalFeed, self).__init__()
+        self.entries = entries
+
+    def title(self):
+        return 'Test RSS Feed'
+
+    def link(self):
+        return 'http://example.com/rss'
+
+    def description(self):
+        return 'All syndicated rss feeds on example.com'
+
+    def get_object(self, request, *args, **kwargs):
+        return self.entries
+
+
+class ConditionalGetTest(TestCase):
+    """
+    core.base.http's validators on the global rss feed, through
+    GZipMiddleware as in MIDDLEWARE_CLASSES.
+    """
+    def setUp(self):
+        self.factory = RequestFactory()
+        feed = TestSubFeed()
+        self.entries = [FeedEntry(feed, i, datetime(2013, 1, i)) for i in range(1, 6)]
+
+    def get(self, entries, **headers):
+        request = self.factory.get('/rss/', HTTP_ACCEPT_ENCODING='gzip', **headers)
+        response = TestGlobalFeed(entries)(request)
+        return GZipMiddleware().process_response(request, response)
+
+    def test_revalidate_gzipped(self):
+        response = self.get(self.entries)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertTrue(response['ETag'].endswith(';gzip"'))
+
+        response = self.get(self.entries, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_item_removed(self):
+        response = self.get(self.entries)
+        etag = response['ETag']
+        last_modified = response['Last-Modified']
+        # http dates are in seconds
+        time.sleep(1)
+
+        # the newest item is unchanged but one drops out
+        response = self.get(self.entries[1:], HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        response = self.get(self.entries[1:], HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 200)
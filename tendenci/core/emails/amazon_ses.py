@@ -20,6 +20,8 @@
 #THE SOFTWARE.
 
 import httplib
+import select
+import socket
 import urllib
 import hashlib
 import hmac
@@ -36,6 +38,7 @@ class AmazonSES:
         self._accessKeyID = getattr(settings, 'AWS_ACCESS_KEY_ID', None)
         self._secretAccessKey = getattr(settings, 'AWS_SECRET_ACCESS_KEY', None)
         self._responseParser = AmazonResponseParser()
+        self._connection = None
 
     def _getSignature(self, dateValue):
         h = hmac.new(key=self._secretAccessKey, msg=dateValue, digestmod=hashlib.sha256)
@@ -54,14 +57,55 @@ class AmazonSES:
         if not params:
             params = {}
         params['Action'] = actionName        
-        #https://email.us-east-1.amazonaws.com/
-        conn = httplib.HTTPSConnection('email.us-east-1.amazonaws.com')
         params = urllib.urlencode(params)
-        conn.request('POST', '/', params, self._getHeaders())
-        response = conn.getresponse()
+        if self._connection is not None and self._isStale():
+            self.close()
+        reused = self._connection is not None and self._connection.sock is not None
+        headers = self._getHeaders()
+        try:
+            self._getConnection().request('POST', '/', params, headers)
+        except socket.timeout:
+            self.close()
+            raise
+        except socket.error:
+            self.close()
+            if not reused:
+                raise
+            # SES closed the kept-alive connection before getting the
+            # request, send it on a new one. Nothing is sent again
+            # once it is written, SES may have acted on it.
+            self._getConnection().request('POST', '/', params, headers)
+        try:
+            response = self._connection.getresponse()
+        except (httplib.HTTPException, socket.error):
+            self.close()
+            raise
         responseResult = response.read()
-        conn.close()
+        if response.will_close:
+            self.close()
         return self._responseParser.parse(actionName, response.status, response.reason, responseResult)
+
+    def _getConnection(self):
+        # one connection is kept open and reused for every action
+        if self._connection is None:
+            #https://email.us-east-1.amazonaws.com/
+            self._connection = httplib.HTTPSConnection('email.us-east-1.amazonaws.com')
+        return self._connection
+
+    def _isStale(self):
+        # an idle kept-alive socket that is readable was closed by SES
+        sock = self._connection.sock
+        if sock is None:
+            return False
+        try:
+            return bool(select.select([sock], [], [], 0)[0])
+        except (select.error, socket.error, ValueError):
+            return True
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
         
     def verifyEmailAddress(self, emailAddress):
         params = { 'EmailAddress': emailAddress }
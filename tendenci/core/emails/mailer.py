@@ -0,0 +1,143 @@
+"""
+Outbound mail in batches.
+
+Sending EmailMessages one at a time opens a connection to the mail
+server for each one. BatchMailer sends them with send_messages() over
+one connection per batch, optionally at a limited rate, and logs the
+throughput of each batch.
+"""
+import logging
+import time
+
+from django.conf import settings
+from django.core.mail import get_connection
+from django.core.mail.message import sanitize_address
+
+logger = logging.getLogger(__name__)
+
+
+def encode_message(message):
+    """
+    Builds the message and its addresses the way the smtp backend
+    does, raising the UnicodeError it would raise while sending.
+    """
+    message.message()
+    sanitize_address(message.from_email, message.encoding)
+    for address in message.recipients():
+        sanitize_address(address, message.encoding)
+
+
+class BatchMailer(object):
+    """
+    Collects EmailMessages and sends them a batch at a time:
+
+        with BatchMailer() as mailer:
+            for message in messages:
+                mailer.add(message)
+
+    batch_size defaults to settings.EMAIL_BATCH_SIZE, and rate_limit,
+    in messages per second, to settings.EMAIL_RATE_LIMIT (0 is no limit).
+    """
+    def __init__(self, batch_size=None, rate_limit=None, fail_silently=False,
+                 connection=None):
+        if batch_size is None:
+            batch_size = getattr(settings, 'EMAIL_BATCH_SIZE', 100)
+        if rate_limit is None:
+            rate_limit = getattr(settings, 'EMAIL_RATE_LIMIT', 0)
+        self.batch_size = max(1, batch_size)
+        self.rate_limit = rate_limit
+        self.fail_silently = fail_silently
+        self.connection = connection or get_connection(fail_silently=fail_silently)
+
+        self.messages = []
+        self.num_sent = 0
+        # (number of messages, number sent, seconds) per batch
+        self.batches = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        if exc_type is None:
+            self.flush()
+        self.close()
+
+    def add(self, message):
+        self.messages.append(message)
+        if len(self.messages) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.messages:
+            return 0
+        messages, self.messages = self.messages, []
+
+        # a message that can't be encoded is found before any of the
+        # batch is sent, the backend would fail on it part way through
+        # after sending the ones before it
+        encodable = []
+        for message in messages:
+            try:
+                encode_message(message)
+            except UnicodeError:
+                if not self.fail_silently:
+                    raise
+                logger.warning('skipped an email that can\'t be encoded: %r' % message.subject)
+            else:
+                encodable.append(message)
+
+        started = time.time()
+        sent = 0
+        if encodable:
+            self.connection.open()
+            sent = self.connection.send_messages(encodable) or 0
+        elapsed = time.time() - started
+
+        if self.rate_limit:
+            wait = len(messages) / float(self.rate_limit) - elapsed
+            if wait > 0:
+                time.sleep(wait)
+
+        self.num_sent += sent
+        self.batches.append((len(messages), sent, elapsed))
+        logger.info('sent %d of %d emails in %.2fs (%.1f/s)' % (
+            sent, len(messages), elapsed, sent / elapsed if elapsed else sent))
+        return sent
+
+    def close(self):
+        try:
+            self.connection.close()
+        except Exception:
+            if not self.fail_silently:
+                raise
+
+
+def send_messages(messages, fail_silently=False, background=None):
+    """
+    Send the EmailMessages in batches over shared connections.
+
+    With background, or settings.EMAIL_SEND_IN_BACKGROUND, the messages
+    are queued for the run_jobs worker instead, and None is returned.
+    Otherwise returns the number of messages sent.
+    """
+    messages = list(messages)
+    if not messages:
+        return 0
+    if background is None:
+        background = getattr(settings, 'EMAIL_SEND_IN_BACKGROUND', False)
+
+    if background:
+        from tendenci.core.background_jobs.utils import enqueue
+        for message in messages:
+            # the worker opens its own connection
+            message.connection = None
+        # each batch is new, and EmailMessage has no __eq__ to dedupe on
+        enqueue('send_email_batch', options={'messages': messages,
+                                             'fail_silently': fail_silently},
+                unique=False)
+        return None
+
+    with BatchMailer(fail_silently=fail_silently) as mailer:
+        for message in messages:
+            mailer.add(message)
+    return mailer.num_sent
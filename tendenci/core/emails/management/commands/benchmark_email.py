@@ -0,0 +1,80 @@
+from optparse import make_option
+from timeit import default_timer
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    """
+    Send generated emails one connection per message, the old way,
+    and in batches with the BatchMailer, and report the throughput.
+
+    Run it against a local SMTP sink so nothing is delivered:
+        ./manage.py smtp_sink --port 1025
+        ./manage.py benchmark_email --host 127.0.0.1 --port 1025 --count 1000
+    """
+    help = 'Benchmark sending email one at a time and in batches'
+
+    option_list = BaseCommand.option_list + (
+        make_option('--count',
+            action='store',
+            dest='count',
+            type='int',
+            default=1000,
+            help='Number of emails to send each way'),
+        make_option('--batch-size',
+            action='store',
+            dest='batch_size',
+            type='int',
+            default=None,
+            help='Emails per connection, settings.EMAIL_BATCH_SIZE by default'),
+        make_option('--host',
+            action='store',
+            dest='host',
+            default='127.0.0.1',
+            help='SMTP host'),
+        make_option('--port',
+            action='store',
+            dest='port',
+            type='int',
+            default=1025,
+            help='SMTP port'),
+        )
+
+    def handle(self, *args, **options):
+        from django.core.mail import EmailMessage, get_connection
+        from tendenci.core.emails.mailer import BatchMailer
+
+        count = options['count']
+
+        def connection():
+            return get_connection('django.core.mail.backends.smtp.EmailBackend',
+                                  host=options['host'], port=options['port'],
+                                  username='', password='', use_tls=False)
+
+        def messages():
+            for i in range(count):
+                yield EmailMessage('Benchmark %d' % i, 'body %d' % i,
+                                   'sender@example.com',
+                                   ['recipient%d@example.com' % i],
+                                   connection=None)
+
+        start = default_timer()
+        for message in messages():
+            message.connection = connection()
+            message.send()
+        single = default_timer() - start
+
+        start = default_timer()
+        with BatchMailer(batch_size=options['batch_size'], rate_limit=0,
+                         connection=connection()) as mailer:
+            for message in messages():
+                mailer.add(message)
+        batched = default_timer() - start
+
+        print "emails: %d" % count
+        print "one connection each: %.2f s (%.0f/s)" % (single, count / single)
+        print "batches of %d: %.2f s (%.0f/s)" % (mailer.batch_size, batched,
+                                                  count / batched)
+        for size, sent, elapsed in mailer.batches[:5]:
+            print "  batch: %d sent in %.3f s" % (sent, elapsed)
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    """
+    Send the EmailMessages queued by emails.mailer.send_messages().
+    Only run by the run_jobs worker, the messages come in the job options.
+    """
+    help = 'Send a queued batch of emails'
+
+    def handle(self, *args, **options):
+        from tendenci.core.emails.mailer import send_messages
+
+        messages = options.get('messages') or []
+        sent = send_messages(messages,
+                             fail_silently=options.get('fail_silently', False),
+                             background=False)
+        if int(options.get('verbosity', 1)) > 1:
+            print "sent %d of %d emails" % (sent, len(messages))
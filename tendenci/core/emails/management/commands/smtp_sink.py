@@ -0,0 +1,54 @@
+import asyncore
+import smtpd
+import time
+from optparse import make_option
+
+from django.core.management.base import BaseCommand
+
+
+class SinkServer(smtpd.SMTPServer):
+    """
+    Accepts every message and throws it away, counting them.
+    """
+    def __init__(self, *args, **kwargs):
+        smtpd.SMTPServer.__init__(self, *args, **kwargs)
+        self.num_messages = 0
+        self.num_recipients = 0
+        self.started = None
+
+    def process_message(self, peer, mailfrom, rcpttos, data):
+        if self.started is None:
+            self.started = time.time()
+        self.num_messages += 1
+        self.num_recipients += len(rcpttos)
+
+
+class Command(BaseCommand):
+    """
+    Run a local SMTP server that discards the mail it gets, to test
+    sending without delivering anything. Point EMAIL_HOST and
+    EMAIL_PORT at it.
+
+    Usage: ./manage.py smtp_sink --port 1025
+    """
+    help = 'Run a local SMTP server that discards all mail'
+
+    option_list = BaseCommand.option_list + (
+        make_option('--port',
+            action='store',
+            dest='port',
+            type='int',
+            default=1025,
+            help='Port to listen on'),
+        )
+
+    def handle(self, *args, **options):
+        server = SinkServer(('127.0.0.1', options['port']), None)
+        print "SMTP sink at 127.0.0.1:%d" % options['port']
+        try:
+            asyncore.loop()
+        except KeyboardInterrupt:
+            pass
+        elapsed = time.time() - server.started if server.started else 0
+        print "%d messages, %d recipients in %.1fs" % (
+            server.num_messages, server.num_recipients, elapsed)
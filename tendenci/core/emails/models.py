@@ -33,7 +33,21 @@ class Email(TendenciBaseModel):
     def __unicode__(self):
         return self.subject
     
-    def send(self, fail_silently=False):
+    def send(self, fail_silently=False, connection=None):
+        """
+        Send the email. Pass a connection, or use
+        emails.mailer.BatchMailer with message(), to send
+        many emails over one connection.
+        """
+        msg = self.message(connection=connection)
+        if msg:
+            msg.send(fail_silently=fail_silently)
+
+    def message(self, connection=None):
+        """
+        Returns the EmailMessage for this email,
+        or None if it has no recipients.
+        """
         recipient_list = []
         recipient_bcc_list = []
         headers = {}
@@ -67,10 +81,12 @@ class Email(TendenciBaseModel):
                                self.sender,
                                recipient_list,
                                recipient_bcc_list,
-                               headers=headers )
+                               headers=headers,
+                               connection=connection)
             if self.content_type == 'html' or self.content_type == 'text/html':
                 msg.content_subtype = 'html'
-            msg.send(fail_silently=fail_silently)
+            return msg
+        return None
     
     def save(self, user=None):
         if not self.id:
@@ -0,0 +1,86 @@
+import atexit
+import threading
+import time
+
+from django.conf import settings
+
+
+class EventLogBuffer(object):
+    """
+    In-memory queue of unsaved EventLog instances.
+
+    Records are written with bulk_create when the buffer reaches
+    EVENT_LOG_BUFFER_SIZE items or once EVENT_LOG_FLUSH_INTERVAL seconds
+    have passed since the last write. The size and age are checked on
+    every append and at the end of every response (see
+    EventLogMiddleware), and the optional background writer flushes
+    on a timer so a quiet process does not hold records indefinitely.
+    """
+    def __init__(self, size=None, interval=None):
+        self.size = size or getattr(settings, 'EVENT_LOG_BUFFER_SIZE', 50)
+        self.interval = interval or getattr(settings, 'EVENT_LOG_FLUSH_INTERVAL', 5)
+        self._records = []
+        self._lock = threading.Lock()
+        self._last_flush = time.time()
+        self._writer = None
+
+    def __len__(self):
+        return len(self._records)
+
+    def append(self, event_log):
+        with self._lock:
+            self._records.append(event_log)
+        self.flush_if_due()
+
+    def flush_if_due(self):
+        full = len(self._records) >= self.size
+        stale = (time.time() - self._last_flush) >= self.interval
+        if full or stale:
+            return self.flush()
+        return 0
+
+    def flush(self):
+        """
+        Write every queued record and return the number written.
+        """
+        with self._lock:
+            records, self._records = self._records, []
+            self._last_flush = time.time()
+
+        if not records:
+            return 0
+
+        model = records[0].__class__
+        # Django 1.4 bulk_create has no batch_size,
+        # so chunk here to stay under backend parameter limits.
+        for i in range(0, len(records), self.size):
+            model.objects.bulk_create(records[i:i + self.size])
+
+        return len(records)
+
+    def start_writer(self):
+        """
+        Start a daemon thread that flushes the buffer every
+        EVENT_LOG_FLUSH_INTERVAL seconds.
+        """
+        if self._writer and self._writer.is_alive():
+            return
+
+        def run():
+            while True:
+                time.sleep(self.interval)
+                try:
+                    self.flush()
+                except Exception:
+                    pass
+
+        self._writer = threading.Thread(target=run, name='event-log-writer')
+        self._writer.daemon = True
+        self._writer.start()
+
+
+event_log_buffer = EventLogBuffer()
+atexit.register(event_log_buffer.flush)
+
+if getattr(settings, 'EVENT_LOG_BACKGROUND_WRITER', False):
+    event_log_buffer.start_writer()
@@ -0,0 +1,83 @@
+from optparse import make_option
+from timeit import default_timer
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    """
+    Measure the per-request overhead of EventLog.objects.log()
+    with stack inspection and synchronous saves versus the
+    buffered, stack-free mode.
+
+    Everything written is rolled back at the end.
+
+    Usage: ./manage.py benchmark_event_logs --requests 500 --depth 30
+    """
+    help = 'Benchmark EventLog.objects.log() in direct and buffered modes'
+
+    option_list = BaseCommand.option_list + (
+        make_option('--requests',
+            action='store',
+            dest='requests',
+            type='int',
+            default=500,
+            help='Number of simulated requests per mode'),
+        make_option('--depth',
+            action='store',
+            dest='depth',
+            type='int',
+            default=30,
+            help='Extra stack frames above the view, like middleware and handlers'),
+        )
+
+    def handle(self, *args, **options):
+        from django.conf import settings
+        from django.contrib.auth.models import AnonymousUser
+        from django.db import transaction
+        from django.test.client import RequestFactory
+        from tendenci.core.event_logs.buffer import event_log_buffer
+        from tendenci.core.event_logs.middleware import EventLogMiddleware
+        from tendenci.core.event_logs.models import EventLog
+
+        num_requests = options['requests']
+        depth = options['depth']
+        middleware = EventLogMiddleware()
+
+        request = RequestFactory().get('/articles/', HTTP_USER_AGENT='Mozilla/5.0')
+        request.user = AnonymousUser()
+
+        def detail(request):
+            EventLog.objects.log()
+
+        def call_view(level):
+            if level:
+                return call_view(level - 1)
+            middleware.process_view(request, detail, (), {})
+            detail(request)
+            middleware.process_response(request, None)
+
+        def run(buffered):
+            settings.EVENT_LOG_BUFFERED = buffered
+            start = default_timer()
+            for i in range(num_requests):
+                call_view(depth)
+            event_log_buffer.flush()
+            return (default_timer() - start) * 1000.0 / num_requests
+
+        original = getattr(settings, 'EVENT_LOG_BUFFERED', False)
+        transaction.enter_transaction_management()
+        transaction.managed(True)
+        try:
+            direct = run(False)
+            buffered = run(True)
+        finally:
+            settings.EVENT_LOG_BUFFERED = original
+            transaction.rollback()
+            transaction.leave_transaction_management()
+
+        print "requests per mode: %d, stack depth: %d" % (num_requests, depth)
+        print "direct (stack + save):      %.3f ms/request" % direct
+        print "buffered (stack-free bulk): %.3f ms/request" % buffered
+        if buffered:
+            print "speedup: %.1fx" % (direct / buffered)
@@ -12,6 +12,8 @@ from django.db.models import Q
 from django.conf import settings
 
 from tendenci.core.robots.models import Robot
+from tendenci.core.event_logs.buffer import event_log_buffer
+from tendenci.core.event_logs.middleware import get_current_view
 
 
 default_keyword_args = (
@@ -28,6 +30,25 @@ default_keyword_args = (
     'source',
 )
 
+_server_ip_address = None
+
+
+def get_server_ip_address():
+    """
+    Resolve the server ip address once per process instead
+    of doing a hostname lookup for every event log.
+    """
+    global _server_ip_address
+    if _server_ip_address is None:
+        try:
+            _server_ip_address = settings.INTERNAL_IPS[0]
+        except:
+            try:
+                _server_ip_address = gethostbyname(gethostname())
+            except:
+                _server_ip_address = '0.0.0.0'
+    return _server_ip_address
+
 
 class EventLogManager(Manager):
     def search(self, query=None, *args, **kwargs):
@@ -95,11 +116,20 @@ class EventLogManager(Manager):
         
             EventLog.objects.log(instance=obj_local_var)
 
+        With settings.EVENT_LOG_BUFFERED the request, application and
+        action come from the kwargs and the view resolved by
+        EventLogMiddleware instead of the call stack, and the event log
+        is queued and written in batches. Pass immediate=True when the
+        saved event log (e.g. its pk) is needed right away.
         """
         request, user, instance = None, None, None
         event_log = self.model()
 
-        stack = inspect.stack()
+        buffered = getattr(settings, 'EVENT_LOG_BUFFERED', False)
+        if buffered:
+            view_request, view_func = get_current_view()
+        else:
+            stack = inspect.stack()
 
         # Set the following fields to blank
         event_log.guid = ""
@@ -138,7 +168,10 @@ class EventLogManager(Manager):
         if 'application' in kwargs:
             event_log.application = kwargs['application']
 
-        if not event_log.application:
+        if not event_log.application and buffered:
+            event_log.application = getattr(view_func, '__module__', '') or ''
+
+        if not event_log.application and not buffered:
             event_log.application = inspect.getmodule(stack[1][0]).__name__
             if "perms" in event_log.application.split('.'):
                 event_log.application = inspect.getmodule(stack[2][0]).__name__
@@ -170,6 +203,8 @@ class EventLogManager(Manager):
         # updating. - JMO 2012-05-14
         if 'action' in kwargs:
             event_log.action = kwargs['action']
+        elif buffered:
+            event_log.action = getattr(view_func, '__name__', '')
         else:
             event_log.action = stack[1][3]
             if stack[1][3] == "save":
@@ -188,6 +223,8 @@ class EventLogManager(Manager):
         # by inspecting the stack. We dive 3 levels if necessary. - JMO 2012-05-14
         if 'request' in kwargs:
             request = kwargs['request']
+        elif buffered:
+            request = view_request
         else:
             if 'request' in inspect.getargvalues(stack[1][0]).locals:
                 request = inspect.getargvalues(stack[1][0]).locals['request']
@@ -253,17 +290,14 @@ class EventLogManager(Manager):
                 if robot:
                     event_log.robot = robot
 
-            try:
-                event_log.server_ip_address = settings.INTERNAL_IPS[0]
-            except:
-                try:
-                    event_log.server_ip_address = gethostbyname(gethostname())
-                except:
-                    event_log.server_ip_address = '0.0.0.0'
+            event_log.server_ip_address = get_server_ip_address()
             if hasattr(request, 'path'):
                 event_log.url = request.path or ''
 
-        event_log.save()
+        if buffered and not kwargs.get('immediate', False):
+            event_log_buffer.append(event_log)
+        else:
+            event_log.save()
 
         return event_log
 
@@ -0,0 +1,43 @@
+try:
+    from threading import local
+except ImportError:
+    from django.utils._threading_local import local
+
+from django.conf import settings
+
+_thread_locals = local()
+
+
+def get_current_view():
+    """
+    Returns (request, view_func) for the view being run
+    in this thread, or (None, None) outside of a request.
+    """
+    return (getattr(_thread_locals, 'request', None),
+            getattr(_thread_locals, 'view_func', None))
+
+
+class EventLogMiddleware(object):
+    """
+    Records the resolved view so EventLog.objects.log() can find the
+    request, application and action without inspecting the stack,
+    and flushes buffered event logs once they are due.
+    """
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        _thread_locals.request = request
+        _thread_locals.view_func = view_func
+
+    def process_response(self, request, response):
+        self._finish()
+        return response
+
+    def process_exception(self, request, exception):
+        self._finish()
+
+    def _finish(self):
+        _thread_locals.request = None
+        _thread_locals.view_func = None
+
+        if getattr(settings, 'EVENT_LOG_BUFFERED', False):
+            from tendenci.core.event_logs.buffer import event_log_buffer
+            event_log_buffer.flush_if_due()
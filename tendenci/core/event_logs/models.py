@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from django.db import models
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.auth.models import User
@@ -32,7 +34,9 @@ class EventLog(models.Model):
     request_method = models.CharField(max_length=10, null=True)
     query_string = models.TextField(null=True)
     robot = models.ForeignKey(Robot, null=True, on_delete=models.SET_NULL)
-    create_dt = models.DateTimeField(auto_now_add=True)
+    # a default rather than auto_now_add, so buffered logs keep the
+    # time they were logged instead of the time they were flushed
+    create_dt = models.DateTimeField(default=datetime.now)
 
     uuid = models.CharField(max_length=40)
     application = models.CharField(max_length=50, db_index=True)
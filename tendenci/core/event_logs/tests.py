@@ -4,7 +4,11 @@ unittest). These will both pass when you run "manage.py test".
 
 Replace these with more appropriate tests for your application.
 """
+import time
+
 from django.test import TestCase, Client
+from django.test.client import RequestFactory
+from django.test.utils import override_settings
 from django.contrib.auth.models import User
 
 from tendenci.core.event_logs.models import EventLog
@@ -118,4 +122,31 @@ class EventLogTest(TestCase):
         
         self.assertRaises(Exception, EventLog.objects.log(**event_log_defaults))       
         
-            
\ No newline at end of file
+            
+    @override_settings(EVENT_LOG_BUFFERED=True)
+    def test_log_buffered(self):
+        """
+            Buffered event logs are queued without stack
+            inspection and written on flush
+        """
+        from tendenci.core.event_logs.buffer import event_log_buffer
+
+        request = RequestFactory().get('/')
+        request.user = self.user
+        count = EventLog.objects.count()
+
+        event_log = EventLog.objects.log(request=request,
+                                         application='event_logs',
+                                         action='test')
+        self.assertEqual(event_log.pk, None)
+        self.assertEqual(event_log.action, 'test')
+        logged_dt = event_log.create_dt
+
+        time.sleep(1)
+        event_log_buffer.flush()
+        self.assertEqual(EventLog.objects.count(), count + 1)
+
+        # stamped when logged, not when flushed
+        saved = EventLog.objects.filter(action='test').latest('pk')
+        self.assertEqual(saved.create_dt.replace(microsecond=0),
+                         logged_dt.replace(microsecond=0))
@@ -1,10 +1,17 @@
-import subprocess
 import datetime
 import csv
 from StringIO import StringIO
 from django.http import HttpResponse
 from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db.models.fields import DateTimeField
+from django.db.models.fields.related import ManyToManyField, ForeignKey
+from django.contrib.contenttypes import generic
+from django.contrib.contenttypes.models import ContentType
+from tendenci.core.base.utils import UnicodeWriter
 from tendenci.core.exports.models import Export
+from tendenci.core.background_jobs.utils import enqueue
 
 
 def full_model_to_dict(instance, fields=None, exclude=None):
@@ -61,6 +68,122 @@ def render_csv(filename, title_list, data_list):
     return response
 
 
+EXPORT_CHUNK_SIZE = 1000
+
+
+def get_export_columns(model, fields):
+    """
+    Returns a (field_name, kind, field) tuple per export column,
+    worked out once per model instead of once per row.
+    Fields the model doesn't have are exported empty.
+    """
+    opts = model._meta
+    model_fields = dict((f.name, f) for f in opts.fields + opts.many_to_many)
+    columns = []
+    for field_name in fields:
+        f = model_fields.get(field_name)
+        if f is None:
+            kind = 'missing'
+        elif isinstance(f, ManyToManyField):
+            kind = 'm2m'
+        elif isinstance(f, generic.GenericRelation):
+            kind = 'generic'
+        elif isinstance(f, DateTimeField):
+            kind = 'datetime'
+        else:
+            # foreign keys export their id, read from the row itself
+            kind = 'value'
+        columns.append((field_name, kind, f))
+    return columns
+
+
+def get_related_values(model, columns, pks):
+    """
+    Returns {field_name: {pk: [unicode, ...]}} for the many to many
+    and generic relation columns, with one query per column.
+    """
+    related = {}
+    for field_name, kind, f in columns:
+        values = dict((pk, []) for pk in pks)
+        if kind == 'm2m':
+            source = f.m2m_field_name()
+            target = f.m2m_reverse_field_name()
+            links = f.rel.through.objects.filter(
+                **{'%s__in' % source: pks}).select_related(target).order_by('pk')
+            for link in links:
+                values[getattr(link, '%s_id' % source)].append(
+                    "%s" % getattr(link, target))
+        elif kind == 'generic':
+            content_type = ContentType.objects.get_for_model(model)
+            objects = f.rel.to.objects.filter(**{
+                f.content_type_field_name: content_type,
+                '%s__in' % f.object_id_field_name: pks})
+            for obj in objects:
+                values[getattr(obj, f.object_id_field_name)].append("%s" % obj)
+        else:
+            continue
+        related[field_name] = values
+    return related
+
+
+def iter_export_rows(queryset, fields, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Yields a list of unicode values per object in the queryset.
+
+    The objects are read a chunk at a time in pk order, and the
+    related values of each chunk are loaded in bulk, so the memory
+    used doesn't grow with the number of rows.
+    """
+    model = queryset.model
+    columns = get_export_columns(model, fields)
+    queryset = queryset.order_by('pk')
+    last_pk = None
+    while True:
+        chunk = queryset
+        if last_pk is not None:
+            chunk = chunk.filter(pk__gt=last_pk)
+        chunk = list(chunk[:chunk_size])
+        if not chunk:
+            break
+        last_pk = chunk[-1].pk
+        related = get_related_values(model, columns,
+                                     [item.pk for item in chunk])
+
+        for item in chunk:
+            row = []
+            for field_name, kind, f in columns:
+                if kind == 'missing':
+                    value = ''
+                elif kind in related:
+                    value = related[field_name][item.pk]
+                else:
+                    value = f.value_from_object(item)
+                    if kind == 'datetime':
+                        value = value.strftime("%Y-%m-%d %H:%M") if value else ''
+                # clean the derived values into unicode
+                row.append(unicode(value).rstrip())
+            yield row
+
+
+def write_export_csv(file_path, title_list, rows):
+    """
+    Writes the rows to a csv file in the default storage as
+    they come, and returns the name the file was saved under.
+    """
+    # creates the directories and picks a free name
+    file_path = default_storage.save(file_path, ContentFile(''))
+    with default_storage.open(file_path, 'wb') as csvfile:
+        csv_writer = UnicodeWriter(csvfile, encoding='utf-8')
+        csv_writer.writerow(title_list)
+        for row in rows:
+            csv_writer.writerow(row)
+    return file_path
+
+
+def get_export_file_path(export, file_name):
+    return 'export/%s/%d_%s' % (export.app_label, export.pk, file_name)
+
+
 def run_export_task(app_label, model_name, fields, memb_app=None):
     export = Export.objects.create(
         app_label=app_label,
@@ -69,7 +192,7 @@ def run_export_task(app_label, model_name, fields, memb_app=None):
     )
 
     if settings.USE_SUBPROCESS:
-        subprocess.Popen(['python', 'manage.py', 'run_export_task', unicode(export.pk)] + fields)
+        enqueue('run_export_task', [export.pk] + fields)
     else:
         from django.core.management import call_command
         args = [unicode(export.pk)] + fields
@@ -2,6 +2,8 @@ from datetime import datetime
 from django.shortcuts import render_to_response, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.template import RequestContext
+from django.core.files.storage import default_storage
+from django.http import HttpResponse, Http404
 
 from johnny.cache import invalidate
 
@@ -39,6 +41,19 @@ def download(request, export_id):
     EventLog.objects.log(instance=export)
 
     if export.status == "completed":
+        if isinstance(export.result, basestring):
+            # the csv file written by the streaming export
+            if not default_storage.exists(export.result):
+                raise Http404
+            # read whole, GZipMiddleware would consume an iterator;
+            # the file isn't redirected to, exports are superuser only
+            f = default_storage.open(export.result)
+            try:
+                response = HttpResponse(f.read(), mimetype='text/csv')
+            finally:
+                f.close()
+            response['Content-Disposition'] = 'attachment; filename=%s.csv' % export.model_name
+            return response
         response = export.result
         return response
 
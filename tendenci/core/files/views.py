@@ -25,7 +25,7 @@ from tendenci.core.site_settings.utils import get_setting
 from tendenci.core.perms.decorators import admin_required, is_enabled
 from tendenci.core.perms.object_perms import ObjectPermission
 from tendenci.core.perms.utils import (
-    update_perms_and_save, has_perm, has_view_perm, get_query_filters)
+    update_perms_and_save, has_perm, has_view_perm, get_query_filters, distinct_if_needed)
 from tendenci.core.categories.forms import CategoryForm
 from tendenci.core.categories.models import Category
 from tendenci.core.event_logs.models import EventLog
@@ -196,7 +196,7 @@ def search(request, template_name="files/search.html"):
             files = files.filter(sub_category=sub_category)
     else:
         filters = get_query_filters(request.user, 'files.view_file')
-        files = File.objects.filter(filters).distinct()
+        files = distinct_if_needed(File.objects.filter(filters))
         if category:
             files = files.filter(categories__category__name=category)
         if sub_category:
@@ -1,37 +1,7 @@
 from django.conf import settings
 
-mobile_agents = [
-#    'iPad',  # Removed on 2012-07-11
-    'iPhone',
-    'iPod',
-    'Android',
-    'Opera Mini',
-    'Blackberry',
-    'Droid',
-    'IEMobile',
-    'EudoraWeb',
-    'Fennec',
-    'Minimo',
-    'NetFront',
-    'Polaris',
-    'HTC_Dream',
-    'HTC Hero',
-    'HTC-ST7377',
-    'Kindle',
-    'LG-LX550',
-    'LX265',
-    'Nokia',
-    'Palm',
-    'MOT-V9mm',
-    'SEC-SGHE900',
-    'SAMSUNG-SGH-A867',
-    'SymbianOS',
-    'DoCoMo',
-    'ZuneHD',
-    'ReqwirelessWeb',
-    'SEJ001',
-    'SonyEricsson'
-]
+from tendenci.core.robots.classifier import classifier, mobile_agents
+
 
 def user_agent(request):
     if 'HTTP_USER_AGENT' in request.META:
@@ -47,9 +17,7 @@ def is_mobile_cookie_on(request):
 
 def is_mobile_browser(request):
     if request.user_agent:
-        for ma in mobile_agents:
-            if ma.lower() in request.user_agent:
-                return True
+        return classifier.is_mobile(request.user_agent)
     return False
     
 def show_mobile(request):
@@ -1,9 +1,10 @@
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.auth.models import User, Permission
+from django.db.models import Q
 from django.db.models.base import Model
 
 from tendenci.core.perms.object_perms import ObjectPermission
-from tendenci.core.perms.utils import can_view
+from tendenci.core.perms.utils import can_view, get_user_group_ids
 
 
 class ObjectPermBackend(object):
@@ -62,44 +63,80 @@ class ObjectPermBackend(object):
         if user_obj.is_anonymous():
             return set()
         if not hasattr(user_obj, '_perm_cache'):
-            user_obj._perm_cache = set([u"%s.%s" % (p.content_type.app_label, p.codename) for p in user_obj.user_permissions.select_related()])
+            user_obj._perm_cache = set([u"%s.%s" % (p.content_type.app_label, p.codename) for p in user_obj.user_permissions.select_related('content_type')])
             user_obj._perm_cache.update(self.get_group_permissions(user_obj))
         return user_obj._perm_cache
 
-    def get_group_object_permissions(self, user_obj, obj):
-        app_label = obj._meta.app_label
-        user_obj_attr = '_%s_%d_group_object_perm_cache' % (
-            app_label,
-            obj.pk
+    def _load_object_permissions(self, user_obj, content_type, object_ids):
+        """
+        Loads the user and group object permissions of user_obj for
+        the given objects of one content type with a single query
+        and stores them in the per-request caches on user_obj,
+        keyed by (content type id, object id).
+        """
+        if not hasattr(user_obj, '_object_perm_cache'):
+            user_obj._object_perm_cache = {}
+            user_obj._group_object_perm_cache = {}
+        user_cache = user_obj._object_perm_cache
+        group_cache = user_obj._group_object_perm_cache
+
+        for object_id in object_ids:
+            user_cache[(content_type.pk, object_id)] = set()
+            group_cache[(content_type.pk, object_id)] = set()
+
+        group_ids = get_user_group_ids(user_obj)
+        owner_q = Q(user=user_obj)
+        if group_ids:
+            owner_q = owner_q | Q(group__in=group_ids)
+        perms = ObjectPermission.objects.filter(
+            owner_q,
+            content_type=content_type,
+            object_id__in=object_ids,
         )
-        if not hasattr(user_obj, user_obj_attr):
+
+        for p in perms:
+            key = (content_type.pk, p.object_id)
+            perm = u"%s.%s.%s" % (p.object_id, content_type.app_label, p.codename)
+            if p.group_id in group_ids:
+                group_cache[key].add(perm)
+            if p.user_id == user_obj.pk:
+                user_cache[key].add(perm)
+
+    def _get_object_perm_key(self, user_obj, obj):
+        content_type = ContentType.objects.get_for_model(obj)
+        key = (content_type.pk, obj.pk)
+        if key not in getattr(user_obj, '_object_perm_cache', {}):
+            self._load_object_permissions(user_obj, content_type, [obj.pk])
+        return key
+
+    def prefetch_object_permissions(self, user_obj, objects):
+        """
+        Loads the object permissions of user_obj for a list of
+        objects up front, one query per content type, so has_perm
+        calls on them (e.g. in a listing template) do not query.
+        """
+        if user_obj.is_anonymous():
+            return
+
+        cache = getattr(user_obj, '_object_perm_cache', {})
+        object_ids = {}
+        for obj in objects:
+            if not isinstance(obj, Model) or obj.pk is None:
+                continue
             content_type = ContentType.objects.get_for_model(obj)
-            filters = {
-               'group__members': user_obj,
-               'content_type': content_type,
-               'object_id': obj.pk
-            }
-            group_object_perms = ObjectPermission.objects.filter(**filters)
-            user_obj._group_object_perm_cache = set([u"%s.%s.%s" % (p.object_id, p.content_type.app_label, p.codename) for p in group_object_perms])
-        return user_obj._group_object_perm_cache
+            if (content_type.pk, obj.pk) not in cache:
+                object_ids.setdefault(content_type, set()).add(obj.pk)
+
+        for content_type, ids in object_ids.items():
+            self._load_object_permissions(user_obj, content_type, list(ids))
+
+    def get_group_object_permissions(self, user_obj, obj):
+        key = self._get_object_perm_key(user_obj, obj)
+        return user_obj._group_object_perm_cache[key]
 
     def get_all_object_permissions(self, user_obj, obj):
-        app_label = obj._meta.app_label
-        user_obj_attr = '_%s_%d_object_perm_cache' % (
-            app_label,
-            obj.pk
-        )
-        if not hasattr(user_obj, user_obj_attr):
-            content_type = ContentType.objects.get_for_model(obj)
-            filters = {
-                'content_type': content_type,
-                'object_id': obj.pk,
-                'user': user_obj
-            }
-            perms = ObjectPermission.objects.filter(**filters)
-            user_obj._object_perm_cache = set([u"%s.%s.%s" % (p.object_id, p.content_type.app_label, p.codename) for p in perms])
-            user_obj._object_perm_cache.update(self.get_group_object_permissions(user_obj, obj))
-        return user_obj._object_perm_cache
+        key = self._get_object_perm_key(user_obj, obj)
+        return user_obj._object_perm_cache[key] | user_obj._group_object_perm_cache[key]
 
     def has_perm(self, user, perm, obj=None):
         # check codename, return false if its a malformed codename
@@ -183,3 +220,15 @@ class ObjectPermBackend(object):
             return User.objects.get(pk=user_id)
         except User.DoesNotExist:
             return None
+
+
+def prefetch_object_permissions(user, objects):
+    """
+    Loads the object permissions of user for the objects in bulk.
+    Call it with a page of results before the template checks
+    has_perm on each of them.
+    """
+    backend = ObjectPermBackend()
+    for u in (user, getattr(user, 'impersonated_user', None)):
+        if isinstance(u, User):
+            backend.prefetch_object_permissions(u, objects)
@@ -0,0 +1,141 @@
+from optparse import make_option
+from timeit import default_timer
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    """
+    Compare list queries filtered with get_query_filters() through the
+    perms join and through the visibility index, for a member and a
+    user in several groups. The querysets are built as the list views
+    build them, with distinct_if_needed(), so the joined lists are
+    queried with DISTINCT and the indexed ones without. Anonymous users
+    and superusers are left out, their filters are the same either way.
+
+    Articles, news and pages are created in bulk, a share of them get
+    group view permissions, and everything is rolled back at the end.
+
+    Usage: ./manage.py benchmark_query_filters --objects 20000 --queries 20
+    """
+    help = 'Benchmark get_query_filters with and without the visibility index'
+
+    option_list = BaseCommand.option_list + (
+        make_option('--objects',
+            action='store',
+            dest='objects',
+            type='int',
+            default=20000,
+            help='Number of objects to create per model'),
+        make_option('--groups',
+            action='store',
+            dest='groups',
+            type='int',
+            default=10,
+            help='Number of groups the grouped user belongs to'),
+        make_option('--queries',
+            action='store',
+            dest='queries',
+            type='int',
+            default=20,
+            help='Number of list queries per user and mode'),
+        )
+
+    def handle(self, *args, **options):
+        from django.conf import settings
+        from django.contrib.auth.models import User
+        from django.contrib.contenttypes.models import ContentType
+        from django.db import transaction
+        from tendenci.addons.articles.models import Article
+        from tendenci.addons.news.models import News
+        from tendenci.apps.pages.models import Page
+        from tendenci.apps.profiles.models import Profile
+        from tendenci.apps.user_groups.models import Group, GroupMembership
+        from tendenci.core.perms.object_perms import ObjectPermission
+        from tendenci.core.perms.utils import get_query_filters, distinct_if_needed
+        from tendenci.core.perms.visibility import rebuild_visibility
+
+        num_objects = options['objects']
+        num_groups = options['groups']
+        num_queries = options['queries']
+
+        original = getattr(settings, 'PERMS_VISIBILITY_INDEX', False)
+        transaction.enter_transaction_management()
+        transaction.managed(True)
+        try:
+            # the index is rebuilt in bulk below
+            settings.PERMS_VISIBILITY_INDEX = False
+
+            member = User.objects.create(username='benchmark_member')
+            Profile.objects.create_profile(member)
+            Profile.objects.filter(user=member).update(member_number='BENCH1')
+            grouped = User.objects.create(username='benchmark_grouped')
+            Profile.objects.create_profile(grouped)
+
+            groups = []
+            for i in range(num_groups):
+                group = Group.objects.create(name='benchmark group %d' % i,
+                                             slug='benchmark-group-%d' % i,
+                                             label='benchmark group %d' % i)
+                GroupMembership.objects.create(group=group, member=grouped)
+                groups.append(group)
+
+            models = [
+                (Article, {'headline': 'Article', 'body': 'body', 'group': None,
+                           'timezone': settings.TIME_ZONE}),
+                (News, {'headline': 'News', 'body': 'body', 'group': None,
+                        'timezone': settings.TIME_ZONE}),
+                (Page, {'title': 'Page', 'content': 'content'}),
+            ]
+            for model, fields in models:
+                name = model._meta.module_name
+                model.objects.bulk_create([
+                    model(slug='benchmark-%s-%d' % (name, i),
+                          allow_anonymous_view=(i % 4 == 0),
+                          allow_user_view=(i % 4 == 1),
+                          allow_member_view=(i % 4 == 2),
+                          status=True,
+                          status_detail='active',
+                          **fields)
+                    for i in range(num_objects)])
+
+                # a quarter of the objects are only viewable by one group
+                content_type = ContentType.objects.get_for_model(model)
+                object_ids = model.objects.filter(slug__startswith='benchmark-',
+                    allow_anonymous_view=False, allow_user_view=False,
+                    allow_member_view=False).values_list('pk', flat=True)
+                ObjectPermission.objects.bulk_create([
+                    ObjectPermission(group=groups[i % num_groups] if groups else None,
+                                     content_type=content_type,
+                                     codename='view_%s' % name,
+                                     object_id=object_id)
+                    for i, object_id in enumerate(object_ids)])
+                rebuild_visibility(model)
+
+            users = [('member', User.objects.get(pk=member.pk)),
+                     ('grouped', User.objects.get(pk=grouped.pk))]
+
+            def run(user, indexed):
+                settings.PERMS_VISIBILITY_INDEX = indexed
+                start = default_timer()
+                for i in range(num_queries):
+                    for model, fields in models:
+                        perm = '%s.view_%s' % (model._meta.app_label,
+                                               model._meta.module_name)
+                        filters = get_query_filters(user, perm)
+                        queryset = distinct_if_needed(model.objects.filter(filters))
+                        list(queryset.order_by('-pk').values_list('pk', flat=True)[:20])
+                        queryset.count()
+                return (default_timer() - start) * 1000.0 / (num_queries * len(models))
+
+            print "objects per model: %d, groups: %d, queries: %d" % (
+                num_objects, num_groups, num_queries)
+            for label, user in users:
+                joined = run(user, False)
+                indexed = run(user, True)
+                print "%-10s perms join: %8.3f ms/list  visibility index: %8.3f ms/list" % (
+                    label, joined, indexed)
+        finally:
+            settings.PERMS_VISIBILITY_INDEX = original
+            transaction.rollback()
+            transaction.leave_transaction_management()
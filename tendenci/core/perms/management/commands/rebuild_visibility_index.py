@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    """
+    Rebuild the visibility index for every model with allow_* view
+    bits, or only for the models given as app_label.model_name.
+
+    Usage: ./manage.py rebuild_visibility_index [articles.article ...]
+    """
+    help = 'Rebuild the per-object visibility index used by get_query_filters'
+
+    def handle(self, *models, **options):
+        from django.db.models import get_model, get_models
+        from tendenci.core.perms.visibility import rebuild_visibility
+
+        if models:
+            models = [get_model(*label.split('.')) for label in models]
+        else:
+            models = get_models()
+
+        for model in models:
+            if model is None:
+                continue
+            field_names = [f.name for f in model._meta.fields]
+            if 'allow_anonymous_view' not in field_names or \
+                    'allow_user_view' not in field_names:
+                continue
+            count = rebuild_visibility(model)
+            print "%s.%s: %d objects" % (model._meta.app_label,
+                                         model._meta.module_name, count)
@@ -24,3 +24,26 @@ class ObjectPermission(models.Model):
     object = generic.GenericForeignKey('content_type', 'object_id')
 
     objects = ObjectPermissionManager()
+
+
+class ObjectVisibility(models.Model):
+    """
+    Denormalised view permissions, one row per audience that can
+    view an object: 'anonymous', 'user', 'member' or 'group.<id>'.
+
+    Maintained by tendenci.core.perms.visibility when
+    PERMS_VISIBILITY_INDEX is on.
+    """
+    content_type = models.ForeignKey(ContentType)
+    object_id = models.IntegerField()
+    audience = models.CharField(max_length=50)
+
+
+# keep the visibility index in sync with every model that has
+# allow_* view bits; the handlers return early unless
+# PERMS_VISIBILITY_INDEX is on
+from django.db.models.signals import post_save, post_delete
+from tendenci.core.perms.visibility import object_saved, object_deleted
+
+post_save.connect(object_saved, weak=False, dispatch_uid='perms_visibility_save')
+post_delete.connect(object_deleted, weak=False, dispatch_uid='perms_visibility_delete')
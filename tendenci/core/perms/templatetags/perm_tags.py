@@ -196,3 +196,15 @@ def obj_status(obj):
 
     return value
 
+
+@register.simple_tag
+def prefetch_perms(user, objects):
+    """
+        {% prefetch_perms request.user object_list %}
+
+        Loads the user's object permissions for a page of objects
+        in bulk so has_perm checks in the loop do not query.
+    """
+    from tendenci.core.perms.backend import prefetch_object_permissions
+    prefetch_object_permissions(user, objects)
+    return ''
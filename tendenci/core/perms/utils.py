@@ -10,6 +10,8 @@ from django.db.models import Q
 
 from tendenci.apps.profiles.models import Profile
 from tendenci.core.perms.object_perms import ObjectPermission
+from tendenci.core.perms.visibility import (visibility_enabled,
+    get_visibility_q, group_audience, ANONYMOUS, USER, MEMBER)
 
 
 PUBLIC_FILTER = {'status':True,'status_detail':"active",'allow_anonymous_view':True}
@@ -77,6 +79,11 @@ def update_perms_and_save(request, form, instance, **kwargs):
     if request.user.is_authenticated():
         ObjectPermission.objects.assign(instance.creator, instance)
 
+    # the object permissions cached on the user for this request are stale now
+    for attr in ('_object_perm_cache', '_group_object_perm_cache'):
+        if hasattr(request.user, attr):
+            delattr(request.user, attr)
+
     # save again for indexing purposes
     # TODO: find a better solution, saving twice kinda sux
     instance.save(**kwargs)
@@ -210,9 +217,26 @@ def has_view_perm(user, perm, obj=None):
     return False
 
 
+def get_user_group_ids(user):
+    """
+    Returns the ids of the groups the user belongs to. The list is
+    kept on the user object, so it is queried once per request.
+    """
+    group_ids = getattr(user, '_group_ids_cache', None)
+    if group_ids is None:
+        group_ids = list(user.group_member.values_list('group_id', flat=True))
+        user._group_ids_cache = group_ids
+    return group_ids
+
+
 def get_query_filters(user, perm, **kwargs):
     """
     Method to generate search query filters for different user types.
+
+    With PERMS_VISIBILITY_INDEX on, view permissions are matched
+    against the visibility index instead of joining the perms table,
+    so the filtered queryset does not need .distinct(). Filter lists
+    with distinct_if_needed() to leave it out then.
     """
     # impersonation
     user = getattr(user, 'impersonated_user', user)
@@ -232,43 +256,59 @@ def get_query_filters(user, perm, **kwargs):
         if user.profile.is_superuser:
             return Q(status=True)
         else:
+            status_q = Q(status=True)
+            status_detail_q = Q(status_detail='active')
+            creator_perm_q = Q(creator=user)
+            owner_perm_q = Q(owner=user)
+
+            if visibility_enabled():
+                audiences = [ANONYMOUS, USER]
+                if user.profile.is_member:
+                    audiences.append(MEMBER)
+                if perms_field:
+                    audiences.extend(group_audience(group_id)
+                                     for group_id in get_user_group_ids(user))
+
+                visibility_q = get_visibility_q(perm, audiences)
+                if visibility_q is not None:
+                    return (status_q & ((visibility_q & status_detail_q) | (creator_perm_q | owner_perm_q)))
 
             if '.' in perm and perms_field:
                 group_perm = Q(perms__codename=perm.split(".")[-1])
 
+            if perms_field:
+                group_q = Q(perms__group__in=get_user_group_ids(user))
+
             if user.profile.is_member:
                 anon_q = Q(allow_anonymous_view=True)
                 user_q = Q(allow_user_view=True)
                 member_q = Q(allow_member_view=True)
-                status_q = Q(status=True)
-                status_detail_q = Q(status_detail='active')
 
-                if perms_field:
-                    group_ids = [int(g.group_id) for g in user.group_member.select_related('pk', 'group_id')]
-                    group_q = Q(perms__group__in=group_ids)
-
-                creator_perm_q = Q(creator=user)
-                owner_perm_q = Q(owner=user)
                 member_filter = (status_q & (((anon_q | user_q | member_q | (group_q & group_perm)) & status_detail_q) | (creator_perm_q | owner_perm_q)))
 
                 return member_filter
             else:
                 anon_q = Q(allow_anonymous_view=True)
                 user_q = Q(allow_user_view=True)
-                status_q = Q(status=True)
-                status_detail_q = Q(status_detail='active')
-
-                if perms_field:
-                    group_ids = [int(g.group_id) for g in user.group_member.select_related('pk', 'group_id')]
-                    group_q = Q(perms__group__in=group_ids)
 
-                creator_perm_q = Q(creator=user)
-                owner_perm_q = Q(owner=user)
                 user_filter = (status_q & (((anon_q | user_q | (group_q & group_perm)) & status_detail_q) | (creator_perm_q | owner_perm_q)))
 
                 return user_filter
 
 
+def distinct_if_needed(queryset):
+    """
+    Returns the queryset with .distinct() if its filters join another
+    table, as get_query_filters() does through the perms table, which
+    repeats rows. Filters matched against the visibility index, and
+    those of anonymous users and superusers, don't join and the list
+    is queried without DISTINCT.
+    """
+    if len(queryset.query.tables) > 1:
+        return queryset.distinct()
+    return queryset
+
+
 def get_administrators():
     return User.objects.filter(is_active=True, is_staff=True)
 
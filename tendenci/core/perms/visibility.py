@@ -0,0 +1,199 @@
+"""
+Denormalised visibility index for list queries.
+
+When PERMS_VISIBILITY_INDEX is on, every object with allow_* view bits
+has one ObjectVisibility row per audience that can view it, and
+get_query_filters() matches those rows with a single subquery instead
+of OR-ing the allow_* bits with a join through perms__group__in, which
+needs .distinct() on every list view.
+
+The rows are rewritten when an object is saved (update_perms_and_save
+saves the instance after assigning the group permissions) and when an
+ObjectPermission is added or removed. Run
+./manage.py rebuild_visibility_index before turning the setting on.
+"""
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Q
+
+from tendenci.core.perms.object_perms import ObjectPermission, ObjectVisibility
+
+ANONYMOUS = 'anonymous'
+USER = 'user'
+MEMBER = 'member'
+
+
+def get_visibility_class(user):
+    """
+    A name for the set of objects the user can view, for cache keys.
+    Anonymous users all see the same objects, as do superusers. Other
+    users see objects depending on their groups and the objects they
+    created or own, so each is a class of its own.
+    """
+    user = getattr(user, 'impersonated_user', user)
+    if not isinstance(user, User) or user.is_anonymous():
+        return ANONYMOUS
+    if user.profile.is_superuser:
+        return 'superuser'
+    return 'user%d' % user.pk
+
+
+def visibility_enabled():
+    return getattr(settings, 'PERMS_VISIBILITY_INDEX', False)
+
+
+def group_audience(group_id):
+    return 'group.%s' % group_id
+
+
+def has_view_bits(instance):
+    return hasattr(instance, 'allow_anonymous_view') and \
+        hasattr(instance, 'allow_user_view')
+
+
+def get_audiences(instance, content_type=None):
+    """
+    Returns the audiences that can view the instance,
+    from its allow_* bits and its group view permissions.
+    """
+    audiences = []
+    if instance.allow_anonymous_view:
+        audiences.append(ANONYMOUS)
+    if instance.allow_user_view:
+        audiences.append(USER)
+    if getattr(instance, 'allow_member_view', False):
+        audiences.append(MEMBER)
+
+    content_type = content_type or ContentType.objects.get_for_model(instance)
+    group_ids = ObjectPermission.objects.filter(
+        content_type=content_type,
+        object_id=instance.pk,
+        codename__startswith='view_',
+        group__isnull=False).values_list('group_id', flat=True)
+    audiences.extend(group_audience(group_id) for group_id in set(group_ids))
+
+    return audiences
+
+
+def update_visibility(instance):
+    """
+    Replaces the visibility rows of the instance.
+    """
+    content_type = ContentType.objects.get_for_model(instance)
+    ObjectVisibility.objects.filter(content_type=content_type,
+                                    object_id=instance.pk).delete()
+    ObjectVisibility.objects.bulk_create([
+        ObjectVisibility(content_type=content_type,
+                         object_id=instance.pk,
+                         audience=audience)
+        for audience in get_audiences(instance, content_type)])
+
+
+def update_group_visibility(content_type, object_id):
+    """
+    Replaces the group rows of an object after its
+    ObjectPermissions changed, without loading the object.
+    """
+    rows = ObjectVisibility.objects.filter(content_type=content_type,
+                                           object_id=object_id)
+    rows.filter(audience__startswith='group.').delete()
+
+    group_ids = ObjectPermission.objects.filter(
+        content_type=content_type,
+        object_id=object_id,
+        codename__startswith='view_',
+        group__isnull=False).values_list('group_id', flat=True)
+    ObjectVisibility.objects.bulk_create([
+        ObjectVisibility(content_type=content_type,
+                         object_id=object_id,
+                         audience=group_audience(group_id))
+        for group_id in set(group_ids)])
+
+
+def rebuild_visibility(model, batch_size=1000):
+    """
+    Rebuilds the visibility rows of every instance of model.
+    Returns the number of objects indexed.
+    """
+    content_type = ContentType.objects.get_for_model(model)
+    ObjectVisibility.objects.filter(content_type=content_type).delete()
+
+    group_ids = {}
+    perms = ObjectPermission.objects.filter(content_type=content_type,
+                                            codename__startswith='view_',
+                                            group__isnull=False)
+    for object_id, group_id in perms.values_list('object_id', 'group_id'):
+        group_ids.setdefault(object_id, set()).add(group_id)
+
+    fields = ['pk', 'allow_anonymous_view', 'allow_user_view']
+    has_member_view = 'allow_member_view' in [f.name for f in model._meta.fields]
+    if has_member_view:
+        fields.append('allow_member_view')
+
+    count = 0
+    rows = []
+    for values in model._default_manager.values_list(*fields).iterator():
+        pk = values[0]
+        audiences = [audience for audience, allowed in
+                     zip((ANONYMOUS, USER, MEMBER), values[1:]) if allowed]
+        audiences.extend(group_audience(g) for g in group_ids.get(pk, ()))
+        rows.extend(ObjectVisibility(content_type=content_type,
+                                     object_id=pk,
+                                     audience=audience)
+                    for audience in audiences)
+        if len(rows) >= batch_size:
+            ObjectVisibility.objects.bulk_create(rows)
+            rows = []
+        count += 1
+
+    if rows:
+        ObjectVisibility.objects.bulk_create(rows)
+    return count
+
+
+def get_visibility_q(perm, audiences):
+    """
+    Returns a Q that matches the objects visible to any of the
+    audiences, or None when perm is not a view permission of a
+    known content type and the caller should use the joined filters.
+    """
+    try:
+        app_label, codename = perm.split('.')
+    except ValueError:
+        return None
+    if not codename.startswith('view_'):
+        return None
+
+    try:
+        content_type = ContentType.objects.get_by_natural_key(
+            app_label, codename[len('view_'):])
+    except ContentType.DoesNotExist:
+        return None
+
+    object_ids = ObjectVisibility.objects.filter(
+        content_type=content_type,
+        audience__in=audiences).values('object_id')
+    return Q(pk__in=object_ids)
+
+
+# signal handlers, connected in tendenci.core.perms.models
+
+def object_saved(sender, instance, **kwargs):
+    if not visibility_enabled() or sender is ObjectVisibility:
+        return
+    if sender is ObjectPermission:
+        update_group_visibility(instance.content_type_id, instance.object_id)
+    elif has_view_bits(instance) and instance.pk:
+        update_visibility(instance)
+
+
+def object_deleted(sender, instance, **kwargs):
+    if not visibility_enabled() or sender is ObjectVisibility:
+        return
+    if sender is ObjectPermission:
+        update_group_visibility(instance.content_type_id, instance.object_id)
+    elif has_view_bits(instance):
+        content_type = ContentType.objects.get_for_model(instance)
+        ObjectVisibility.objects.filter(content_type=content_type,
+                                        object_id=instance.pk).delete()
@@ -1,4 +1,5 @@
 from tendenci.core.registry import site
+from tendenci.core.registry.utils import LazyRegisteredApps
 
 
 def registered_apps(request):
@@ -16,7 +17,7 @@ def registered_apps(request):
     {% endif %}
     """
     contexts = {}
-    app_context = site.get_registered_apps()
+    app_context = LazyRegisteredApps(site)
 
     contexts['registered_apps'] = app_context
     return contexts
@@ -1,6 +1,6 @@
 from tendenci.core.registry.exceptions import AlreadyRegistered, NotRegistered
-from tendenci.core.registry.utils import RegisteredApps
-from tendenci.core.registry.cache import cache_reg_apps, get_reg_apps, delete_reg_apps_cache
+from tendenci.core.registry.utils import RegisteredApps, get_enabled_state
+from tendenci.core.site_settings.utils import get_settings_snapshot
 
 
 class RegistrySite(object):
@@ -10,6 +10,8 @@ class RegistrySite(object):
     """
     def __init__(self):
         self._registry = {}
+        self._snapshot = None
+        self._settings_version = None
 
     def register(self, model, registry_class=None):
         """
@@ -32,9 +34,8 @@ class RegistrySite(object):
 
         self._registry[model] = registry_class(model)
 
-        #reset cache of the registered apps
-        delete_reg_apps_cache()
-        cache_reg_apps(self.get_registered_apps())
+        # the snapshot is rebuilt on the next get_registered_apps()
+        self._snapshot = None
 
     def unregister(self, model):
         """
@@ -44,17 +45,28 @@ class RegistrySite(object):
             raise NotRegistered('The model %s is not registered' % model.__class__)
         del(self._registry[model])
 
-        #reset cache of the registered apps
-        delete_reg_apps_cache()
-        cache_reg_apps(self.get_registered_apps())
+        # the snapshot is rebuilt on the next get_registered_apps()
+        self._snapshot = None
 
     def get_registered_apps(self):
-        cached_apps = get_reg_apps()
-        if cached_apps:
-            #build RegisteredApps object from the cache
-            apps = RegisteredApps(cached_apps, build_from_cache=True)
-        else:
-            apps = RegisteredApps(self._registry)
-        return apps
+        """
+        Returns the RegisteredApps snapshot for this process.
+
+        The snapshot is built once all apps are registered and only
+        rebuilt when a module.<app>.enabled setting changes.
+        """
+        settings_version = get_settings_snapshot().version
+        # read the attribute once, register() may reset it
+        snapshot = self._snapshot
+        if snapshot is not None and settings_version == self._settings_version:
+            return snapshot
+
+        enabled_state = get_enabled_state(self._registry)
+        if snapshot is None or snapshot.enabled_state != enabled_state:
+            snapshot = RegisteredApps(self._registry)
+            self._snapshot = snapshot
+
+        self._settings_version = settings_version
+        return snapshot
 
 site = RegistrySite()
@@ -10,6 +10,21 @@ from tendenci.core.site_settings.utils import check_setting, get_setting
 lazy_reverse = lazy(reverse, str)
 
 
+def get_enabled_state(apps):
+    """
+    Returns (app_label, has_settings, enabled) for every registered
+    model. A RegisteredApps snapshot only depends on these values.
+    """
+    state = []
+    for model in apps:
+        setting_tuple = ('module', model._meta.app_label, 'enabled')
+        if check_setting(*setting_tuple):
+            state.append((model._meta.app_label, True, get_setting(*setting_tuple)))
+        else:
+            state.append((model._meta.app_label, False, True))
+    return tuple(sorted(state))
+
+
 class RegisteredApps(object):
     """
     RegistredApps iterarable that represents all registered apps
@@ -22,97 +37,57 @@ class RegisteredApps(object):
     core_apps = registered_apps.core
     addon_apps = registered_apps.addon
     people_apps = registered_apps.people
+
+    Instances are snapshots: the registry fields are copied and the
+    app lists are tuples, so the object can be shared between requests.
     """
-    def __init__(self, apps, build_from_cache=False):
-        self.all_apps = []
-        self.core = []
-        self.addons = []
-        self.people = []
+    def __init__(self, apps):
+        self.enabled_state = get_enabled_state(apps)
+        enabled = dict([(label, (has_settings, value))
+                        for label, has_settings, value in self.enabled_state])
+
+        all_apps = []
+        core = []
+        addons = []
+        people = []
 
         # append core and plugin apps to
         # individual lists
-        if not build_from_cache:
-            for model, registry in apps.items():
-
-                setting_tuple = (
-                    'module',
-                    registry.fields['model']._meta.app_label,
-                    'enabled',
-                )
-
-                # enabled / has settings
-                if check_setting(*setting_tuple):
-                    registry.fields['enabled'] = get_setting(*setting_tuple)
-                    registry.fields['has_settings'] = True
-                else:
-                    registry.fields['enabled'] = True
-                    registry.fields['has_settings'] = False
-
-                if not 'settings' in registry.fields['url'].keys():
-                    registry.fields['url'].update({
-                        'settings': lazy_reverse('settings.index', args=[
-                            'module',
-                            registry.fields['model']._meta.app_label
-                        ])
-                    })
-
-                if registry.fields['app_type'] == 'addon':
-                    self.addons.append(registry.fields)
-
-                if registry.fields['app_type'] == 'people':
-                    self.people.append(registry.fields)
-
-                if registry.fields['app_type'] == 'core':
-                    self.core.append(registry.fields)
-
-                # append all apps for main iterable
-                self.all_apps.append(registry.fields)
-        else:
-            #since we can only cache the list of apps and not the RegisteredApps instance
-            #we have to rebuild this object based on the list of apps from the cache.
-            for app in apps:
-
-                setting_tuple = (
-                    'module',
-                    app['model']._meta.app_label,
-                    'enabled',
-                )
-
-                # enabled / has settings
-                if check_setting(*setting_tuple):
-                    app['enabled'] = get_setting(*setting_tuple)
-                    app['has_settings'] = True
-                else:
-                    app['enabled'] = True
-                    app['has_settings'] = False
-
-                if not 'settings' in app['url'].keys():
-                    app['url'].update({
-                        'settings': lazy_reverse('settings.index', args=[
-                            'module',
-                            app['model']._meta.app_label
-                        ])
-                    })
-
-                if app['app_type'] == 'addon':
-                    self.addons.append(app)
-
-                if app['app_type'] == 'people':
-                    self.people.append(app)
-
-                if app['app_type'] == 'core':
-                    self.core.append(app)
-
-                # append all apps for main iterable
-                self.all_apps.append(app)
+        for model, registry in apps.items():
+            fields = dict(registry.fields)
+            fields['url'] = dict(fields['url'])
+            app_label = model._meta.app_label
+
+            # enabled / has settings
+            fields['has_settings'], fields['enabled'] = enabled[app_label]
+
+            if not 'settings' in fields['url'].keys():
+                fields['url'].update({
+                    'settings': lazy_reverse('settings.index', args=[
+                        'module',
+                        app_label
+                    ])
+                })
+
+            if fields['app_type'] == 'addon':
+                addons.append(fields)
+
+            if fields['app_type'] == 'people':
+                people.append(fields)
+
+            if fields['app_type'] == 'core':
+                core.append(fields)
+
+            # append all apps for main iterable
+            all_apps.append(fields)
 
         # sort the applications alphabetically by
         # object representation
         key = lambda x: unicode(x)
-        self.all_apps = sorted(self.all_apps, key=key)
-        self.core = sorted(self.core, key=key)
-        self.addons = sorted(self.addons, key=key)
-        self.people = sorted(self.people, key=key)
+        self.all_apps = tuple(sorted(all_apps, key=key))
+        self.core = tuple(sorted(core, key=key))
+        self.addons = tuple(sorted(addons, key=key))
+        self.people = tuple(sorted(people, key=key))
 
     def __iter__(self):
         return iter(self.all_apps)
@@ -121,6 +96,35 @@ class RegisteredApps(object):
         return len(self.all_apps)
 
 
+class LazyRegisteredApps(object):
+    """
+    Stands in for the RegisteredApps snapshot in template contexts
+    and only fetches it when a template uses it.
+    """
+    def __init__(self, site):
+        self._site = site
+        self._apps = None
+
+    def _get_apps(self):
+        if self._apps is None:
+            self._apps = self._site.get_registered_apps()
+        return self._apps
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self._get_apps(), name)
+
+    def __iter__(self):
+        return iter(self._get_apps())
+
+    def __len__(self):
+        return len(self._get_apps())
+
+    def __nonzero__(self):
+        return bool(len(self))
+
+
 def update_addons(installed_apps, addon_folder_path):
     # Append only enabled addons to the INSTALLED_APPS
     addons = get_addons(installed_apps, addon_folder_path)
@@ -0,0 +1,190 @@
+import re
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from ordereddict import OrderedDict
+
+from tendenci.core.robots.cache import CACHE_PRE_KEY, cache_all_robots
+
+
+mobile_agents = [
+#    'iPad',  # Removed on 2012-07-11
+    'iPhone',
+    'iPod',
+    'Android',
+    'Opera Mini',
+    'Blackberry',
+    'Droid',
+    'IEMobile',
+    'EudoraWeb',
+    'Fennec',
+    'Minimo',
+    'NetFront',
+    'Polaris',
+    'HTC_Dream',
+    'HTC Hero',
+    'HTC-ST7377',
+    'Kindle',
+    'LG-LX550',
+    'LX265',
+    'Nokia',
+    'Palm',
+    'MOT-V9mm',
+    'SEC-SGHE900',
+    'SAMSUNG-SGH-A867',
+    'SymbianOS',
+    'DoCoMo',
+    'ZuneHD',
+    'ReqwirelessWeb',
+    'SEJ001',
+    'SonyEricsson'
+]
+
+
+def get_version_key():
+    keys = [settings.CACHE_PRE_KEY, CACHE_PRE_KEY, 'version']
+    return '.'.join(keys)
+
+
+def trie_pattern(words):
+    """
+    Compile a list of lowercase words into a single regex whose
+    alternatives are factored on common prefixes, so a search costs
+    roughly the length of the user agent instead of the number of words.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def build(node):
+        end = '' in node
+        branches = [re.escape(char) + build(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        if len(branches) == 1 and not end:
+            return branches[0]
+        pattern = '(?:%s)' % '|'.join(branches)
+        if end:
+            pattern += '?'
+        return pattern
+
+    return re.compile(build(trie), re.UNICODE)
+
+
+class UserAgentClassifier(object):
+    """
+    Shared robot and mobile detection for user agent strings.
+
+    Robot names and mobile tokens are each compiled into one regex.
+    The robot regex is rebuilt when a Robot is saved or deleted (the
+    version key in the cache is checked every ROBOT_VERSION_CHECK_INTERVAL
+    seconds so other processes pick up the change) and results for
+    recently seen user agents are kept in a bounded LRU.
+    """
+    def __init__(self, size=None, check_interval=None):
+        self.size = size or getattr(settings, 'USER_AGENT_CACHE_SIZE', 1000)
+        self.check_interval = check_interval or getattr(settings,
+                                    'ROBOT_VERSION_CHECK_INTERVAL', 60)
+        self._lock = threading.Lock()
+        self._results = OrderedDict()
+        self._mobile_re = trie_pattern([ma.lower() for ma in mobile_agents])
+        self._robot_re = None
+        self._robots = {}
+        self._version = None
+        self._checked = 0
+
+    def invalidate(self):
+        with self._lock:
+            self._robot_re = None
+            self._results.clear()
+
+    def _check_version(self):
+        now = time.time()
+        if now - self._checked < self.check_interval:
+            return
+        self._checked = now
+        version = cache.get(get_version_key())
+        if version != self._version:
+            self._version = version
+            self.invalidate()
+
+    def _load_robots(self):
+        keys = [settings.CACHE_PRE_KEY, CACHE_PRE_KEY, 'all']
+        key = '.'.join(keys)
+
+        robots = cache.get(key)
+        if not robots:
+            cache_all_robots()
+            robots = cache.get(key, [])
+
+        # keep the first robot for a name, like the old linear scan
+        by_name = {}
+        for robot in robots:
+            name = robot.name.lower()
+            if name and name not in by_name:
+                by_name[name] = robot
+
+        self._robots = by_name
+        if by_name:
+            self._robot_re = trie_pattern(by_name.keys())
+        else:
+            self._robot_re = re.compile(r'(?!x)x')
+
+    def classify(self, user_agent):
+        """
+        Returns a (robot, is_mobile) tuple for the user agent.
+        """
+        if not user_agent:
+            return (None, False)
+
+        # UnicodeDecodeError: 'ascii' codec can't decode byte 0xf3
+        # http://stackoverflow.com/questions/2392732/sqlite-python-unicode-and-non-utf-data
+        if isinstance(user_agent, str):
+            user_agent = unicode(user_agent, errors='ignore')
+        user_agent = user_agent.lower()
+
+        self._check_version()
+
+        with self._lock:
+            result = self._results.pop(user_agent, None)
+            if result is not None:
+                self._results[user_agent] = result
+                return result
+
+            if self._robot_re is None:
+                self._load_robots()
+
+            match = self._robot_re.search(user_agent)
+            robot = match and self._robots.get(match.group(0)) or None
+            result = (robot, bool(self._mobile_re.search(user_agent)))
+
+            self._results[user_agent] = result
+            if len(self._results) > self.size:
+                self._results.popitem(last=False)
+
+        return result
+
+    def get_robot(self, user_agent):
+        return self.classify(user_agent)[0]
+
+    def is_mobile(self, user_agent):
+        return self.classify(user_agent)[1]
+
+
+classifier = UserAgentClassifier()
+
+
+def refresh_robots(sender, **kwargs):
+    """
+    Signal handler for Robot changes: refresh the cached robot
+    list and bump the version so every process rebuilds its regex.
+    """
+    cache_all_robots()
+    cache.set(get_version_key(), time.time())
+    classifier.invalidate()
@@ -1,6 +1,8 @@
 from django.db import models
+from django.db.models.signals import post_save, post_delete
 
 from tendenci.core.robots.managers import RobotManager
+from tendenci.core.robots.classifier import refresh_robots
 
 
 STATUS_CHOICES = (('active','Active'),('inactive','Inactive'),)
@@ -15,4 +17,8 @@ class Robot(models.Model):
     objects = RobotManager()
     
     def __unicode__(self):
-        return self.name
\ No newline at end of file
+        return self.name
+
+
+post_save.connect(refresh_robots, sender=Robot, weak=False)
+post_delete.connect(refresh_robots, sender=Robot, weak=False)
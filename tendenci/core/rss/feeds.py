@@ -1,92 +1,167 @@
-from datetime import datetime
+import heapq
 import itertools
+
 import feedsmanager
-from haystack.query import SearchQuerySet
 
 from django.contrib.syndication.views import Feed
-from django.contrib.syndication.views import FeedDoesNotExist
-from django.contrib.contenttypes.models import ContentType
-from django.utils.translation import ugettext_lazy as _
+from django.core.cache import cache
 from django.conf import settings
+from django.http import HttpResponse
 from django.template.loader import render_to_string
 
+from tendenci.core.base.http import get_validators, not_modified
+from tendenci.core.rss.feedsmanager import pubdate_key
 from tendenci.core.site_settings.utils import get_setting
 
-
-site_url = get_setting('site', 'global', 'siteurl')
-site_display_name = get_setting('site', 'global', 'sitedisplayname')
-site_description = get_setting('site', 'global', 'sitedescription')
-if site_description == '': site_description = 'All syndicated rss feeds on %s' % site_display_name
-
-max_items = settings.MAX_RSS_ITEMS
-if not max_items: max_items = 100
-
-
-class GlobalFeed(Feed):
-    title =  '%s RSS Feed' % site_display_name
-    link = '%s/rss' % (site_url)
-    description = site_description
-
-    def __init__(self):
-        Feed.__init__(self)
-        self.all_items = []     # all items for this rss feed
-        self.feed_for_item = {}   # item -> feed cache
-        self.load_feeds_items() # load items
-
-    def load_feeds_items(self):
-        """ Load all feeds items """
-        #print "creating new feeds_items"
-        feeds = feedsmanager.get_all_feeds()
-        for feed in feeds:
-            feed_instance = feed()
-            #print "Feed found: %s" % feed_instance.title
-            item_per_feed_cnt = 0
-            for item in feed_instance.items():
-                #print "Item: %s" % feed_instance.item_title(item)
-                self.feed_for_item[item] = feed_instance
-                self.all_items.append(item)
-                item_per_feed_cnt += 1
-                if item_per_feed_cnt >= settings.MAX_FEED_ITEMS_PER_APP:
-                    break
-
-    def items(self):
-        return self.all_items[:max_items]
-
-    def item_title(self, item):
-        feed = self.feed_for_item[item]
-        if hasattr(feed, 'title_template') and not feed.title_template is None:
+# rendered items are cached for this long, they
+# are keyed by their update_dt so edits show at once
+ITEM_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def get_max_items():
+    return settings.MAX_RSS_ITEMS or 100
+
+
+def newest_first(pubdate):
+    """
+    A sort key that orders pubdates from the newest.
+    """
+    pubdate = pubdate_key(pubdate)
+    return (-pubdate.toordinal(), -(pubdate.hour * 3600 + pubdate.minute * 60 + pubdate.second),
+            -pubdate.microsecond)
+
+
+class FeedEntry(object):
+    """
+    An item of a sub-feed in the global feed, with its title,
+    description, link and author rendered by the sub-feed.
+    """
+    def __init__(self, feed, item, pubdate):
+        self.feed = feed
+        self.item = item
+        self.pubdate = pubdate
+        self.version = getattr(item, 'update_dt', None) or pubdate
+        self.fields = None
+
+    def get_cache_key(self):
+        meta = getattr(self.item, '_meta', None)
+        if meta is None or self.item.pk is None or not self.version:
+            return None
+        version = pubdate_key(self.version).strftime('%Y%m%d%H%M%S%f')
+        return '.'.join([settings.CACHE_PRE_KEY, 'rss', self.feed.__class__.__name__,
+                         meta.app_label, meta.object_name.lower(),
+                         str(self.item.pk), version])
+
+    def render(self):
+        feed, item = self.feed, self.item
+        if getattr(feed, 'title_template', None) is not None:
             # use the template instead of the method
-            #print feed.title_template
-            return render_to_string(feed.title_template, { 'obj' : item })
-        return self.get_attr_item('title', item)
-
-    def item_description(self, item):
-        feed = self.feed_for_item[item]
-        if hasattr(feed, 'description_template') and not feed.description_template is None:
+            title = render_to_string(feed.title_template, {'obj': item})
+        else:
+            title = feed.item_title(item)
+        if getattr(feed, 'description_template', None) is not None:
             # use the template instead
-            #print feed.description_template
-            return render_to_string(feed.description_template, { 'obj' : item })
-        return self.get_attr_item('description', item)
-
-    def item_pubdate(self, item):
-        return self.get_attr_item('pubdate', item)
-
-    def item_link(self, item):
-        return self.get_attr_item('link', item)
-    
-    def item_author_name(self, item):
-        return self.get_attr_item('author_name', item)
-
-    def get_attr_item(self, attr, item):
-        """ Makes a call the corresponding item_* method on the feed object """
-        if item in self.feed_for_item:
-            # lookup item on our item->feed cache
-            feed = self.feed_for_item[item]
-            methodname = 'item_' + attr
-            if hasattr(feed, methodname):
-                # check to see if the feed has the method, if so
-                # call it
-                method = getattr(feed, methodname)
-                return method.__func__(feed, item)
-        return None
+            description = render_to_string(feed.description_template, {'obj': item})
+        else:
+            description = feed.item_description(item)
+        return {
+            'title': title,
+            'description': description,
+            'link': feed.item_link(item),
+            'author_name': feed.item_author_name(item),
+        }
+
+
+def merge_feed_items(feeds, max_items, max_per_feed):
+    """
+    Returns FeedEntry objects of the newest max_items items of the
+    feeds, taking at most max_per_feed from each. Each feed's items
+    come newest first, so a heap merge only reads the items needed.
+    """
+    def dated(i, feed):
+        for n, item in enumerate(itertools.islice(feed.items_by_date(), max_per_feed)):
+            pubdate = feed.item_pubdate(item)
+            yield newest_first(pubdate), i, n, feed, item, pubdate
+
+    merged = heapq.merge(*[dated(i, feed) for i, feed in enumerate(feeds)])
+    return [FeedEntry(feed, item, pubdate) for key, i, n, feed, item, pubdate
+            in itertools.islice(merged, max_items)]
+
+
+def render_entries(entries):
+    """
+    Fill in the fields of the entries, reusing the cached renderings.
+    """
+    keys = dict((entry, entry.get_cache_key()) for entry in entries)
+    cached = cache.get_many([key for key in keys.values() if key])
+    rendered = {}
+    for entry in entries:
+        key = keys[entry]
+        if key and key in cached:
+            entry.fields = cached[key]
+        else:
+            entry.fields = entry.render()
+            if key:
+                rendered[key] = entry.fields
+    if rendered:
+        cache.set_many(rendered, ITEM_CACHE_TIMEOUT)
 
+
+class GlobalFeed(Feed):
+    """
+    The newest items of every app's feed. The items are read on each
+    request, and unchanged feeds are answered with 304 Not Modified.
+    """
+    def title(self):
+        return '%s RSS Feed' % get_setting('site', 'global', 'sitedisplayname')
+
+    def link(self):
+        return '%s/rss' % get_setting('site', 'global', 'siteurl')
+
+    def description(self):
+        site_description = get_setting('site', 'global', 'sitedescription')
+        if site_description == '':
+            site_description = 'All syndicated rss feeds on %s' % get_setting(
+                'site', 'global', 'sitedisplayname')
+        return site_description
+
+    def __call__(self, request, *args, **kwargs):
+        entries = self.get_object(request)
+
+        # anything that changes the feed changes the validators
+        validators = get_validators((self.title(), self.link(), self.description(),
+            [(e.feed.__class__.__name__, getattr(e.item, 'pk', None),
+              e.pubdate, e.version) for e in entries]))
+        response = not_modified(request, validators)
+        if response is not None:
+            return response
+
+        render_entries(entries)
+        feedgen = self.get_feed(entries, request)
+        response = HttpResponse(content_type=feedgen.mime_type)
+        feedgen.write(response, 'utf-8')
+        for header, value in validators.items():
+            response[header] = value
+        return response
+
+    def get_object(self, request, *args, **kwargs):
+        feeds = [feed() for feed in feedsmanager.get_all_feeds()]
+        return merge_feed_items(feeds, get_max_items(), settings.MAX_FEED_ITEMS_PER_APP)
+
+    def items(self, entries):
+        return entries
+
+    def item_title(self, entry):
+        return entry.fields['title']
+
+    def item_description(self, entry):
+        return entry.fields['description']
+
+    def item_pubdate(self, entry):
+        return entry.pubdate
+
+    def item_link(self, entry):
+        return entry.fields['link']
+
+    def item_author_name(self, entry):
+        return entry.fields['author_name']
@@ -23,13 +23,35 @@ class SubFeed(Feed):
     def item_pubdate(self, item):
         return datetime.now()
 
+    def items_by_date(self):
+        """
+        Returns the items newest first, as the global feed merges the
+        feeds by date. The items of most feeds are already in that
+        order, override this to avoid sorting them again.
+        """
+        return sorted(self.items(), key=lambda item: pubdate_key(self.item_pubdate(item)),
+                      reverse=True)
+
+
+def pubdate_key(pubdate):
+    """
+    A datetime to compare pubdates that can be dates or None.
+    """
+    if pubdate is None:
+        return datetime.min
+    if not isinstance(pubdate, datetime):
+        return datetime.combine(pubdate, datetime.min.time())
+    return pubdate
+
 _feeds_cache = []
 
 
 def get_all_feeds():
-    for app in settings.INSTALLED_APPS:
-        _try_import(app + '.feeds')
-    return SubFeed.__subclasses__()
+    if not _feeds_cache:
+        for app in settings.INSTALLED_APPS:
+            _try_import(app + '.feeds')
+        _feeds_cache.extend(SubFeed.__subclasses__())
+    return list(_feeds_cache)
 
 
 def _try_import(module):
@@ -97,3 +97,12 @@ class Setting(models.Model):
             # delete and set cache for single key and save the value in the database
             delete_setting_cache(self.scope, self.scope_category, self.name)
             cache_setting(self.scope, self.scope_category, self.name, self)
+
+        # rebuild the settings snapshot in every process
+        from tendenci.core.site_settings.utils import bump_settings_version
+        bump_settings_version()
+
+    def delete(self, *args, **kwargs):
+        super(Setting, self).delete(*args, **kwargs)
+        from tendenci.core.site_settings.utils import bump_settings_version
+        bump_settings_version()
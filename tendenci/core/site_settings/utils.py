@@ -1,14 +1,99 @@
+import time
+
 from django.core.cache import cache
 from django.conf import settings as d_settings
 
 from tendenci.core.site_settings.models import Setting
 from tendenci.core.site_settings.cache import SETTING_PRE_KEY
+from tendenci.core.theme.middleware import get_current_request
+
+_snapshot = None
+
+
+class SettingsSnapshot(object):
+    """
+    Every setting parsed once into typed values.
+
+    ``values`` is keyed by (scope, scope_category, name) and holds
+    what get_setting returns (file settings keep their file id and
+    are looked up on access). ``context`` holds the values the
+    settings context processor exposes, keyed SCOPE_CATEGORY_NAME.
+    """
+    def __init__(self, version):
+        self.version = version
+        self.values = {}
+        self.data_types = {}
+        self.context = {}
+
+        for setting in Setting.objects.all():
+            key = (setting.scope, setting.scope_category, setting.name)
+            value = setting.get_value().strip()
+
+            # convert data types
+            if setting.data_type == 'boolean':
+                value = value[:1].lower() == 't'
+            if setting.data_type == 'int':
+                try:
+                    value = int(value or 0)
+                except ValueError:
+                    value = 0  # default to 0
+
+            self.values[key] = value
+            self.data_types[key] = setting.data_type
+            self.context['_'.join(key).upper()] = value
+
+
+def get_settings_version_key():
+    keys = [d_settings.CACHE_PRE_KEY, SETTING_PRE_KEY, 'version']
+    return '.'.join(keys)
+
+
+def get_settings_snapshot():
+    """
+    Returns the SettingsSnapshot for this process, rebuilding it when
+    the version key in the shared cache has changed. The version is
+    checked once per request.
+    """
+    global _snapshot
+    # read the global once, other threads may replace it
+    snapshot = _snapshot
+    request = get_current_request()
+    if request is not None and snapshot is not None and \
+        getattr(request, '_settings_version', None) == snapshot.version:
+        return snapshot
+
+    version = cache.get(get_settings_version_key())
+    if version is None:
+        version = time.time()
+        cache.add(get_settings_version_key(), version)
+        version = cache.get(get_settings_version_key(), version)
+
+    if snapshot is None or snapshot.version != version:
+        snapshot = SettingsSnapshot(version)
+        _snapshot = snapshot
+
+    if request is not None:
+        request._settings_version = version
+    return snapshot
+
+
+def bump_settings_version():
+    """
+    Invalidate the settings snapshot in every process. Each process
+    rebuilds its snapshot when it sees the new version.
+    """
+    cache.set(get_settings_version_key(), time.time())
+    # recheck the version later in this request
+    request = get_current_request()
+    if request is not None:
+        request._settings_version = None
 
 
 def delete_all_settings_cache():
     keys = [d_settings.CACHE_PRE_KEY, SETTING_PRE_KEY, 'all']
     key = '.'.join(keys)
     cache.delete(key)
+    bump_settings_version()
 
 
 def cache_setting(scope, scope_category, name, value):
@@ -68,8 +153,9 @@ def delete_settings_cache(scope, scope_category):
     for setting in settings:
         keys = [d_settings.CACHE_PRE_KEY, SETTING_PRE_KEY,
                 setting.scope, setting.scope_category, setting.name]
-        key = '_'.join(keys)
+        key = '.'.join(keys)
         cache.delete(key)
+    bump_settings_version()
 
 
 def get_setting(scope, scope_category, name):
@@ -79,47 +165,20 @@ def get_setting(scope, scope_category, name):
         Returns the value of the setting if it exists
         otherwise it returns an empty string
     """
-    keys = [d_settings.CACHE_PRE_KEY, SETTING_PRE_KEY, scope,
-            scope_category, name]
-    key = '.'.join(keys)
+    snapshot = get_settings_snapshot()
+    key = (scope, scope_category, name)
 
-    setting = cache.get(key)
+    if key not in snapshot.values:
+        return u''
 
-    if not setting:
-        #setting is not in the cache
+    value = snapshot.values[key]
+    if snapshot.data_types[key] == 'file':
+        from tendenci.core.files.models import File as TFile
         try:
-            #try to get the setting and cache it
-            filters = {
-                'scope': scope,
-                'scope_category': scope_category,
-                'name': name
-            }
-            setting = Setting.objects.get(**filters)
-            cache_setting(setting.scope, setting.scope_category, setting.name, setting)
-        except Exception:
-            setting = None
-
-    #check if the setting has been set and evaluate the value
-    if setting:
-        value = setting.get_value().strip()
-        # convert data types
-        if setting.data_type == 'boolean':
-            value = value[0].lower() == 't'
-        if setting.data_type == 'int':
-            if value.strip():
-                value = int(value.strip())
-            else:
-                value = 0  # default to 0
-        if setting.data_type == 'file':
-            from tendenci.core.files.models import File as TFile
-            try:
-                tfile = TFile.objects.get(pk=value)
-            except TFile.DoesNotExist:
-                tfile = None
-            value = tfile
-        return value
-
-    return u''
+            value = TFile.objects.get(pk=value)
+        except (TFile.DoesNotExist, ValueError):
+            value = None
+    return value
 
 
 def get_global_setting(name):
@@ -131,35 +190,7 @@ def get_module_setting(scope_category, name):
 
 
 def check_setting(scope, scope_category, name):
-    #check cache first
-    keys = [d_settings.CACHE_PRE_KEY, SETTING_PRE_KEY, scope,
-            scope_category, name]
-    key = '.'.join(keys)
-
-    setting = cache.get(key)
-    if setting:
-        return True
-
-    missing_keys = [d_settings.CACHE_PRE_KEY, SETTING_PRE_KEY, scope,
-            scope_category, name, "missing"]
-    missing_key = '.'.join(missing_keys)
-
-    missing = cache.get(missing_key)
-    if not missing:
-        #check the db if it is not in the cache
-        exists = Setting.objects.filter(scope=scope,
-            scope_category=scope_category, name=name).exists()
-
-        #cache that it does not exist
-        if not exists:
-            #set to True to signify that it is missing so we do not
-            #come back into this if statement and query db again
-            is_set = cache.add(missing_key, True)
-            if not is_set:
-                cache.set(missing_key, True)
-
-        return exists
-    return False
+    return (scope, scope_category, name) in get_settings_snapshot().values
 
 
 def get_form_list(user):
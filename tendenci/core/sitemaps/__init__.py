@@ -1,6 +1,7 @@
 from django.contrib.sitemaps import Sitemap
 from django.contrib.sites.models import Site
 from django.core.exceptions import ImproperlyConfigured
+from django.db.models.query import QuerySet
 
 
 class TendenciSitemap(Sitemap):
@@ -15,6 +16,13 @@ class TendenciSitemap(Sitemap):
         return attr
 
     def get_urls(self, page=1, site=None, protocol=None):
+        return list(self.iter_urls(page=page, site=site, protocol=protocol))
+
+    def iter_urls(self, page=1, site=None, protocol=None):
+        """
+        Yields the url dicts of the page one at a time, reading
+        the items without keeping them all in memory.
+        """
         # Determine protocol
         if self.protocol is not None:
             protocol = self.protocol
@@ -32,8 +40,10 @@ class TendenciSitemap(Sitemap):
                 raise ImproperlyConfigured("To use sitemaps, either enable the sites framework or pass a Site/RequestSite object in your view.")
         domain = site.domain
 
-        urls = []
-        for item in self.paginator.page(page).object_list:
+        items = self.paginator.page(page).object_list
+        if isinstance(items, QuerySet):
+            items = items.iterator()
+        for item in items:
             loc = "%s://%s%s" % (protocol, domain, self.__get('location', item))
             priority = self.__get('priority', item, None)
             url_info = {
@@ -43,5 +53,4 @@ class TendenciSitemap(Sitemap):
                 'changefreq': self.__get('changefreq', item, None),
                 'priority':   str(priority is not None and priority or ''),
             }
-            urls.append(url_info)
-        return urls
+            yield url_info
@@ -1,6 +1,7 @@
-from django.conf.urls.defaults import patterns
+from django.conf.urls.defaults import patterns, url
 from tendenci.core.sitemaps import views
 
 urlpatterns = patterns('',
-    (r'^$', views.create_sitemap)
+    url(r'^\.xml$', views.sitemap_index, name='sitemap_index'),
+    url(r'^-(?P<section>\w+)-(?P<page>\d+)\.xml$', views.sitemap_section, name='sitemap_section'),
 )
@@ -0,0 +1,185 @@
+"""
+Pre-generated sitemap files.
+
+Each TendenciSitemap is a section, written to the default storage as
+one file per page of at most Sitemap.limit urls, and listed in a
+sitemap index. generate_sitemaps() only rewrites the sections whose
+items changed since the last run, going by their count and newest
+update_dt, so it can be run often.
+"""
+import time
+from datetime import datetime
+from hashlib import md5
+from tempfile import TemporaryFile
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files import File
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db.models import Count, Max
+from django.db.models.query import QuerySet
+from django.utils import simplejson
+from django.utils.importlib import import_module
+
+from tendenci.core.sitemaps import TendenciSitemap
+from tendenci.core.site_settings.utils import get_setting
+
+SITEMAP_DIR = 'sitemaps'
+MANIFEST_PATH = '%s/manifest.json' % SITEMAP_DIR
+
+
+def get_all_sitemaps():
+    # the sitemaps are defined in the feeds modules, which a
+    # management command hasn't imported through the urls
+    for app in settings.INSTALLED_APPS:
+        try:
+            import_module('%s.feeds' % app)
+        except ImportError:
+            pass
+    return [sitemap_class for sitemap_class in TendenciSitemap.__subclasses__()
+            if get_setting('module', sitemap_class.__module__.split('.')[-2], 'enabled')]
+
+
+def get_manifest_cache_key():
+    return '.'.join([settings.SITE_CACHE_KEY, 'sitemap_cache', 'manifest'])
+
+
+def get_manifest():
+    """
+    Returns {'generated': timestamp, 'sections': {name: {...}}}
+    of the files last generated, or None before the first run.
+    """
+    manifest = cache.get(get_manifest_cache_key())
+    if manifest is None and default_storage.exists(MANIFEST_PATH):
+        manifest = simplejson.loads(default_storage.open(MANIFEST_PATH).read())
+        cache.set(get_manifest_cache_key(), manifest)
+    return manifest
+
+
+def save_manifest(manifest):
+    if default_storage.exists(MANIFEST_PATH):
+        default_storage.delete(MANIFEST_PATH)
+    default_storage.save(MANIFEST_PATH, ContentFile(simplejson.dumps(manifest)))
+    cache.set(get_manifest_cache_key(), manifest)
+
+
+def get_signature(sitemap):
+    """
+    Returns (number of items, newest update_dt) of the sitemap's
+    items, or None if they aren't a queryset of models with update_dt.
+    """
+    items = sitemap.items()
+    if not isinstance(items, QuerySet):
+        return None
+    if 'update_dt' not in [f.name for f in items.model._meta.fields]:
+        return None
+    totals = items.order_by().aggregate(count=Count('pk'), lastmod=Max('update_dt'))
+    return totals['count'], totals['lastmod']
+
+
+def format_lastmod(lastmod):
+    if not lastmod:
+        return None
+    if isinstance(lastmod, datetime):
+        return lastmod.strftime('%Y-%m-%dT%H:%M:%S')
+    return lastmod.strftime('%Y-%m-%d')
+
+
+def write_page(sitemap, page, site, protocol, path):
+    """
+    Writes a page of the sitemap to path in the default storage.
+    """
+    with TemporaryFile() as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        f.write('<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n')
+        for url in sitemap.iter_urls(page=page, site=site, protocol=protocol):
+            f.write('<url><loc>%s</loc>' % escape(url['location']).encode('utf-8'))
+            if url['lastmod']:
+                # dates like django's sitemap.xml template
+                f.write('<lastmod>%s</lastmod>' % url['lastmod'].strftime('%Y-%m-%d'))
+            if url['changefreq']:
+                f.write('<changefreq>%s</changefreq>' % url['changefreq'])
+            if url['priority']:
+                f.write('<priority>%s</priority>' % url['priority'])
+            f.write('</url>\n')
+        f.write('</urlset>\n')
+        content = File(f)
+        content.size = f.tell()
+        f.seek(0)
+        if default_storage.exists(path):
+            default_storage.delete(path)
+        default_storage.save(path, content)
+
+
+def generate_section(sitemap_class, site, protocol, previous=None, force=False):
+    """
+    Writes the pages of a section unless its signature is the same
+    as in previous, its manifest entry from the last run, and returns
+    (entry, regenerated).
+    """
+    sitemap = sitemap_class()
+    signature = get_signature(sitemap)
+    if signature is not None:
+        signature = [signature[0], format_lastmod(signature[1])]
+    if previous and not force and signature is not None \
+            and previous.get('signature') == signature:
+        return previous, False
+
+    name = sitemap_class.__name__
+    # new files get new names so the old ones are served until
+    # the manifest points to these
+    version = md5('%s.%s' % (name, time.time())).hexdigest()[:8]
+    pages = []
+    for page in sitemap.paginator.page_range:
+        path = '%s/%s-%d-%s.xml' % (SITEMAP_DIR, name, page, version)
+        write_page(sitemap, page, site, protocol, path)
+        pages.append(path)
+
+    entry = {
+        'pages': pages,
+        'signature': signature,
+        'lastmod': format_lastmod(datetime.now()),
+    }
+    return entry, True
+
+
+def generate_sitemaps(force=False, verbosity=1):
+    """
+    Regenerates the sections that changed and saves the manifest.
+    Returns the names of the sections regenerated.
+    """
+    from django.contrib.sites.models import Site
+
+    site = Site.objects.get_current()
+    protocol = 'http'
+    if get_setting('site', 'global', 'siteurl').startswith('https'):
+        protocol = 'https'
+
+    manifest = get_manifest() or {}
+    previous_sections = manifest.get('sections', {})
+    sections = {}
+    regenerated = []
+    for sitemap_class in get_all_sitemaps():
+        name = sitemap_class.__name__
+        entry, changed = generate_section(sitemap_class, site, protocol,
+                                          previous_sections.get(name), force)
+        sections[name] = entry
+        if changed:
+            regenerated.append(name)
+            if verbosity > 1:
+                print "Generated %s: %d pages" % (name, len(entry['pages']))
+
+    save_manifest({'generated': time.time(), 'sections': sections})
+
+    # remove the files no longer in the manifest
+    current = set()
+    for entry in sections.values():
+        current.update(entry['pages'])
+    for entry in previous_sections.values():
+        for path in entry['pages']:
+            if path not in current and default_storage.exists(path):
+                default_storage.delete(path)
+
+    return regenerated
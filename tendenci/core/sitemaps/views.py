@@ -3,82 +3,95 @@ Created on 28-02-2011
 
 @author: hpolloni
 '''
-import subprocess
-
-from django.contrib.sites.models import get_current_site
-from django.core.paginator import EmptyPage, PageNotAnInteger
-from django.http import Http404
-from django.template.response import TemplateResponse
+import time
 
 from django.conf import settings
-from django.core.cache import cache
-from tendenci.core.sitemaps import TendenciSitemap
+from django.core.files.storage import default_storage
+from django.core.urlresolvers import reverse
+from django.http import Http404, HttpResponse, HttpResponseNotModified
+from django.utils.http import http_date
+from django.views.static import was_modified_since
+from xml.sax.saxutils import escape
+
 from tendenci.core.site_settings.utils import get_setting
+from tendenci.core.background_jobs.utils import enqueue
+from tendenci.core.sitemaps.utils import get_manifest
+
+
+def _lastmod_timestamp(lastmod):
+    return time.mktime(time.strptime(lastmod, '%Y-%m-%dT%H:%M:%S'))
+
+
+def _refresh_if_stale(manifest):
+    """
+    Queue the regeneration of the changed sections when the files
+    are older than SITEMAP_REFRESH_INTERVAL.
+    """
+    interval = getattr(settings, 'SITEMAP_REFRESH_INTERVAL', 60 * 60)
+    if manifest is None or time.time() - manifest['generated'] > interval:
+        enqueue('sitemap_cache')
+
+
+def sitemap_index(request):
+    manifest = get_manifest()
+    _refresh_if_stale(manifest)
+    if manifest is None:
+        # the files are being generated, crawlers retry later
+        response = HttpResponse('Sitemap is being generated.', status=503,
+                                mimetype='text/plain')
+        response['Retry-After'] = '120'
+        return response
+
+    last_modified = max([_lastmod_timestamp(entry['lastmod'])
+                         for entry in manifest['sections'].values()] or [manifest['generated']])
+    if not was_modified_since(request.META.get('HTTP_IF_MODIFIED_SINCE'),
+                              last_modified):
+        return HttpResponseNotModified(mimetype='application/xml')
+
+    site_url = get_setting('site', 'global', 'siteurl')
+
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>\n',
+             '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n']
+    for name in sorted(manifest['sections']):
+        entry = manifest['sections'][name]
+        for page in range(1, len(entry['pages']) + 1):
+            location = '%s%s' % (site_url, reverse('sitemap_section', args=[name, page]))
+            lines.append(('<sitemap><loc>%s</loc><lastmod>%s</lastmod></sitemap>\n' % (
+                escape(location), entry['lastmod'][:10])).encode('utf-8'))
+    lines.append('</sitemapindex>\n')
 
+    # a string, not an iterator: GZipMiddleware would consume it
+    response = HttpResponse(''.join(lines), mimetype='application/xml')
+    response['Last-Modified'] = http_date(last_modified)
+    return response
 
-_sitemap_cache = []
 
+def sitemap_section(request, section, page):
+    manifest = get_manifest()
+    _refresh_if_stale(manifest)
+    entry = manifest and manifest['sections'].get(section)
+    if not entry:
+        raise Http404("No sitemap available for section: %r" % section)
 
-def get_all_sitemaps():
-    # commenting out the following 2 lines because it has no effect to the result.
-#    for app in settings.INSTALLED_APPS:
-#        _try_import(app + '.feeds')
-    sitemap_classes = TendenciSitemap.__subclasses__()
-    for sitemap_class in sitemap_classes:
-        if not get_setting('module', sitemap_class.__module__.split('.')[-2], 'enabled'):
-            sitemap_classes.remove(sitemap_class)
-    return sitemap_classes
+    page = int(page)
+    if not 1 <= page <= len(entry['pages']):
+        raise Http404("Page %s empty" % page)
+    path = entry['pages'][page - 1]
+    if not default_storage.exists(path):
+        raise Http404
 
+    last_modified = _lastmod_timestamp(entry['lastmod'])
+    if not was_modified_since(request.META.get('HTTP_IF_MODIFIED_SINCE'),
+                              last_modified):
+        return HttpResponseNotModified(mimetype='application/xml')
 
-def _try_import(module):
+    # a page is at most Sitemap.limit urls, read it whole
+    # rather than hand GZipMiddleware an iterator it would consume
+    f = default_storage.open(path)
     try:
-        __import__(module)
-    except ImportError, e:
-        pass
-
-
-def create_sitemap(request):
-    sitemap_classes = get_all_sitemaps()
-    sitemaps = dict([(cls.__name__, cls) for cls in sitemap_classes])
-    return sitemap(request, sitemaps)
-
-
-def sitemap(request, sitemaps, section=None,
-            template_name='sitemap.xml', mimetype='application/xml'):
-    req_protocol = 'https' if request.is_secure() else 'http'
-    req_site = get_current_site(request)
-
-    if section is not None:
-        if section not in sitemaps:
-            raise Http404("No sitemap available for section: %r" % section)
-        maps = [sitemaps[section]]
-    else:
-        maps = sitemaps.values()
-    page = request.GET.get("p", 1)
-
-    urls = []
-    cached = False
-    for site in maps:
-        try:
-            if callable(site):
-                site = site()
-                site_key = site.__class__.__name__
-            else:
-                site_key = site.__name__
-            # Cache the sitemap urls
-            sitemap_cache_key = '.'.join([settings.SITE_CACHE_KEY, 'sitemap_cache', site_key])
-            site_urls = cache.get(sitemap_cache_key)
-            if not isinstance(site_urls, list):
-                if not cached:
-                    subprocess.Popen(['python', 'manage.py', 'sitemap_cache'])
-                    cached = True
-                site_urls = site.get_urls(page=page, site=req_site,
-                                          protocol=req_protocol)
-                cache.set(sitemap_cache_key, list(site_urls), 86400)
-            urls.extend(site_urls)
-        except EmptyPage:
-            raise Http404("Page %s empty" % page)
-        except PageNotAnInteger:
-            raise Http404("No page '%s'" % page)
-    return TemplateResponse(request, template_name, {'urlset': urls},
-                            content_type=mimetype)
+        content = f.read()
+    finally:
+        f.close()
+    response = HttpResponse(content, mimetype='application/xml')
+    response['Last-Modified'] = http_date(last_modified)
+    return response
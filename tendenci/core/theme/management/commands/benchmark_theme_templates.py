@@ -0,0 +1,60 @@
+from optparse import make_option
+from timeit import default_timer
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    """
+    Render the theme homepage repeatedly with and without the
+    compiled theme template cache and report the average time.
+
+    Usage: manage.py benchmark_theme_templates --requests 200 --path /
+    """
+    help = 'Benchmark theme homepage rendering with and without the template cache'
+
+    option_list = BaseCommand.option_list + (
+        make_option('--requests',
+            action='store',
+            dest='requests',
+            type='int',
+            default=200,
+            help='Number of renders per mode'),
+        make_option('--path',
+            action='store',
+            dest='path',
+            default='/',
+            help='Page to render'),
+        )
+
+    def handle(self, *args, **options):
+        from django.conf import settings
+        from django.test.client import Client
+        from tendenci.core.theme.template_cache import invalidate_theme_templates
+
+        num_requests = options['requests']
+        path = options['path']
+        client = Client()
+
+        def run(cached):
+            settings.THEME_TEMPLATE_CACHE = cached
+            invalidate_theme_templates()
+            # warm up the other caches so only template loading differs
+            client.get(path)
+            start = default_timer()
+            for i in range(num_requests):
+                client.get(path)
+            return (default_timer() - start) * 1000.0 / num_requests
+
+        original = getattr(settings, 'THEME_TEMPLATE_CACHE', True)
+        try:
+            uncached = run(False)
+            cached = run(True)
+        finally:
+            settings.THEME_TEMPLATE_CACHE = original
+
+        print "renders per mode: %d, path: %s" % (num_requests, path)
+        print "without template cache: %.3f ms/render" % uncached
+        print "with template cache:    %.3f ms/render" % cached
+        if cached:
+            print "speedup: %.1fx" % (uncached / cached)
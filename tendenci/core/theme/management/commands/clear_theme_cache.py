@@ -2,6 +2,8 @@ from django.core.management.base import BaseCommand
 from django.conf import settings
 from django.core.cache import cache
 
+from tendenci.core.theme.template_cache import invalidate_theme_templates
+
 
 class Command(BaseCommand):
     """
@@ -12,6 +14,8 @@ class Command(BaseCommand):
 
     A usecase for this would be whenever a new theme is uploaded to the remote storage.
 
+    The compiled theme templates held by each process are dropped as well.
+
     Usage: manage.py clear_theme_cache
     """
 
@@ -23,3 +27,5 @@ class Command(BaseCommand):
             for key in cache_group_list:
                 cache.delete(key)
             cache.set(cache_group_key, [])
+
+        invalidate_theme_templates()
@@ -0,0 +1,98 @@
+"""
+Process-local cache of compiled theme templates.
+
+Compiled Template objects are kept in memory per (theme, template name,
+mobile flag), including templates that were not found, so theme
+includes are not re-read and re-parsed on every render. The cache is
+dropped when the theme version key in the shared cache changes, which
+happens whenever a theme file is edited, uploaded, copied or deleted
+and when the active theme setting changes.
+"""
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.template import TemplateDoesNotExist
+from django.template.loader import get_template
+
+from tendenci.core.theme.middleware import get_current_request
+from tendenci.core.theme.template_loaders import get_default_template
+from tendenci.core.theme.utils import get_theme
+
+NOT_FOUND = object()
+
+_templates = {}
+_lock = threading.Lock()
+_state = {'version': None}
+
+
+def get_version_key():
+    return "%s.theme_templates_version" % settings.SITE_CACHE_KEY
+
+
+def invalidate_theme_templates():
+    """
+    Drop the compiled templates in this process
+    and tell every other process to do the same.
+    """
+    cache.set(get_version_key(), time.time())
+    with _lock:
+        _templates.clear()
+
+
+def _check_version():
+    """
+    Compare the shared version key with ours at most once per request.
+    """
+    request = get_current_request()
+    if request is not None and getattr(request, '_theme_templates_checked', False):
+        return
+
+    version = cache.get(get_version_key())
+    if version != _state['version']:
+        with _lock:
+            _templates.clear()
+            _state['version'] = version
+
+    if request is not None:
+        request._theme_templates_checked = True
+
+
+def _load(template_name):
+    try:
+        return get_template(template_name)
+    except TemplateDoesNotExist:
+        # to be sure that we are not loading the active theme's template
+        return get_default_template(template_name)
+
+
+def get_theme_template_cached(template_name):
+    """
+    Returns a compiled Template for template_name in the active theme,
+    falling back to the default template. Raises TemplateDoesNotExist
+    when neither exists.
+    """
+    if not getattr(settings, 'THEME_TEMPLATE_CACHE', True):
+        return _load(template_name)
+
+    _check_version()
+
+    request = get_current_request()
+    mobile = bool(getattr(request, 'mobile', False))
+    # the theme loader always reads from the active theme
+    # (or the one previewed in the session), so key on that
+    key = (get_theme(), template_name, mobile)
+
+    template = _templates.get(key)
+    if template is None:
+        try:
+            template = _load(template_name)
+        except TemplateDoesNotExist:
+            template = NOT_FOUND
+        with _lock:
+            _templates[key] = template
+
+    if template is NOT_FOUND:
+        raise TemplateDoesNotExist(template_name)
+    return template
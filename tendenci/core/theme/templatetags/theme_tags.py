@@ -10,10 +10,9 @@ from tendenci.apps.boxes.models import Box
 from tendenci.core.perms.utils import get_query_filters
 from tendenci.core.site_settings.models import Setting
 from tendenci.core.site_settings.forms import build_settings_form
-from tendenci.core.site_settings.utils import get_setting
 
 from tendenci.core.theme.template_loaders import get_default_template
-from tendenci.core.theme.utils import get_theme_template
+from tendenci.core.theme.template_cache import get_theme_template_cached
 
 register = Library()
 
@@ -38,14 +37,7 @@ class ThemeExtendsNode(ExtendsNode):
             raise TemplateSyntaxError(error_msg)
         if hasattr(parent, 'render'):
             return parent  # parent is a Template object
-        theme = context.get('THEME', get_setting('module', 'theme_editor', 'theme'))
-        theme_template = get_theme_template(parent, theme=theme)
-        try:
-            template = get_template(theme_template)
-        except TemplateDoesNotExist:
-            #to be sure that we not are loading the active theme's template
-            template = get_default_template(parent)
-        return template
+        return get_theme_template_cached(parent)
 
 
 class ThemeConstantIncludeNode(ConstantIncludeNode):
@@ -53,14 +45,8 @@ class ThemeConstantIncludeNode(ConstantIncludeNode):
         self.template_path = template_path
 
     def render(self, context):
-        theme = context.get('THEME', get_setting('module', 'theme_editor', 'theme'))
-        theme_template = get_theme_template(self.template_path, theme=theme)
         try:
-            try:
-                t = get_template(theme_template)
-            except TemplateDoesNotExist:
-                t = get_default_template(self.template_path)
-            self.template = t
+            self.template = get_theme_template_cached(self.template_path)
         except:
             if settings.TEMPLATE_DEBUG:
                 raise
@@ -75,12 +61,7 @@ class ThemeIncludeNode(IncludeNode):
     def render(self, context):
         try:
             template_name = self.template_name.resolve(context)
-            theme = context.get('THEME', get_setting('module', 'theme_editor', 'theme'))
-            theme_template = get_theme_template(template_name, theme=theme)
-            try:
-                t = get_template(theme_template)
-            except TemplateDoesNotExist:
-                t = get_default_template(template_name)
+            t = get_theme_template_cached(template_name)
             return t.render(context)
         except:
             if settings.TEMPLATE_DEBUG:
@@ -106,18 +87,13 @@ class SpaceIncludeNode(IncludeNode):
                 filters = get_query_filters(user, 'boxes.view_box')
                 box = Box.objects.filter(filters).filter(pk=setting_value)
                 context['box'] = box[0]
-                template = get_template('theme_includes/box.html')
+                template = get_theme_template_cached('theme_includes/box.html')
                 return template.render(context)
             except:
                 # Otherwise try to render a template
                 try:
                     template_name = os.path.join('theme_includes', setting_value)
-                    theme = context.get('THEME', get_setting('module', 'theme_editor', 'theme'))
-                    theme_template = get_theme_template(template_name, theme=theme)
-                    try:
-                        t = get_template(theme_template)
-                    except TemplateDoesNotExist:
-                        t = get_default_template(template_name)
+                    t = get_theme_template_cached(template_name)
                     return t.render(context)
                 except:
                     if settings.TEMPLATE_DEBUG:
@@ -90,6 +90,7 @@ MIDDLEWARE_CLASSES = (
     'tendenci.apps.redirects.middleware.RedirectMiddleware',
     'tendenci.core.mobile.middleware.MobileMiddleware',
     'tendenci.core.theme.middleware.RequestMiddleware',
+    'tendenci.core.event_logs.middleware.EventLogMiddleware',
     'tendenci.core.base.middleware.MissingAppMiddleware',
     'tendenci.addons.memberships.middleware.ExceededMaxTypesMiddleware',
 )
@@ -250,6 +251,7 @@ INSTALLED_APPS = (
     'tendenci.apps.navs',
     'tendenci.addons.tendenci_guide',
     'tendenci.core.exports',
+    'tendenci.core.background_jobs',
     'tendenci.addons.events.ics',
     'tendenci.core.imports',
     'tendenci.core.handler404',
@@ -274,6 +276,11 @@ AUTHENTICATION_BACKENDS = (
     'django.contrib.auth.backends.ModelBackend',
 )
 
+# PERMS_VISIBILITY_INDEX - filter list views through the
+# perms_objectvisibility table instead of joining the perms table.
+# Run ./manage.py rebuild_visibility_index before turning it on.
+PERMS_VISIBILITY_INDEX = False
+
 # -------------------------------------- #
 # THEMES
 # -------------------------------------- #
@@ -338,6 +345,8 @@ TINYMCE_DEFAULT_CONFIG = {
 CACHE_DIR = TENDENCI_ROOT + "/cache"
 CACHE_BACKEND = "file://" + CACHE_DIR + "?timeout=604800"   # 7 days
 CACHE_PRE_KEY = "TENDENCI"
+# keep compiled theme templates in process memory
+THEME_TEMPLATE_CACHE = True
 JOHNNY_MIDDLEWARE_KEY_PREFIX = CACHE_PRE_KEY
 
 # --------------------------------------#
@@ -358,6 +367,95 @@ CELERY_IS_ACTIVE = False
 # if this setting is True
 USE_SUBPROCESS = True
 
+# --------------------------------------#
+# OUTBOUND EMAIL
+# --------------------------------------#
+# emails sent over one connection
+EMAIL_BATCH_SIZE = 100
+# emails per second, 0 for no limit
+EMAIL_RATE_LIMIT = 0
+# hand notification emails to the run_jobs
+# worker instead of sending them in the request
+EMAIL_SEND_IN_BACKGROUND = False
+
+# --------------------------------------#
+# INVOICES
+# --------------------------------------#
+# INVOICES_SPEND_SUMMARY - keep per-user invoice totals
+# current on invoice save and serve the top spenders
+# report from them; fill it with
+# ./manage.py rebuild_spend_summary
+INVOICES_SPEND_SUMMARY = False
+
+# --------------------------------------#
+# EVENTS
+# --------------------------------------#
+# seconds the events of a calendar page are cached,
+# saving an event or type drops them sooner
+EVENTS_CALENDAR_CACHE_TIMEOUT = 60 * 10
+# seconds the iCal block of an event is cached, the block
+# is keyed by the event's update_dt so edits show at once
+EVENTS_ICAL_CACHE_TIMEOUT = 60 * 60 * 24
+
+# --------------------------------------#
+# SITEMAPS
+# --------------------------------------#
+# the sitemap files are written by ./manage.py sitemap_cache,
+# queued by requests when they are older than this
+SITEMAP_REFRESH_INTERVAL = 60 * 60  # seconds
+
+# --------------------------------------#
+# API
+# --------------------------------------#
+# most records returned by a /sync/ request
+API_SYNC_MAX_LIMIT = 1000
+# most records posted to a /bulk/ request
+API_BULK_MAX_OBJECTS = 500
+# a valid api key is checked again after this long
+API_KEY_CACHE_TIMEOUT = 300  # seconds
+
+# --------------------------------------#
+# LIST TEMPLATE TAGS
+# --------------------------------------#
+# {% list_articles as articles cache=true %} caches
+# the list for this long, cache=<seconds> overrides it
+LIST_TAGS_CACHE_TIMEOUT = 60 * 10
+
+# --------------------------------------#
+# BACKGROUND JOBS
+# --------------------------------------#
+# long-running commands are queued with
+# background_jobs.utils.enqueue() and run by
+# ./manage.py run_jobs
+JOBS_WORKER_THREADS = 4
+# jobs of one type that may run at once
+JOBS_CONCURRENCY = {
+    'default': 2,
+    'membership_export_process': 1,
+    'import_membership_defaults': 1,
+    'import_corp_memberships': 1,
+    'run_export_task': 1,
+    'sitemap_cache': 1,
+}
+JOBS_POLL_INTERVAL = 2  # seconds
+# workers and running jobs without a heartbeat
+# for this long are considered dead
+JOBS_WORKER_TIMEOUT = 300  # seconds
+# start a worker that exits when the queue is empty
+# if no worker is running when a job is queued
+JOBS_AUTOSTART_WORKER = True
+
+# --------------------------------------#
+# EVENT LOGS
+# --------------------------------------#
+# EVENT_LOG_BUFFERED - skip stack inspection and write
+# event logs in batches with bulk_create
+EVENT_LOG_BUFFERED = False
+EVENT_LOG_BUFFER_SIZE = 50
+EVENT_LOG_FLUSH_INTERVAL = 5  # seconds
+# flush the buffer from a background thread as well
+EVENT_LOG_BACKGROUND_WRITER = False
+
 # --------------------------------------#
 # Hackstack Search
 # --------------------------------------#
@@ -389,6 +487,12 @@ FIRSTDATA_POST_URL = 'https://secure.linkpt.net/lpcentral/servlet/lppay'
 
 AUTHNET_CIM_API_TEST_URL = "https://apitest.authorize.net/xml/v1/request.api"
 AUTHNET_CIM_API_URL = "https://api.authorize.net/xml/v1/request.api"
+# recurring payments processed at once by
+# make_recurring_payment_transactions
+RECURRING_PAYMENTS_WORKERS = 4
+# seconds between two transactions on a payment profile,
+# the gateway rejects the second one as a duplicate otherwise
+RECURRING_PAYMENTS_DUPLICATE_WINDOW = 3*60
 
 # PAYPAL PAYFLOW LINK
 PAYFLOWLINK_PARTNER = ''